@@ -18,7 +18,8 @@ from PySide6.QtWidgets import (QMessageBox, QFileDialog, QInputDialog,
 from app.services import DataService, ExportService, PivotService, CleaningService, JoinService
 from app.services.visualization_service import VisualizerWorkerThread
 from app.services.recent_files_service import RecentFilesService
-from app.services.data_service import DataLoaderThread, FolderLoaderThread
+from app.services.data_service import DataLoaderThread, FolderLoaderThread, CsvIndexThread, DiskSourceThread
+from app.models.pandas_model import DiskBackedModel, LazyCsvModel, RowGroupModel, SqliteQueryModel
 from app.services.profiler_service import ProfilerWorkerThread
 from app.view_manager import ViewCoordinator, ViewRegistry
 from app.toolbar import ToolbarManager
@@ -26,6 +27,12 @@ from app.widgets import JoinDialog, FolderLoadDialog, CSVSeparatorDialog, ExcelS
 from core.join.models import JoinResult
 from core.models.folder_load_config import FolderLoadConfig
 from core.join.join_history import JoinHistory
+from core.dataset_cache import dataset_cache
+from core.loaders.compression import get_data_extension, get_extension
+from core.loaders.csv_row_index import CsvRowIndex
+from core.loaders.row_group_source import RowGroupSource
+from core.loaders.sqlite_query_source import SqliteQuerySource
+from config import optimization_config
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QMainWindow
@@ -46,6 +53,7 @@ class AppCoordinator(QObject):
     datos_originales_cargados = Signal(object)
     datos_actualizados = Signal(object)
     datos_disponibles = Signal(bool)
+    muestra_activa = Signal(bool)
     
     def __init__(self, parent_window: 'QMainWindow', data_service: DataService, export_service: ExportService, 
                  pivot_service: PivotService, cleaning_service: CleaningService,
@@ -66,6 +74,8 @@ class AppCoordinator(QObject):
         self.join_service = join_service
         self._loader_thread: DataLoaderThread | None = None
         self._folder_thread: FolderLoaderThread | None = None
+        self._index_thread: CsvIndexThread | DiskSourceThread | None = None
+        self._lazy_model: DiskBackedModel | None = None
         self._profiler_thread: ProfilerWorkerThread | None = None
         self._visualizer_thread: VisualizerWorkerThread | None = None
         self._active_loaders: list[DataLoaderThread] = []
@@ -75,6 +85,9 @@ class AppCoordinator(QObject):
         self._error_count: int = 0
         self._total_files: int = 0
         self._pending_col_vis = False
+        self._progreso_carga: tuple[int, int] = (0, 0)
+        self._vista_previa_mostrada = False
+        self._opciones_carga: dict[str, Any] = {}
     
     # ==================== CARGA DE ARCHIVO ====================
 
@@ -89,7 +102,7 @@ class AppCoordinator(QObject):
         )
         if len(filepaths) == 1:
             filepath = filepaths[0]
-            suffix = Path(filepath).suffix.lower()
+            suffix = get_data_extension(filepath)
             if suffix in ('.csv', '.tsv'):
                 csv_dialog = CSVSeparatorDialog(self.parent_window)
                 if csv_dialog.exec() != QDialog.Accepted:
@@ -105,6 +118,38 @@ class AppCoordinator(QObject):
         elif len(filepaths) > 1:
             self.iniciar_carga_multiple(filepaths)
 
+    def solicitar_muestra_aleatoria(self) -> None:
+        """Muestra QFileDialog y lee solo una muestra aleatoria de filas de un CSV/TSV o JSON Lines."""
+        extensiones = [ext for ext in self.data_service.extensiones_permitidas()
+                       if get_data_extension(f"archivo{ext}") in ('.csv', '.tsv', '.json', '.jsonl', '.ndjson')]
+        filtro = f"Archivos de texto por líneas ({' '.join(f'*{ext}' for ext in extensiones)})"
+        filepath, _ = QFileDialog.getOpenFileName(
+            self.parent_window, "Abrir muestra aleatoria", "", filtro
+        )
+        if not filepath:
+            return
+
+        separator = None
+        if get_data_extension(filepath) in ('.csv', '.tsv'):
+            csv_dialog = CSVSeparatorDialog(self.parent_window)
+            if csv_dialog.exec() != QDialog.Accepted:
+                return
+            separator = csv_dialog.get_separator()
+
+        filas, ok = QInputDialog.getInt(
+            self.parent_window, "Muestra aleatoria", "Filas de la muestra:",
+            optimization_config.SAMPLE_ROWS, 100, 10_000_000, 1000
+        )
+        if ok:
+            self.iniciar_carga_archivo(filepath, separator=separator, sample_rows=filas)
+
+    def cargar_archivo_completo(self) -> None:
+        """Reemplazar la muestra aleatoria mostrada por la carga completa del archivo."""
+        if not self._opciones_carga.get('sample_rows'):
+            return
+        opciones = dict(self._opciones_carga, sample_rows=None)
+        self.iniciar_carga_archivo(**opciones)
+
     def solicitar_carga_carpeta(self) -> None:
         """Muestra FolderLoadDialog y procesa la carga si se confirma."""
         dialog = FolderLoadDialog(self.parent_window)
@@ -113,15 +158,45 @@ class AppCoordinator(QObject):
             if config and config.folder_path:
                 self.procesar_carga_carpeta(config)
 
-    def iniciar_carga_archivo(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, enable_column_visibility: bool = True, separator: str | None = None, sheet_name: str | None = None) -> None:
-        """Inicia la carga de un archivo: valida extensión, muestra progreso, crea hilo y conecta resultados."""
+    def iniciar_carga_archivo(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, enable_column_visibility: bool = True, separator: str | None = None, sheet_name: str | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, key: str | None = None, sample_rows: int | None = None) -> None:
+        """Inicia la carga de un archivo: valida extensión, muestra progreso, crea hilo y conecta resultados.
+
+        Con sample_rows solo se lee una muestra aleatoria de ese número de filas
+        (CSV/TSV y JSON Lines), que luego puede ampliarse con cargar_archivo_completo.
+        """
         path = Path(filepath)
         extensiones = self.data_service.extensiones_permitidas()
-        if path.suffix.lower() not in extensiones:
-            self.status_message.emit(f"Formato no soportado: {path.suffix}")
+        if get_extension(filepath) not in extensiones:
+            self.status_message.emit(f"Formato no soportado: {get_extension(filepath)}")
             return
 
         self._cancel_thread(self._loader_thread)
+        self._cancel_thread(self._index_thread)
+        self._lazy_model = None
+        self._opciones_carga = {
+            'filepath': filepath, 'skip_rows': skip_rows, 'column_names': column_names,
+            'enable_column_visibility': enable_column_visibility, 'separator': separator,
+            'sheet_name': sheet_name, 'columns': columns, 'filters': filters, 'key': key,
+            'sample_rows': sample_rows,
+        }
+
+        # La muestra aleatoria siempre se lee en memoria, sin navegar desde disco.
+        # El índice de filas y la consulta SQLite no aplican columnas ni filtros:
+        # con una selección, el archivo se carga con el lector normal.
+        if (not sample_rows and path.suffix.lower() in ('.csv', '.tsv') and not columns and not filters
+                and optimization_config.should_browse_from_disk(path.stat().st_size)):
+            self._iniciar_lectura_desde_disco(filepath, skip_rows, column_names, separator)
+            return
+
+        if (not sample_rows and path.suffix.lower() in ('.parquet', '.feather') and not skip_rows and not column_names
+                and not filters and self.data_service.should_browse_row_groups(filepath)):
+            self._iniciar_lectura_por_fuente(filepath, columns)
+            return
+
+        if (not sample_rows and path.suffix.lower() in ('.db', '.sqlite', '.sqlite3') and not skip_rows and not column_names
+                and not columns and not filters and optimization_config.should_query_sqlite(path.stat().st_size)):
+            self._iniciar_lectura_por_fuente(filepath)
+            return
 
         progress = self.data_service.create_progress_dialog(
             "Cargando datos", "Cargando archivo..."
@@ -131,7 +206,8 @@ class AppCoordinator(QObject):
 
         try:
             thread = self.data_service.create_loader_thread(
-                filepath, skip_rows, column_names or {}, separator, sheet_name
+                filepath, skip_rows, column_names or {}, separator, sheet_name, columns, filters, key,
+                sample_rows
             )
         except Exception as e:
             progress.close()
@@ -141,12 +217,73 @@ class AppCoordinator(QObject):
         self._loader_thread = thread
         self._pending_col_vis = enable_column_visibility
 
+        self._progreso_carga = (0, 0)
+        self._vista_previa_mostrada = False
+        thread.preview_ready.connect(self._on_vista_previa)
+        thread.progress_updated.connect(self._on_progreso_carga)
+        thread.chunk_loaded.connect(self._on_chunk_cargado)
         thread.data_loaded.connect(self._on_datos_cargados)
         thread.error_occurred.connect(self._on_error_carga)
         thread.finished.connect(progress.close)
         thread.finished.connect(self._on_loader_finished)
         thread.start()
 
+    def _iniciar_lectura_desde_disco(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None) -> None:
+        """Navegar un CSV muy grande desde disco indexando sus filas en segundo plano."""
+        thread = self.data_service.create_index_thread(
+            filepath, skip_rows, column_names or {}, separator, optimization_config.DEFAULT_CHUNK_SIZE
+        )
+        self._index_thread = thread
+
+        thread.index_created.connect(self._on_indice_creado)
+        thread.progress_updated.connect(self._on_indice_progreso)
+        thread.error_occurred.connect(self._on_error_carga)
+        thread.finished.connect(self._on_indice_finalizado)
+        thread.start()
+
+    def _iniciar_lectura_por_fuente(self, filepath: str, columns: list[str] | None = None) -> None:
+        """Navegar un Parquet/Feather/SQLite muy grande desde disco leyendo solo las filas visibles."""
+        thread = self.data_service.create_disk_source_thread(filepath, columns)
+        self._index_thread = thread
+
+        thread.index_created.connect(self._on_indice_creado)
+        thread.error_occurred.connect(self._on_error_carga)
+        thread.finished.connect(self._on_indice_finalizado)
+        thread.start()
+
+    def _on_indice_creado(self, source: CsvRowIndex | RowGroupSource | SqliteQuerySource) -> None:
+        """Mostrar el archivo en cuanto se conocen sus columnas; las filas se leen desde disco al verse."""
+        self.data_service.clear_data()
+        self.view_coordinator.clear_profile_data()
+        if isinstance(source, RowGroupSource):
+            self._lazy_model = RowGroupModel(source)
+        elif isinstance(source, SqliteQuerySource):
+            self._lazy_model = SqliteQueryModel(source)
+        else:
+            self._lazy_model = LazyCsvModel(source)
+        self.view_coordinator.show_lazy_data_view(self._lazy_model)
+        self.view_coordinator.update_main_view(source.filepath)
+        self.datos_disponibles.emit(False)
+        self.view_coordinator.switch_to(ViewRegistry.VIEW_DATA)
+
+    def _on_indice_progreso(self, done_kb: int, total_kb: int) -> None:
+        """Incorporar las filas indexadas y reportar el avance."""
+        self.view_coordinator.update_lazy_data_view()
+        percent = int(done_kb / total_kb * 100) if total_kb > 0 else 100
+        self.status_message.emit(f"Indexando {self.data_service.get_filename()}: {percent}%")
+
+    def _on_indice_finalizado(self) -> None:
+        self._index_thread = None
+        if self._lazy_model is None or not self._lazy_model.source.is_complete:
+            return
+        self.view_coordinator.update_lazy_data_view()
+        source = self._lazy_model.source
+        self.recent_files_service.add(source.filepath)
+        self.refresh_recent_files()
+        self.status_message.emit(
+            f"Navegando desde disco: {Path(source.filepath).name} ({source.row_count} filas)"
+        )
+
     # ==================== CARGA MÚLTIPLE ====================
 
     def iniciar_carga_multiple(self, filepaths: list[str]) -> None:
@@ -243,6 +380,33 @@ class AppCoordinator(QObject):
         self._start_profiling()
 
     # ==================== CALLBACKS DE DATOS ====================
+
+    def _on_progreso_carga(self, done: int, total: int) -> None:
+        """Reflejar el avance real de la lectura en el diálogo de progreso"""
+        self._progreso_carga = (done, total)
+        dialog = self.data_service.progress_dialog
+        if dialog is not None and total > 0:
+            dialog.setValue(min(int(done * 100 / total), 100))
+
+    def _on_vista_previa(self, preview: pd.DataFrame) -> None:
+        """Mostrar columnas y primeras filas mientras el archivo completo se lee en segundo plano"""
+        self._vista_previa_mostrada = True
+        self.data_service.close_progress_dialog()
+        self.view_coordinator.update_data_view(preview)
+        self.view_coordinator.switch_to(ViewRegistry.VIEW_DATA)
+        self.status_message.emit(
+            f"Vista previa de {self.data_service.get_filename()}: primeras {len(preview)} filas; cargando el resto..."
+        )
+
+    def _on_chunk_cargado(self, chunk: pd.DataFrame, rows_loaded: int) -> None:
+        """Mostrar el primer chunk de inmediato mientras el resto del archivo se sigue leyendo"""
+        if rows_loaded == len(chunk) and not self._vista_previa_mostrada:
+            self.data_service.close_progress_dialog()
+            self.view_coordinator.update_data_view(chunk)
+            self.view_coordinator.switch_to(ViewRegistry.VIEW_DATA)
+        done, total = self._progreso_carga
+        total_text = f" de {total}" if done == rows_loaded and total >= rows_loaded else ""
+        self.status_message.emit(f"Cargando {self.data_service.get_filename()}: {rows_loaded}{total_text} filas leídas...")
     
     def _on_datos_cargados(self, df: pd.DataFrame) -> None:
         """Manejar datos cargados exitosamente"""
@@ -270,7 +434,15 @@ class AppCoordinator(QObject):
         
         # Cambiar a vista de datos
         self.view_coordinator.switch_to(ViewRegistry.VIEW_DATA)
-        self.status_message.emit(f"Datos cargados: {self.data_service.get_filename()}")
+        muestra = df.attrs.get('muestra')
+        self.muestra_activa.emit(bool(muestra))
+        if muestra:
+            self.status_message.emit(
+                f"Muestra aleatoria de {self.data_service.get_filename()}: "
+                f"{muestra['filas']:,} de ~{muestra['filas_estimadas']:,} filas"
+            )
+        else:
+            self.status_message.emit(f"Datos cargados: {self.data_service.get_filename()}")
         self._start_profiling()
     
     def _on_error_carga(self, error_message: str) -> None:
@@ -822,6 +994,15 @@ class AppCoordinator(QObject):
         self.datos_disponibles.emit(False)
         self.status_message.emit("Datos limpiados")
 
+    def limpiar_cache_datos(self) -> None:
+        """Borrar las copias parseadas guardadas en la caché persistente."""
+        try:
+            freed = dataset_cache.clear()
+        except OSError as e:
+            QMessageBox.warning(self.parent_window, "Advertencia", f"No se pudo limpiar la caché: {e}")
+            return
+        self.status_message.emit(f"Caché de datos limpiada ({freed / 1024 / 1024:.1f} MB liberados)")
+
     def mostrar_acerca_de(self) -> None:
         """Mostrar diálogo Acerca de"""
         from app.widgets.about_dialog import AboutDialog
@@ -830,7 +1011,7 @@ class AppCoordinator(QObject):
     # ==================== THREAD CLEANUP ====================
 
     @staticmethod
-    def _cancel_thread(thread: DataLoaderThread | FolderLoaderThread | ProfilerWorkerThread | VisualizerWorkerThread | None) -> None:
+    def _cancel_thread(thread: DataLoaderThread | FolderLoaderThread | CsvIndexThread | DiskSourceThread | ProfilerWorkerThread | VisualizerWorkerThread | None) -> None:
         """Detener un hilo de forma segura si está corriendo."""
         if thread is None or not thread.isRunning():
             return
@@ -853,6 +1034,7 @@ class AppCoordinator(QObject):
         # 0. Detener hilos de carga activos
         self._cancel_thread(self._loader_thread)
         self._cancel_thread(self._folder_thread)
+        self._cancel_thread(self._index_thread)
         self._cancel_thread(self._profiler_thread)
         self._cancel_thread(self._visualizer_thread)
         for thread in self._active_loaders[:]:
@@ -860,6 +1042,8 @@ class AppCoordinator(QObject):
         self._active_loaders.clear()
         self._loader_thread = None
         self._folder_thread = None
+        self._index_thread = None
+        self._lazy_model = None
         self._profiler_thread = None
         self._visualizer_thread = None
         self._pending_dfs.clear()
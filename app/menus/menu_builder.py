@@ -33,6 +33,8 @@ class MenuBuilder:
         # Acciones — se crean en _create_actions()
         self.abrir_action: QAction
         self.cargar_carpeta_action: QAction
+        self.abrir_muestra_action: QAction
+        self.cargar_completo_action: QAction
         self.exportar_pdf_action: QAction
         self.exportar_imagen_action: QAction
         self.exportar_xlsx_action: QAction
@@ -71,6 +73,13 @@ class MenuBuilder:
         self.cargar_carpeta_action.setShortcut("Ctrl+Shift+O")
         self.cargar_carpeta_action.setStatusTip("Cargar y consolidar carpeta de archivos Excel")
 
+        self.abrir_muestra_action = QAction("Abrir &Muestra Aleatoria...", p)
+        self.abrir_muestra_action.setStatusTip("Leer solo una muestra aleatoria de filas de un CSV/TSV o JSON Lines grande")
+
+        self.cargar_completo_action = QAction("Cargar Archivo &Completo", p)
+        self.cargar_completo_action.setStatusTip("Reemplazar la muestra aleatoria por el archivo completo")
+        self.cargar_completo_action.setEnabled(False)
+
         self.exportar_pdf_action = QAction("&PDF...", p)
         self.exportar_pdf_action.setShortcut("Ctrl+P")
         self.exportar_pdf_action.setStatusTip("Exportar datos a formato PDF")
@@ -91,6 +100,9 @@ class MenuBuilder:
         self.exportar_sql_action.setShortcut("Ctrl+S")
         self.exportar_sql_action.setStatusTip("Exportar datos a base de datos SQLite")
 
+        self.limpiar_cache_action = QAction("&Limpiar Caché de Datos", p)
+        self.limpiar_cache_action.setStatusTip("Borrar las copias en caché de los archivos ya parseados")
+
         self.salir_action = QAction("&Salir", p)
         self.salir_action.setShortcut("Ctrl+Q")
         self.salir_action.setStatusTip("Cerrar la aplicación")
@@ -177,6 +189,8 @@ class MenuBuilder:
         actions: list[QAction | None] = [
             self.abrir_action,
             self.cargar_carpeta_action,
+            self.abrir_muestra_action,
+            self.cargar_completo_action,
             None,
             self.exportar_pdf_action,
             self.exportar_imagen_action,
@@ -184,6 +198,8 @@ class MenuBuilder:
             self.exportar_csv_action,
             self.exportar_sql_action,
             None,
+            self.limpiar_cache_action,
+            None,
             self.salir_action,
         ]
         ArchivoMenu.create(self.menu_bar, actions, self.parent_window)
@@ -227,11 +243,15 @@ class MenuBuilder:
     def _connect_actions(self, coordinator: Any, view_coordinator: Any) -> None:
         self.abrir_action.triggered.connect(coordinator.solicitar_apertura_archivo)
         self.cargar_carpeta_action.triggered.connect(coordinator.solicitar_carga_carpeta)
+        self.abrir_muestra_action.triggered.connect(coordinator.solicitar_muestra_aleatoria)
+        self.cargar_completo_action.triggered.connect(coordinator.cargar_archivo_completo)
+        coordinator.muestra_activa.connect(self.cargar_completo_action.setEnabled)
         self.exportar_pdf_action.triggered.connect(coordinator.exportar_a_pdf)
         self.exportar_imagen_action.triggered.connect(coordinator.exportar_a_imagen)
         self.exportar_xlsx_action.triggered.connect(coordinator.exportar_a_xlsx)
         self.exportar_csv_action.triggered.connect(coordinator.exportar_a_csv)
         self.exportar_sql_action.triggered.connect(coordinator.exportar_a_sql)
+        self.limpiar_cache_action.triggered.connect(coordinator.limpiar_cache_datos)
         self.salir_action.triggered.connect(self.parent_window.close)
 
         self.exportar_separado_action.triggered.connect(coordinator.exportar_datos_separados)
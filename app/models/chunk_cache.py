@@ -0,0 +1,119 @@
+"""
+Cache LRU de chunks del modelo de tabla
+
+Limita los chunks guardados por número de entradas y por memoria, y expulsa
+siempre el usado hace más tiempo. Los contadores de aciertos, fallos y
+expulsiones permiten comprobar si el tamaño configurado es suficiente.
+generation cambia cada vez que se invalidan entradas, para descartar los
+chunks preparados en segundo plano a partir de datos que ya no son los actuales.
+"""
+
+from collections import OrderedDict
+from typing import Any, Iterator
+
+
+class ChunkCache:
+    """
+    Cache LRU acotado por entradas y por bytes
+
+    Las entradas deben exponer nbytes; se consulta en cada inserción porque un
+    chunk puede crecer después de guardarse (al formatear más columnas).
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[int, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.prefetched = 0
+        self.generation = 0
+
+    def get(self, key: int) -> Any | None:
+        """
+        Obtener una entrada marcándola como la más reciente
+
+        Returns:
+            La entrada, o None si no está en cache
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: int, entry: Any) -> None:
+        """
+        Guardar una entrada y expulsar las menos recientes hasta volver a los límites
+
+        La entrada recién guardada nunca se expulsa, aunque supere por sí sola max_bytes.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        total = self.total_bytes()
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or total > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.nbytes
+            self.evictions += 1
+
+    def put_prefetched(self, key: int, entry: Any, generation: int) -> bool:
+        """
+        Guardar una entrada preparada en segundo plano
+
+        Returns:
+            True si se guardó; False si el cache se invalidó mientras se
+            preparaba o la entrada ya estaba cargada
+        """
+        if generation != self.generation or key in self._entries:
+            return False
+        self.put(key, entry)
+        self.prefetched += 1
+        return True
+
+    def pop(self, key: int, default: Any = None) -> Any:
+        """Quitar una entrada sin contarla como expulsión"""
+        self.generation += 1
+        return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        """Vaciar el cache conservando los contadores"""
+        self.generation += 1
+        self._entries.clear()
+
+    def total_bytes(self) -> int:
+        """Memoria estimada de todas las entradas"""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Obtener los contadores del cache
+
+        Returns:
+            Diccionario con entradas, bytes, aciertos, fallos, expulsiones,
+            chunks precargados y tasa de aciertos
+        """
+        lookups = self.hits + self.misses
+        return {
+            'entradas': len(self._entries),
+            'bytes': self.total_bytes(),
+            'aciertos': self.hits,
+            'fallos': self.misses,
+            'expulsiones': self.evictions,
+            'precargados': self.prefetched,
+            'tasa_aciertos': self.hits / lookups if lookups else 0.0,
+        }
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: int) -> Any:
+        return self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(list(self._entries))
@@ -0,0 +1,75 @@
+"""
+Precarga de chunks guiada por el scroll
+
+Observa la barra de desplazamiento vertical de una QTableView, estima la
+velocidad y la dirección del scroll y pide al modelo que prepare en segundo
+plano los chunks que la vista va a necesitar, para que cruzar el borde de un
+chunk no obligue a leerlo y formatearlo dentro de data().
+"""
+
+import time
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QTableView
+
+from config import optimization_config
+
+
+class ChunkPrefetcher(QObject):
+    """
+    Pide al modelo de la vista los chunks siguientes en la dirección del scroll
+
+    Con scroll lento se prepara un chunk por delante; si al ritmo actual la
+    vista recorre un chunk en menos de PREFETCH_HORIZON_SECONDS, se preparan
+    PREFETCH_CHUNKS. El modelo se consulta en cada movimiento, así que sigue
+    funcionando cuando la vista cambia de modelo.
+    """
+
+    def __init__(self, view: QTableView) -> None:
+        super().__init__(view)
+        self._view = view
+        self._last_row: int | None = None
+        self._last_time = 0.0
+        self._velocity = 0.0  # Filas por segundo, con signo, suavizada
+        view.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+
+    def reset(self) -> None:
+        """Olvidar la posición anterior (al cambiar de modelo o de página)"""
+        self._last_row = None
+        self._velocity = 0.0
+
+    def _on_scrolled(self, _value: int) -> None:
+        model = self._view.model()
+        max_chunks = optimization_config.PREFETCH_CHUNKS
+        if max_chunks <= 0 or not hasattr(model, 'prefetch'):
+            return
+
+        viewport = self._view.viewport()
+        first_row = self._view.rowAt(0)
+        if first_row < 0:
+            return
+        last_row = self._view.rowAt(viewport.height() - 1)
+        if last_row < 0:
+            last_row = model.rowCount() - 1
+
+        now = time.monotonic()
+        if self._last_row is None or first_row == self._last_row:
+            self._last_row, self._last_time = first_row, now
+            return
+        elapsed = max(now - self._last_time, 1e-3)
+        velocity = (first_row - self._last_row) / elapsed
+        # Media exponencial para que un salto aislado no cambie la dirección
+        self._velocity = velocity if self._velocity * velocity <= 0 else 0.5 * self._velocity + 0.5 * velocity
+        self._last_row, self._last_time = first_row, now
+
+        direction = 1 if self._velocity > 0 else -1
+        rows_ahead = abs(self._velocity) * optimization_config.PREFETCH_HORIZON_SECONDS
+        count = max_chunks if rows_ahead >= model.get_chunk_size() else 1
+
+        first_column = max(self._view.columnAt(0), 0)
+        last_column = self._view.columnAt(viewport.width() - 1)
+        if last_column < 0:
+            last_column = model.columnCount() - 1
+
+        edge_row = last_row if direction > 0 else first_row
+        model.prefetch(edge_row, direction, count, range(first_column, last_column + 1))
@@ -3,16 +3,29 @@ Modelo personalizado para conectar DataFrames de Pandas con QTableView
 Implementa paginación virtual para optimizar el rendimiento con datasets grandes
 """
 
+import numpy as np
 import pandas as pd
-from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex
+from PySide6.QtCore import QAbstractTableModel, Qt, QModelIndex, QThreadPool, Signal
 import math
 import sys
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, TYPE_CHECKING
 
 # Añadir directorio raíz para importar config
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from config import optimization_config
+from app.models.chunk_cache import ChunkCache
+from core.loaders.csv_row_index import CsvRowIndex
+from core.loaders.row_group_source import RowGroupSource
+from core.loaders.sqlite_query_source import SqliteQuerySource
+
+if TYPE_CHECKING:
+    from app.services.pagination_manager import PaginationManager
+
+# Resuelto una vez: buscar Qt.DisplayRole en cada llamada a data() cuesta microsegundos en PySide6
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
 
 def _format_value(value: Any) -> str:
     if pd.isna(value):
@@ -26,12 +39,127 @@ def _format_value(value: Any) -> str:
     return str(value)
 
 
+def _format_column(values: pd.Series) -> np.ndarray:
+    """
+    Formatear una columna completa como texto, con el mismo resultado que _format_value
+
+    Los tipos numéricos y de texto se formatean con operaciones de NumPy sobre
+    toda la columna; el resto (fechas, categorías, objetos mixtos) valor a valor.
+
+    Args:
+        values: Columna (normalmente la de un chunk)
+
+    Returns:
+        Array de objetos str, uno por fila
+    """
+    dtype = values.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind == 'b':
+            return np.where(values.to_numpy(), 'True', 'False').astype(object)
+        if dtype.kind in 'iu':
+            cells = np.empty(len(values), dtype=object)
+            cells[:] = list(map(str, values.to_numpy().tolist()))
+            return cells
+        if dtype.kind == 'f':
+            return _format_float_array(values.to_numpy())
+        if dtype.kind == 'O' and pd.api.types.infer_dtype(values, skipna=True) == 'string':
+            cells = values.to_numpy(copy=True)
+            cells[pd.isna(cells)] = ""
+            return cells
+    elif pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype):
+        return values.to_numpy(dtype=object, na_value="")
+    elif pd.api.types.is_float_dtype(dtype):
+        return _format_float_array(values.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    cells = np.empty(len(values), dtype=object)
+    cells[:] = [_format_value(value) for value in values.to_numpy(dtype=object)]
+    return cells
+
+
+def _format_float_array(values: np.ndarray) -> np.ndarray:
+    """Decimales: enteros sin parte decimal, coma como separador y vacío para NaN/inf"""
+    cells = np.full(len(values), "", dtype=object)
+    finite = np.isfinite(values)
+    integral = finite & (values == np.trunc(values))
+    if integral.any():
+        whole = values[integral]
+        if np.abs(whole).max() < 2 ** 63:
+            cells[integral] = whole.astype(np.int64).astype(str)
+        else:
+            cells[integral] = [str(int(value)) for value in whole]
+    fractional = finite & ~integral
+    if fractional.any():
+        decimals = values[fractional]
+        # repr de float de Python es más rápido que astype(str) de NumPy; float32 usa
+        # NumPy para conservar su representación corta
+        texts = map(repr, decimals.tolist()) if decimals.dtype == np.float64 else decimals.astype(str)
+        cells[fractional] = [text.replace(".", ",") for text in texts]
+    return cells
+
+
+# Memoria estimada de cada str de Python además de sus caracteres (sys.getsizeof(""))
+_STR_OVERHEAD = 49
+
+
+class FormattedChunk:
+    """
+    Chunk de filas listo para pintar
+
+    Guarda las filas [start_row, start_row + len) y el texto de cada columna,
+    que se formatea entera la primera vez que la vista pide una de sus celdas.
+    Pintar una celda queda en un acceso a array, sin pasar por iloc.
+
+    nbytes estima la memoria propia del chunk: el texto formateado más las
+    filas si se leyeron de otra fuente (shared=False); un slice del DataFrame
+    del modelo comparte sus datos y no cuenta.
+    """
+
+    __slots__ = ('start_row', 'frame', 'rows', 'nbytes', '_cells')
+
+    def __init__(self, start_row: int, frame: pd.DataFrame, shared: bool = True) -> None:
+        self.start_row = start_row
+        self.frame = frame
+        self.rows = len(frame)
+        self.nbytes = 0 if shared else int(frame.memory_usage(index=False, deep=True).sum())
+        self._cells: list[np.ndarray | None] = [None] * frame.shape[1]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def column(self, column: int) -> np.ndarray:
+        """Obtener el texto de una columna, formateándola si aún no se ha pedido"""
+        cells = self._cells[column]
+        if cells is None:
+            cells = _format_column(self.frame.iloc[:, column])
+            self._cells[column] = cells
+            self.nbytes += cells.nbytes + self.rows * _STR_OVERHEAD + sum(map(len, cells))
+        return cells
+
+    def cell(self, row: int, column: int) -> str | None:
+        """Texto de una celda por posición absoluta, o None si queda fuera del chunk"""
+        local_row = row - self.start_row
+        if 0 <= local_row < self.rows and column < len(self._cells):
+            cells = self._cells[column]
+            if cells is None:
+                cells = self.column(column)
+            return cells[local_row]
+        return None
+
+
 class VirtualizedPandasModel(QAbstractTableModel):
     """
     Modelo optimizado que adapta un DataFrame de Pandas para QTableView
     Implementa paginación virtual para manejar datasets grandes eficientemente
     """
 
+    # Chunk preparado en segundo plano: (índice, FormattedChunk o None si falló, generación del cache)
+    _chunk_prefetched = Signal(int, object, int)
+
+    # Los chunks son slices de full_df: su memoria ya está contada en el DataFrame
+    _shares_model_data = True
+    # Los chunks se pueden preparar desde un hilo del pool (la fuente admite lecturas concurrentes)
+    _prefetch_supported = True
+
     def __init__(self, df: pd.DataFrame | None = None, chunk_size: int | None = None) -> None:
         super().__init__()
         self.full_df: pd.DataFrame = df if df is not None else pd.DataFrame()
@@ -44,9 +172,13 @@ class VirtualizedPandasModel(QAbstractTableModel):
         self.total_rows: int = len(self.full_df)
         self.total_cols: int = len(self.full_df.columns) if self.total_rows > 0 else 0
 
-        # Cache para chunks de datos
-        self.data_cache: dict[int, pd.DataFrame] = {}
-        self.cache_size: int = optimization_config.MAX_CACHE_CHUNKS
+        # Cache LRU de chunks, acotado por número de chunks y por memoria
+        self.data_cache = ChunkCache(optimization_config.MAX_CACHE_CHUNKS, optimization_config.MAX_CACHE_BYTES)
+
+        # Precarga en segundo plano: chunks en preparación y lectura exclusiva de la fuente
+        self._prefetching: set[int] = set()
+        self._load_lock = threading.Lock()
+        self._chunk_prefetched.connect(self._on_chunk_prefetched)
 
         # Configuración de virtualización usando configuración global
         self.enable_virtualization: bool = optimization_config.should_use_virtualization(self.total_rows)
@@ -96,25 +228,16 @@ class VirtualizedPandasModel(QAbstractTableModel):
         Returns:
             Valor de la celda o None
         """
-        if not index.isValid():
+        if role != _DISPLAY_ROLE or not index.isValid():
             return None
 
-        if role == Qt.DisplayRole:
-            row = index.row()
-            column = index.column()
-
-            # Verificar que el índice está dentro del rango
-            if row < self.total_rows and column < self.total_cols:
-                # Para datos no virtualizados, acceso directo
-                if not self.enable_virtualization:
-                    value = self.full_df.iloc[row, column]
-                    return _format_value(value)
-                
-                # Para datos virtualizados, usar chunk system
-                chunk_data = self._get_chunk_data(row)
-                if chunk_data is not None and column < len(chunk_data.columns):
-                    value = chunk_data.iloc[row - chunk_data.index[0], column]
-                    return _format_value(value)
+        row = index.row()
+        column = index.column()
+
+        # Verificar que el índice está dentro del rango
+        if row < self.total_rows and column < self.total_cols:
+            # Con o sin virtualización, las celdas salen del texto preformateado del chunk
+            return self._get_chunk_data(row).cell(row, column)
 
         return None
 
@@ -184,7 +307,7 @@ class VirtualizedPandasModel(QAbstractTableModel):
         """
         return self.full_df.copy()
 
-    def _get_chunk_data(self, row: int) -> pd.DataFrame:
+    def _get_chunk_data(self, row: int) -> FormattedChunk:
         """
         Obtener datos del chunk que contiene la fila especificada
 
@@ -192,50 +315,113 @@ class VirtualizedPandasModel(QAbstractTableModel):
             row: Índice de la fila
 
         Returns:
-            DataFrame con el chunk de datos
+            Chunk con las filas y su texto formateado por columna
         """
-        if not self.enable_virtualization:
-            # Si no está activada la virtualización, usar datos completos
-            return self.full_df
-
         # Calcular qué chunk contiene esta fila
-        chunk_index = row // self.chunk_size
+        chunk_index, start_row, end_row = self._chunk_bounds(row)
 
         # Verificar si el chunk ya está en cache
-        if chunk_index in self.data_cache:
-            return self.data_cache[chunk_index]
+        chunk = self.data_cache.get(chunk_index)
+        if chunk is not None:
+            return chunk
 
-        # Cargar chunk desde el DataFrame completo
-        start_row = chunk_index * self.chunk_size
-        end_row = min(start_row + self.chunk_size, self.total_rows)
+        chunk = self._read_chunk(start_row, end_row)
 
-        chunk_df = self.full_df.iloc[start_row:end_row].copy()
+        # Almacenar en cache (expulsa los chunks usados hace más tiempo si se superan los límites)
+        self.data_cache.put(chunk_index, chunk)
 
-        # Gestionar cache (eliminar chunks antiguos si es necesario)
-        self._manage_cache(chunk_index)
+        return chunk
 
-        # Almacenar en cache
-        self.data_cache[chunk_index] = chunk_df
+    def _read_chunk(self, start_row: int, end_row: int) -> FormattedChunk:
+        """Leer un chunk de la fuente; el hilo de la vista y los de precarga no leen a la vez"""
+        with self._load_lock:
+            frame = self._load_chunk(start_row, end_row)
+        return FormattedChunk(start_row, frame, self._shares_model_data)
+
+    def prefetch(self, row: int, direction: int, count: int, columns: range | None = None) -> None:
+        """
+        Preparar en segundo plano los chunks que siguen a una fila en la dirección del scroll
 
-        return chunk_df
+        Cada chunk se lee y se formatea (las columnas indicadas) en un hilo del
+        QThreadPool global y pasa al cache desde el hilo de la vista.
 
-    def _manage_cache(self, current_chunk: int) -> None:
+        Args:
+            row: Fila del borde visible hacia el que se desplaza la vista
+            direction: 1 hacia abajo, -1 hacia arriba
+            count: Número de chunks a preparar por delante
+            columns: Columnas visibles a formatear por adelantado
         """
-        Gestionar el cache de chunks para evitar usar demasiada memoria
+        if not self._prefetch_supported or not self.total_rows or direction == 0:
+            return
+
+        _, start_row, end_row = self._chunk_bounds(min(max(row, 0), self.total_rows - 1))
+        for _ in range(count):
+            next_row = end_row if direction > 0 else start_row - 1
+            if not 0 <= next_row < self.total_rows:
+                break
+            chunk_index, start_row, end_row = self._chunk_bounds(next_row)
+            if chunk_index in self.data_cache or chunk_index in self._prefetching:
+                continue
+            self._prefetching.add(chunk_index)
+            QThreadPool.globalInstance().start(
+                partial(self._prefetch_chunk, chunk_index, start_row, end_row, columns, self.data_cache.generation)
+            )
+
+    def _prefetch_chunk(self, chunk_index: int, start_row: int, end_row: int, columns: range | None, generation: int) -> None:
+        """Tarea del pool: leer y formatear un chunk y entregarlo al hilo de la vista"""
+        try:
+            chunk = self._read_chunk(start_row, end_row)
+            for column in columns or ():
+                if column < chunk.frame.shape[1]:
+                    chunk.column(column)
+        except Exception as e:
+            print(f"Error al precargar chunk {chunk_index}: {e}")
+            chunk = None
+        self._chunk_prefetched.emit(chunk_index, chunk, generation)
+
+    def _on_chunk_prefetched(self, chunk_index: int, chunk: FormattedChunk | None, generation: int) -> None:
+        self._prefetching.discard(chunk_index)
+        if chunk is not None:
+            self.data_cache.put_prefetched(chunk_index, chunk, generation)
+
+    def _chunk_bounds(self, row: int) -> tuple[int, int, int]:
+        """
+        Calcular el chunk que contiene una fila
+
+        Args:
+            row: Índice de la fila
+
+        Returns:
+            Tupla (índice del chunk, primera fila, fila siguiente a la última)
+        """
+        chunk_index = row // self.chunk_size
+        start_row = chunk_index * self.chunk_size
+        return chunk_index, start_row, min(start_row + self.chunk_size, self.total_rows)
+
+    def _load_chunk(self, start_row: int, end_row: int) -> pd.DataFrame:
+        """
+        Materializar las filas [start_row, end_row) de un chunk
+
+        Las subclases lo sobrescriben para leer los chunks desde otra fuente.
 
         Args:
-            current_chunk: Índice del chunk actual
-        """
-        if len(self.data_cache) >= self.cache_size:
-            # Eliminar chunks más lejanos del actual
-            chunks_to_remove = []
-            for chunk_idx in self.data_cache:
-                distance = abs(chunk_idx - current_chunk)
-                if distance > self.cache_size // 2:
-                    chunks_to_remove.append(chunk_idx)
-
-            for chunk_idx in chunks_to_remove:
-                del self.data_cache[chunk_idx]
+            start_row: Primera fila del chunk
+            end_row: Fila siguiente a la última del chunk
+
+        Returns:
+            DataFrame indexado por posición absoluta de fila
+        """
+        # Slice sin copia: comparte los datos de full_df
+        return self.full_df.iloc[start_row:end_row]
+
+    def get_cache_stats(self) -> dict[str, int | float]:
+        """
+        Obtener aciertos, fallos, expulsiones y memoria del cache de chunks
+
+        Returns:
+            Diccionario de ChunkCache.stats()
+        """
+        return self.data_cache.stats()
     
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> str | None:
         """
@@ -280,18 +466,12 @@ class VirtualizedPandasModel(QAbstractTableModel):
 
         # Verificar que el índice está dentro del rango
         if row < self.total_rows and column < self.total_cols:
+            # Soltar antes el chunk: su slice comparte datos con full_df y obligaría a copiarlo al escribir
+            self.data_cache.pop(self._chunk_bounds(row)[0], None)
+
             # Actualizar el DataFrame completo
             self.full_df.iloc[row, column] = value
 
-            # Si el chunk está en cache, actualizarlo también
-            chunk_index = row // self.chunk_size
-            if chunk_index in self.data_cache:
-                chunk_start = chunk_index * self.chunk_size
-                chunk_end = min(chunk_start + self.chunk_size, self.total_rows)
-                if chunk_start <= row < chunk_end:
-                    local_row = row - chunk_start
-                    self.data_cache[chunk_index].iloc[local_row, column] = value
-
         # Emitir señal de que los datos han cambiado
         self.dataChanged.emit(index, index, [role])
         return True
@@ -331,4 +511,259 @@ class VirtualizedPandasModel(QAbstractTableModel):
         # Limpiar cache y recalcular
         self.data_cache.clear()
         self.beginResetModel()
-        self.endResetModel()
\ No newline at end of file
+        self.endResetModel()
+
+
+class PagedTableModel(VirtualizedPandasModel):
+    """
+    Modelo único de la vista de datos: una página de las filas filtradas de un PaginationManager
+
+    Se enlaza una sola vez a la vista. Cambiar de página solo desplaza la ventana
+    [page_start, page_start + rowCount) y emite dataChanged (o layoutChanged si
+    cambia el número de filas), así que se conservan anchos de columna, scroll
+    y estado de la vista. Los chunks se cachean por posición absoluta en las
+    filas filtradas y se reutilizan entre páginas.
+
+    full_df es el DataFrame base del gestor; las filas de cada chunk se
+    materializan con sus posiciones de filtro y orden.
+    """
+
+    # Con filtro u orden los chunks se materializan con take y tienen memoria propia
+    _shares_model_data = False
+
+    def __init__(self, pagination_manager: "PaginationManager", chunk_size: int | None = None) -> None:
+        super().__init__(pagination_manager.original_df, chunk_size)
+        self.pagination_manager = pagination_manager
+        self.total_rows = pagination_manager.get_total_rows()
+        self.total_cols = len(self.full_df.columns)
+        self._data_version = pagination_manager.data_version
+        self._page_start, self._page_rows = self._page_window()
+
+    def _page_window(self) -> tuple[int, int]:
+        """Primera fila (absoluta) y número de filas de la página actual"""
+        info = self.pagination_manager.get_page_info()
+        if not info['total_rows']:
+            return 0, 0
+        return info['start_row'] - 1, info['rows_in_page']
+
+    def refresh(self) -> None:
+        """
+        Sincronizar el modelo con el PaginationManager emitiendo solo las señales necesarias
+
+        Si cambiaron las filas filtradas (datos, filtro u orden) se vacía el
+        cache; si solo cambió la página, se mueve la ventana sin copiar datos.
+        """
+        manager = self.pagination_manager
+        page_start, page_rows = self._page_window()
+
+        if manager.data_version != self._data_version:
+            new_df = manager.original_df
+            if list(new_df.columns) != list(self.full_df.columns):
+                # Otro conjunto de columnas: la vista debe reconstruir los encabezados
+                self.beginResetModel()
+                self._set_rows(new_df, page_start, page_rows)
+                self.endResetModel()
+            else:
+                self.layoutAboutToBeChanged.emit()
+                self._set_rows(new_df, page_start, page_rows)
+                self.layoutChanged.emit()
+            return
+
+        if (page_start, page_rows) == (self._page_start, self._page_rows):
+            return
+        if page_rows == self._page_rows:
+            self._page_start = page_start
+            if page_rows:
+                self.dataChanged.emit(self.index(0, 0), self.index(page_rows - 1, self.total_cols - 1), [_DISPLAY_ROLE])
+                self.headerDataChanged.emit(Qt.Orientation.Vertical, 0, page_rows - 1)
+        else:
+            self.layoutAboutToBeChanged.emit()
+            self._page_start, self._page_rows = page_start, page_rows
+            self.layoutChanged.emit()
+
+    def _set_rows(self, df: pd.DataFrame, page_start: int, page_rows: int) -> None:
+        self._data_version = self.pagination_manager.data_version
+        self.full_df = df
+        self.total_rows = self.pagination_manager.get_total_rows()
+        self.total_cols = len(df.columns)
+        self._page_start, self._page_rows = page_start, page_rows
+        self.data_cache.clear()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Filas de la página actual"""
+        if parent.isValid():
+            return 0
+        return self._page_rows
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> str | None:
+        """Texto de una celda de la página, leído del chunk de su posición absoluta"""
+        if role != _DISPLAY_ROLE or not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+        if row < self._page_rows and column < self.total_cols:
+            row += self._page_start
+            return self._get_chunk_data(row).cell(row, column)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> str | None:
+        """Encabezados de columna y número de fila dentro de los datos filtrados"""
+        if role == _DISPLAY_ROLE and orientation == Qt.Orientation.Vertical:
+            return str(self._page_start + section + 1)
+        return super().headerData(section, orientation, role)
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole) -> bool:
+        """Editar una celda de la página en las filas filtradas"""
+        if not index.isValid() or role != Qt.EditRole or index.row() >= self._page_rows:
+            return False
+        row = self._page_start + index.row()
+        if index.column() < self.total_cols:
+            self.data_cache.pop(self._chunk_bounds(row)[0], None)
+            self.full_df.iloc[self.pagination_manager.base_position(row), index.column()] = value
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def sort(self, column: int, order: Qt.SortOrder) -> None:
+        """Ordenar todas las filas filtradas (no solo la página) a través del PaginationManager"""
+        if column < 0 or column >= self.total_cols:
+            return
+        self.pagination_manager.sort(self.full_df.columns[column], order == Qt.AscendingOrder)
+        self.refresh()
+
+    def get_sorted_data(self) -> pd.DataFrame:
+        """Filas filtradas en el orden actual"""
+        return self.pagination_manager.filtered_df.copy()
+
+    def prefetch(self, row: int, direction: int, count: int, columns: range | None = None) -> None:
+        """Precargar a partir de una fila de la página (se traduce a posición absoluta)"""
+        super().prefetch(self._page_start + row, direction, count, columns)
+
+    def _load_chunk(self, start_row: int, end_row: int) -> pd.DataFrame:
+        """Filas [start_row, end_row) de las filas filtradas, tomadas del DataFrame base"""
+        return self.pagination_manager.get_rows(start_row, end_row)
+
+
+class DiskBackedModel(VirtualizedPandasModel):
+    """
+    Modelo de solo lectura que navega un archivo directamente desde disco
+
+    La fuente (source) expone columns, row_count, is_complete y read_rows();
+    solo se materializan los chunks visibles y el cache los limita a
+    MAX_CACHE_CHUNKS y MAX_CACHE_BYTES.
+    """
+
+    _shares_model_data = False
+
+    def __init__(self, source: Any, chunk_size: int | None = None) -> None:
+        super().__init__(pd.DataFrame(columns=source.columns), chunk_size)
+        self.source = source
+        self.total_rows = source.row_count
+        self.total_cols = len(source.columns)
+        self.enable_virtualization = True
+
+    def _load_chunk(self, start_row: int, end_row: int) -> pd.DataFrame:
+        """Leer el chunk desde la fuente en disco"""
+        return self.source.read_rows(start_row, end_row)
+
+    def refresh_row_count(self) -> None:
+        """Añadir al modelo las filas disponibles desde la última actualización"""
+        new_total = self.source.row_count
+        if new_total <= self.total_rows:
+            return
+
+        # El último chunk pudo quedar en cache incompleto
+        self.data_cache.pop(self._chunk_bounds(self.total_rows - 1)[0] if self.total_rows else 0, None)
+
+        self.beginInsertRows(QModelIndex(), self.total_rows, new_total - 1)
+        self.total_rows = new_total
+        self.endInsertRows()
+
+    def sort(self, column: int, order: Qt.SortOrder) -> None:
+        """El ordenamiento requiere cargar el archivo completo; no soportado"""
+        return
+
+    def get_sorted_data(self) -> pd.DataFrame:
+        """Sin datos materializados: retornar solo las columnas"""
+        return self.full_df.copy()
+
+    def setData(self, index: QModelIndex, value: object, role: int = Qt.EditRole) -> bool:
+        """Modelo de solo lectura"""
+        return False
+
+
+class LazyCsvModel(DiskBackedModel):
+    """
+    Modelo que navega un CSV desde disco mediante un CsvRowIndex
+
+    La memoria usada es la del índice más los chunks en cache. El índice puede
+    seguir construyéndose en segundo plano: refresh_row_count() incorpora las
+    filas nuevas.
+    """
+
+    def __init__(self, row_index: CsvRowIndex, chunk_size: int | None = None) -> None:
+        super().__init__(row_index, chunk_size)
+        self.row_index = row_index
+
+
+class RowGroupModel(DiskBackedModel):
+    """
+    Modelo que navega un Parquet/Feather desde disco por grupos de filas
+
+    Cada chunk corresponde a un row group (o record batch en Feather) y solo se
+    decodifica cuando la vista llega a él; abrir el archivo solo lee metadatos.
+    """
+
+    def __init__(self, source: RowGroupSource) -> None:
+        super().__init__(source)
+
+    def _chunk_bounds(self, row: int) -> tuple[int, int, int]:
+        """El chunk de una fila es el row group que la contiene"""
+        group = self.source.group_for_row(row)
+        start_row, end_row = self.source.group_bounds(group)
+        return group, start_row, end_row
+
+    def _load_chunk(self, start_row: int, end_row: int) -> pd.DataFrame:
+        """Decodificar el row group completo"""
+        return self.source.read_group(self.source.group_for_row(start_row))
+
+
+class SqliteQueryModel(DiskBackedModel):
+    """
+    Modelo que consulta una tabla SQLite bajo demanda
+
+    Filtros y ordenamiento se traducen a WHERE/ORDER BY y se resuelven en la
+    base de datos; solo se leen las páginas visibles, que quedan en el cache
+    de chunks hasta que cambia la consulta.
+    """
+
+    # La conexión SQLite solo se usa desde el hilo que la creó
+    _prefetch_supported = False
+
+    def __init__(self, source: SqliteQuerySource, chunk_size: int | None = None) -> None:
+        super().__init__(source, chunk_size)
+
+    def sort(self, column: int, order: Qt.SortOrder) -> None:
+        """Ordenar en SQLite por la columna indicada"""
+        if column < 0 or column >= self.total_cols:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self.source.set_sort(self.source.columns[column], order == Qt.AscendingOrder)
+        self.data_cache.clear()
+        self.layoutChanged.emit()
+
+    def apply_filters(self, filters: list[dict[str, Any]]) -> None:
+        """
+        Reemplazar los filtros activos y recontar las filas en SQLite
+
+        Args:
+            filters: Filtros de texto, numéricos, de fechas o de valores con el
+                formato del historial de FilterService (ver build_where_clause)
+        """
+        self.beginResetModel()
+        try:
+            self.source.set_filters(filters)
+        finally:
+            self.total_rows = self.source.row_count
+            self.data_cache.clear()
+            self.endResetModel()
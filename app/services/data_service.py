@@ -12,33 +12,57 @@ from PySide6.QtCore import QThread, Signal, Qt
 from PySide6.QtWidgets import QProgressDialog
 from core.data_handler import (
     cargar_datos_con_opciones,
+    cargar_muestra,
+    cargar_vista_previa,
     get_supported_file_formats
 )
+from core.loaders.compression import get_compression
+from core.loaders.csv_loader import CsvLoader
+from core.loaders.feather_loader import FeatherLoader
 from core.loaders.folder_loader import FolderLoader
+from core.loaders.parquet_loader import ParquetLoader
+from core.loaders.sqlite_loader import SqliteLoader
 from core.consolidation.excel_consolidator import ExcelConsolidator
+from config import optimization_config
 
 class DataLoaderThread(QThread):
     """Hilo para cargar datos en segundo plano"""
     
+    preview_ready = Signal(object)
     data_loaded = Signal(object)
+    chunk_loaded = Signal(object, int)
     error_occurred = Signal(str)
     progress_updated = Signal(int, int)
     
-    def __init__(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, sheet_name: str | None = None) -> None:
+    def __init__(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, sheet_name: str | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, key: str | None = None, sample_rows: int | None = None) -> None:
         super().__init__()
         self.filepath = filepath
         self.skip_rows = skip_rows
         self.column_names = column_names if column_names else {}
         self.separator = separator
         self.sheet_name = sheet_name
+        self.columns = columns
+        self.filters = filters
+        self.key = key
+        self.sample_rows = sample_rows
     
     def run(self) -> None:
-        """Ejecutar la carga de datos"""
+        """Ejecutar la carga de datos (o solo una muestra aleatoria si se pidió sample_rows)"""
         try:
             if self.isInterruptionRequested():
                 return
             self.progress_updated.emit(0, 100)
-            df = cargar_datos_con_opciones(self.filepath, self.skip_rows, self.column_names, separator=self.separator, sheet_name=self.sheet_name)
+            if self.sample_rows:
+                df = cargar_muestra(self.filepath, self.sample_rows, self.skip_rows, self.column_names,
+                                    self.separator, self.columns, self.filters)
+                if not self.isInterruptionRequested():
+                    self.progress_updated.emit(100, 100)
+                    self.data_loaded.emit(df)
+                return
+            self._emit_preview()
+            if self.isInterruptionRequested():
+                return
+            df = cargar_datos_con_opciones(self.filepath, self.skip_rows, self.column_names, separator=self.separator, sheet_name=self.sheet_name, on_chunk=self._on_chunk, columns=self.columns, filters=self.filters, on_progress=self._on_progress, key=self.key, compact_dtypes=optimization_config.COMPACT_DTYPES_ENABLED)
             if not self.isInterruptionRequested():
                 self.progress_updated.emit(100, 100)
                 self.data_loaded.emit(df)
@@ -46,6 +70,97 @@ class DataLoaderThread(QThread):
             if not self.isInterruptionRequested():
                 self.error_occurred.emit(str(e))
 
+    def _emit_preview(self) -> None:
+        """Emitir el encabezado y las primeras filas antes de leer el archivo completo"""
+        try:
+            if Path(self.filepath).stat().st_size <= optimization_config.PREVIEW_THRESHOLD:
+                return
+            preview = cargar_vista_previa(self.filepath, optimization_config.PREVIEW_ROWS, self.skip_rows,
+                                          self.column_names, self.separator, self.sheet_name,
+                                          self.columns, self.filters, self.key)
+        except Exception as e:
+            # La vista previa es opcional: la carga completa reportará el error si lo hay
+            print(f"Vista previa no disponible: {str(e)}")
+            return
+        if preview is not None and not self.isInterruptionRequested():
+            self.preview_ready.emit(preview)
+
+    def _on_chunk(self, chunk: pd.DataFrame, rows_loaded: int) -> None:
+        """Emitir cada chunk parcial a medida que se parsea"""
+        if self.isInterruptionRequested():
+            raise InterruptedError("Thread interrupted")
+        self.chunk_loaded.emit(chunk, rows_loaded)
+
+    def _on_progress(self, rows_parsed: int, total_rows: int) -> None:
+        """Emitir el avance real de la lectura en streaming"""
+        if self.isInterruptionRequested():
+            raise InterruptedError("Thread interrupted")
+        self.progress_updated.emit(rows_parsed, total_rows)
+
+class CsvIndexThread(QThread):
+    """Hilo para indexar offsets de filas de un CSV grande en segundo plano"""
+    
+    index_created = Signal(object)
+    error_occurred = Signal(str)
+    progress_updated = Signal(int, int)
+    
+    def __init__(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, step: int = 1000) -> None:
+        super().__init__()
+        self.filepath = filepath
+        self.skip_rows = skip_rows
+        self.column_names = column_names if column_names else {}
+        self.separator = separator
+        self.step = step
+    
+    def run(self) -> None:
+        """Leer el encabezado, publicar el índice y construirlo progresivamente"""
+        try:
+            if self.isInterruptionRequested():
+                return
+            row_index = CsvLoader(self.filepath).create_row_index(
+                self.step, self.skip_rows, self.column_names, separator=self.separator
+            )
+            self.index_created.emit(row_index)
+            
+            # Progreso en KB para no desbordar la señal con archivos > 2GB
+            row_index.build(
+                progress_callback=lambda done, total: self.progress_updated.emit(done // 1024, total // 1024),
+                should_stop=self.isInterruptionRequested
+            )
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.error_occurred.emit(str(e))
+
+class DiskSourceThread(QThread):
+    """Hilo para abrir un Parquet/Feather/SQLite grande y navegarlo desde disco"""
+    
+    index_created = Signal(object)
+    error_occurred = Signal(str)
+    progress_updated = Signal(int, int)
+    
+    def __init__(self, filepath: str, columns: list[str] | None = None) -> None:
+        super().__init__()
+        self.filepath = filepath
+        self.columns = columns
+    
+    def run(self) -> None:
+        """Leer solo los metadatos del archivo y publicar la fuente"""
+        try:
+            if self.isInterruptionRequested():
+                return
+            suffix = Path(self.filepath).suffix.lower()
+            if suffix == '.feather':
+                source = FeatherLoader(self.filepath).create_row_group_source()
+            elif suffix in ('.db', '.sqlite', '.sqlite3'):
+                source = SqliteLoader(self.filepath).create_query_source()
+            else:
+                source = ParquetLoader(self.filepath).create_row_group_source(self.columns)
+            if not self.isInterruptionRequested():
+                self.index_created.emit(source)
+        except Exception as e:
+            if not self.isInterruptionRequested():
+                self.error_occurred.emit(str(e))
+
 class FolderLoaderThread(QThread):
     """Hilo para cargar y consolidar archivos de una carpeta en segundo plano."""
     
@@ -130,6 +245,7 @@ class DataService:
         self.df_vista_actual: pd.DataFrame | None = None
         self.loading_thread: DataLoaderThread | None = None
         self.folder_loading_thread: FolderLoaderThread | None = None
+        self.index_thread: CsvIndexThread | DiskSourceThread | None = None
         self.progress_dialog: QProgressDialog | None = None
         self._active_threads: list[DataLoaderThread] = []
         
@@ -140,6 +256,8 @@ class DataService:
             '.csv': 'Archivos CSV',
             '.tsv': 'Archivos TSV',
             '.json': 'Archivos JSON',
+            '.jsonl': 'Archivos JSON Lines',
+            '.ndjson': 'Archivos JSON Lines',
             '.xml': 'Archivos XML',
             '.parquet': 'Archivos Parquet',
             '.feather': 'Archivos Feather',
@@ -177,6 +295,9 @@ class DataService:
         for ext in supported_formats:
             if ext in self._format_descriptions:
                 format_filters.append(f"{self._format_descriptions[ext]} (*{ext})")
+        compressed = [f"*{ext}" for ext in supported_formats if get_compression(ext)]
+        if compressed:
+            format_filters.append(f"Archivos comprimidos ({' '.join(compressed)})")
         
         # Añadir filtro de "Todos los soportados"
         all_extensions = " ".join([f"*{ext}" for ext in supported_formats])
@@ -185,9 +306,10 @@ class DataService:
         
         return ";;".join(format_filters)
     
-    def create_loader_thread(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, sheet_name: str | None = None) -> DataLoaderThread:
-        """Crear un hilo de carga de datos"""
-        thread = DataLoaderThread(filepath, skip_rows, column_names, separator, sheet_name)
+    def create_loader_thread(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, sheet_name: str | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, key: str | None = None, sample_rows: int | None = None) -> DataLoaderThread:
+        """Crear un hilo de carga de datos (de una muestra aleatoria si se indica sample_rows)"""
+        thread = DataLoaderThread(filepath, skip_rows, column_names, separator, sheet_name, columns, filters, key, sample_rows)
+        self._forget_previous_source()
         self.loading_thread = thread
         self._active_threads.append(thread)
         thread.finished.connect(
@@ -198,11 +320,35 @@ class DataService:
         )
         return thread
     
+    def create_index_thread(self, filepath: str, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None, step: int = 1000) -> CsvIndexThread:
+        """Crear un hilo de indexación para navegar un CSV desde disco"""
+        self._forget_previous_source()
+        self.index_thread = CsvIndexThread(filepath, skip_rows, column_names, separator, step)
+        return self.index_thread
+    
+    def create_disk_source_thread(self, filepath: str, columns: list[str] | None = None) -> DiskSourceThread:
+        """Crear un hilo para navegar un Parquet/Feather/SQLite desde disco"""
+        self._forget_previous_source()
+        self.index_thread = DiskSourceThread(filepath, columns)
+        return self.index_thread
+    
     def create_folder_loader_thread(self, folder_path: str, config: Any | None = None) -> FolderLoaderThread:
         """Crear un hilo de carga de carpeta"""
+        self._forget_previous_source()
         self.folder_loading_thread = FolderLoaderThread(folder_path, config)
         return self.folder_loading_thread
     
+    def _forget_previous_source(self) -> None:
+        """
+        Olvidar el hilo del archivo anterior antes de crear el del nuevo
+        
+        get_filepath() consulta estos campos en orden: si quedara uno del archivo
+        anterior, la barra de estado y los errores mostrarían su nombre.
+        """
+        self.loading_thread = None
+        self.folder_loading_thread = None
+        self.index_thread = None
+    
     def create_progress_dialog(self, title: str = "Cargando datos", label: str = "Cargando archivo...") -> QProgressDialog:
         """Crear un diálogo de progreso"""
         self.close_progress_dialog()
@@ -235,6 +381,19 @@ class DataService:
         import gc
         gc.collect()
 
+    @staticmethod
+    def should_browse_row_groups(filepath: str) -> bool:
+        """Decidir si un Parquet/Feather se navega desde disco por row groups en lugar de cargarse"""
+        path = Path(filepath)
+        file_size = path.stat().st_size
+        if path.suffix.lower() != '.feather':
+            return optimization_config.should_browse_row_groups(file_size)
+        # Solo un Feather sin comprimir se navega desde disco: se mapea en memoria sin copias y comparte
+        # la caché de páginas. Uno comprimido habría que descomprimirlo entero para contar sus filas
+        return ((optimization_config.should_browse_row_groups(file_size)
+                 or optimization_config.should_memory_map_feather(file_size))
+                and FeatherLoader(filepath).is_memory_mappable())
+
     @staticmethod
     def extensiones_permitidas() -> list[str]:
         """Obtener lista de extensiones de archivo soportadas"""
@@ -258,6 +417,8 @@ class DataService:
             return self.loading_thread.filepath
         if self.folder_loading_thread:
             return self.folder_loading_thread.folder_path
+        if self.index_thread:
+            return self.index_thread.filepath
         return None
     
     def get_filename(self) -> str:
@@ -279,7 +440,7 @@ class DataService:
                     thread.wait(1000)
         self._active_threads.clear()
 
-        threads: tuple[DataLoaderThread | FolderLoaderThread | None, ...] = (self.loading_thread, self.folder_loading_thread)
+        threads: tuple[DataLoaderThread | FolderLoaderThread | CsvIndexThread | DiskSourceThread | None, ...] = (self.loading_thread, self.folder_loading_thread, self.index_thread)
         for active_thread in threads:
             if active_thread and active_thread.isRunning():
                 active_thread.requestInterruption()
@@ -302,3 +463,4 @@ class DataService:
         # 5. Liberar referencias a hilos
         self.loading_thread = None
         self.folder_loading_thread = None
+        self.index_thread = None
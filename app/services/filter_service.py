@@ -5,9 +5,12 @@ Servicio centralizado para operaciones de filtrado de datos
 en Flash View Sheet.
 """
 
-from typing import Any
+from typing import Any, TYPE_CHECKING
 import pandas as pd
 
+if TYPE_CHECKING:
+    from app.models.pandas_model import SqliteQueryModel
+
 class FilterService:
     """
     Servicio para operaciones de filtrado de datos.
@@ -242,6 +245,53 @@ class FilterService:
         except Exception as e:
             raise Exception(f"Error aplicando filtro de valores: {str(e)}")
     
+    def apply_query_filter(self, model: 'SqliteQueryModel', filter_spec: dict[str, Any]) -> int:
+        """
+        Aplicar un filtro a una tabla SQLite consultada bajo demanda.
+        
+        El filtro se suma a los activos del modelo y se resuelve en la base de
+        datos con la misma semántica que el método de pandas equivalente.
+        
+        Args:
+            model: Modelo que consulta la tabla
+            filter_spec: Filtro con las claves del historial: {'column', 'term',
+                'case_sensitive'}, {'column', 'term', 'regex'}, {'column',
+                'operator', 'value'}, {'column', 'start_date', 'end_date'} o
+                {'column', 'values', 'exclude'}
+        
+        Returns:
+            Número de filas que cumplen todos los filtros activos
+        """
+        source = model.source
+        if filter_spec.get('column') not in source.columns:
+            raise ValueError(f"La columna '{filter_spec.get('column')}' no existe en la tabla")
+        
+        original_rows = source.row_count
+        try:
+            model.apply_filters(source.filters + [filter_spec])
+        except Exception as e:
+            raise Exception(f"Error aplicando filtro en la base de datos: {str(e)}")
+        
+        self.filter_history.append({
+            **filter_spec,
+            'original_rows': original_rows,
+            'filtered_rows': source.row_count
+        })
+        return source.row_count
+    
+    def apply_numeric_query_filter(self, model: 'SqliteQueryModel', column: str, operator: str, value: float) -> int:
+        """Filtro numérico resuelto en SQLite (ver apply_numeric_filter)"""
+        return self.apply_query_filter(model, {'column': column, 'operator': operator, 'value': float(value), 'type': 'numeric'})
+    
+    def apply_date_query_filter(self, model: 'SqliteQueryModel', column: str, start_date: str | None = None, end_date: str | None = None) -> int:
+        """Filtro por rango de fechas resuelto en SQLite (ver apply_date_filter)"""
+        return self.apply_query_filter(model, {'column': column, 'start_date': start_date, 'end_date': end_date, 'type': 'date'})
+    
+    def clear_query_filters(self, model: 'SqliteQueryModel') -> None:
+        """Quitar los filtros de una tabla SQLite y limpiar el historial"""
+        model.apply_filters([])
+        self.clear_filters()
+    
     def clear_filters(self) -> None:
         """Limpiar el historial de filtros"""
         self.filter_history = []
@@ -3,6 +3,7 @@ PaginationManager - Gestor de paginación para DataView
 Maneja la lógica de paginación independiente de la interfaz de usuario
 """
 
+import numpy as np
 import pandas as pd
 from PySide6.QtCore import QObject, Signal
 from typing import Optional
@@ -12,6 +13,10 @@ class PaginationManager(QObject):
     """
     Gestor de paginación que maneja datos divididos en páginas
     Proporciona una interfaz para navegar entre páginas y gestionar el tamaño de página
+
+    No copia los datos: guarda una referencia al DataFrame base y un array de
+    posiciones de fila con el filtro y el orden actuales. Solo se materializan
+    las filas que se piden (la página visible o un chunk del modelo).
     """
     
     # Señales para notificar cambios
@@ -29,11 +34,19 @@ class PaginationManager(QObject):
             page_size: Número de filas por página
         """
         super().__init__()
-        self.original_df: pd.DataFrame = df.copy() if df is not None else pd.DataFrame()
-        self.filtered_df: pd.DataFrame = self.original_df.copy()
+        self.original_df: pd.DataFrame = pd.DataFrame()
+        # Posiciones en original_df de las filas filtradas y ordenadas (None: todas, en su orden)
+        self._positions: np.ndarray | None = None
+        # Orden de todas las filas tras sort() y máscara del filtro actual (None: sin orden / sin filtro)
+        self._order: np.ndarray | None = None
+        self._mask: np.ndarray | None = None
         self.current_page: int = 1
         self.page_size: int = page_size
         self.total_pages: int = 0
+        # Cambia cada vez que cambian las filas filtradas (datos, filtro u orden)
+        self.data_version: int = 0
+        if df is not None:
+            self._set_base(df)
         self._update_total_pages()
     
     def set_data(self, df: pd.DataFrame, preserve_page: bool = True) -> None:
@@ -47,8 +60,8 @@ class PaginationManager(QObject):
         old_page = self.current_page  # Preservar página actual
         old_total = self.total_pages if hasattr(self, 'total_pages') else 0
         
-        self.original_df = df.copy()
-        self.filtered_df = df.copy()
+        self._set_base(df)
+        self.data_version += 1
         
         self._update_total_pages()
         
@@ -112,7 +125,37 @@ class PaginationManager(QObject):
     
     def get_total_rows(self) -> int:
         """Obtener número total de filas filtradas"""
-        return len(self.filtered_df)
+        return len(self.original_df) if self._positions is None else len(self._positions)
+    
+    @property
+    def filtered_df(self) -> pd.DataFrame:
+        """
+        Filas filtradas y ordenadas como DataFrame
+        
+        Sin filtro ni orden es el propio DataFrame base; si no, se materializan
+        todas las filas filtradas. Para leer una parte usar get_rows().
+        """
+        return self.get_rows(0, self.get_total_rows())
+    
+    def get_rows(self, start: int, end: int) -> pd.DataFrame:
+        """
+        Materializar las filas filtradas [start, end)
+        
+        Args:
+            start: Primera posición dentro de las filas filtradas
+            end: Posición siguiente a la última
+        
+        Returns:
+            DataFrame con esas filas y los índices originales
+        """
+        if self._positions is None:
+            # Slice sin copia del DataFrame base
+            return self.original_df.iloc[start:end]
+        return self.original_df.take(self._positions[start:end])
+    
+    def base_position(self, row: int) -> int:
+        """Posición en original_df de la fila filtrada row"""
+        return row if self._positions is None else int(self._positions[row])
     
     def get_page_data(self) -> pd.DataFrame:
         """
@@ -121,13 +164,10 @@ class PaginationManager(QObject):
         Returns:
             DataFrame con datos de la página actual
         """
-        if self.filtered_df.empty:
-            return self.filtered_df
-        
         start_idx = (self.current_page - 1) * self.page_size
-        end_idx = min(start_idx + self.page_size, len(self.filtered_df))
+        end_idx = min(start_idx + self.page_size, self.get_total_rows())
         
-        return self.filtered_df.iloc[start_idx:end_idx].copy()
+        return self.get_rows(max(start_idx, 0), max(end_idx, 0))
     
     def next_page(self) -> None:
         """Ir a la siguiente página"""
@@ -171,18 +211,18 @@ class PaginationManager(QObject):
         """
         if not term.strip():
             # Si no hay término, mostrar todos los datos
-            self.filtered_df = self.original_df.copy()
+            self._mask = None
         else:
             try:
                 # Filtrar por coincidencia parcial (case-insensitive)
-                self.filtered_df = self.original_df[
-                    self.original_df[column].astype(str).str.contains(
-                        term, case=False, na=False, regex=False
-                    )
-                ].copy()
+                self._mask = self.original_df[column].astype(str).str.contains(
+                    term, case=False, na=False, regex=False
+                ).to_numpy(dtype=bool)
             except Exception:
                 # En caso de error, mostrar todos los datos
-                self.filtered_df = self.original_df.copy()
+                self._mask = None
+        self._update_positions()
+        self.data_version += 1
         
         # Resetear a primera página después del filtro
         self.current_page = 1
@@ -191,11 +231,32 @@ class PaginationManager(QObject):
     
     def clear_filter(self) -> None:
         """Limpiar filtros y mostrar todos los datos"""
-        self.filtered_df = self.original_df.copy()
+        self._mask = None
+        self._update_positions()
+        self.data_version += 1
         self.current_page = 1
         self._update_total_pages()
         self.data_changed.emit()
     
+    def sort(self, column: str, ascending: bool = True) -> None:
+        """
+        Ordenar todas las filas por una columna, conservando el filtro y la página actual
+        
+        Args:
+            column: Nombre de la columna
+            ascending: True para orden ascendente
+        """
+        # Se ordenan todas las filas para que el orden se mantenga al cambiar el filtro;
+        # el orden estable respeta el anterior entre valores iguales
+        keys = self.original_df[column]
+        if self._order is not None:
+            keys = keys.take(self._order)
+        ranked = keys.reset_index(drop=True).sort_values(ascending=ascending, kind='stable').index.to_numpy()
+        self._order = ranked if self._order is None else self._order[ranked]
+        self._update_positions()
+        self.data_version += 1
+        self.data_changed.emit()
+    
     def get_filter_info(self) -> dict:
         """
         Obtener información del filtro actual
@@ -203,19 +264,36 @@ class PaginationManager(QObject):
         Returns:
             Dict con información del filtro
         """
+        filtered_rows = self.get_total_rows()
         return {
             'original_rows': len(self.original_df),
-            'filtered_rows': len(self.filtered_df),
-            'filtered_out': len(self.original_df) - len(self.filtered_df),
-            'is_filtered': len(self.filtered_df) != len(self.original_df)
+            'filtered_rows': filtered_rows,
+            'filtered_out': len(self.original_df) - filtered_rows,
+            'is_filtered': filtered_rows != len(self.original_df)
         }
     
+    def _set_base(self, df: pd.DataFrame) -> None:
+        """Tomar df como datos base, sin filtro ni orden"""
+        # Copia superficial: con copy-on-write no duplica memoria y aísla al llamador
+        self.original_df = df.copy(deep=False)
+        self._order = None
+        self._mask = None
+        self._positions = None
+    
+    def _update_positions(self) -> None:
+        """Recalcular las posiciones de las filas visibles a partir del orden y el filtro"""
+        if self._order is None:
+            self._positions = None if self._mask is None else np.flatnonzero(self._mask)
+        else:
+            self._positions = self._order if self._mask is None else self._order[self._mask[self._order]]
+    
     def _update_total_pages(self) -> None:
         """Calcular número total de páginas"""
-        if self.filtered_df.empty:
+        total_rows = self.get_total_rows()
+        if total_rows == 0:
             self.total_pages = 0
         else:
-            self.total_pages = (len(self.filtered_df) + self.page_size - 1) // self.page_size
+            self.total_pages = (total_rows + self.page_size - 1) // self.page_size
         
         self.total_pages_changed.emit(self.total_pages)
         
@@ -231,7 +309,7 @@ class PaginationManager(QObject):
         Returns:
             Dict con información de la página
         """
-        total_rows = len(self.filtered_df)
+        total_rows = self.get_total_rows()
         
         if total_rows == 0:
             return {
@@ -170,6 +170,9 @@ class ProfilerService:
             return "float"
         if pd.api.types.is_datetime64_any_dtype(series.dtype):
             return "datetime"
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Columna compactada a category: se describe por el tipo de sus categorías
+            return ProfilerService._get_detailed_type(series.cat.categories.to_series())
         if pd.api.types.is_string_dtype(series):
             return "string"
         if pd.api.types.is_object_dtype(series):
@@ -18,6 +18,7 @@ from .view_switcher import ViewSwitcher
 
 if TYPE_CHECKING:
     import pandas as pd
+    from app.models.pandas_model import DiskBackedModel
     from app.widgets.main_view import MainView
     from app.widgets.data_view import DataView
     from app.widgets.join.joined_data_view import JoinedDataView
@@ -173,6 +174,14 @@ class ViewCoordinator(QObject):
         if self._data_view:
             self._data_view.set_data(df)
 
+    def show_lazy_data_view(self, model: DiskBackedModel) -> None:
+        if self._data_view:
+            self._data_view.set_lazy_model(model)
+
+    def update_lazy_data_view(self) -> None:
+        if self._data_view:
+            self._data_view.update_lazy_info()
+
     def update_main_view(self, filepath: str | None) -> None:
         if filepath and self._main_view:
             self._main_view.add_file_to_list(filepath)
@@ -11,7 +11,8 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
 from PySide6.QtCore import Signal
 
 from app.services.pagination_manager import PaginationManager
-from app.models.pandas_model import VirtualizedPandasModel
+from app.models.pandas_model import VirtualizedPandasModel, PagedTableModel, DiskBackedModel, SqliteQueryModel
+from app.models.chunk_prefetcher import ChunkPrefetcher
 from typing import Optional
 
 
@@ -25,15 +26,19 @@ class DataView(QWidget):
 
     filter_applied = Signal(str, str)
     filter_cleared = Signal()
-    data_updated = Signal(object)
+    # Cambiaron las filas filtradas; quien las necesite las lee de pagination_manager.filtered_df
+    data_updated = Signal()
+    load_full_requested = Signal()
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
         self.pagination_manager: Optional[PaginationManager] = None
         self.pandas_model: Optional[VirtualizedPandasModel] = None
+        # Modelo único de los datos en memoria; solo se reemplaza al navegar un archivo desde disco
+        self._page_model: Optional[PagedTableModel] = None
+        self._emitted_data_version: Optional[int] = None
         self.original_df: Optional[pd.DataFrame] = None
-        self._sorting_in_progress: bool = False
         self._quick_filter_groups: dict[str, QButtonGroup] = {}
 
         self.search_column_combo: QComboBox
@@ -64,10 +69,47 @@ class DataView(QWidget):
         main_layout.addWidget(self._quick_filters_container)
         self._quick_filters_container.setVisible(False)
 
+        self._create_sample_banner(main_layout)
         self._create_search_section(main_layout)
         self._create_table_section(main_layout)
         self._create_pagination_section(main_layout)
 
+    def _create_sample_banner(self, parent_layout: QVBoxLayout) -> None:
+        """Aviso visible solo cuando se muestra una muestra aleatoria del archivo"""
+        self._sample_banner = QFrame()
+        self._sample_banner.setStyleSheet("""
+            QFrame { background-color: #fef3c7; border: 1px solid #fcd34d; border-radius: 8px; }
+            QLabel { color: #92400e; font-size: 13px; border: none; }
+        """)
+        banner_layout = QHBoxLayout(self._sample_banner)
+        banner_layout.setContentsMargins(12, 6, 6, 6)
+
+        self._sample_label = QLabel()
+        banner_layout.addWidget(self._sample_label, 1)
+
+        load_full_btn = QPushButton("Cargar archivo completo")
+        load_full_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #d97706; color: white; border: none;
+                border-radius: 6px; padding: 6px 12px; font-weight: 600;
+            }
+            QPushButton:hover { background-color: #b45309; }
+        """)
+        load_full_btn.clicked.connect(self.load_full_requested.emit)
+        banner_layout.addWidget(load_full_btn)
+
+        parent_layout.addWidget(self._sample_banner)
+        self._sample_banner.setVisible(False)
+
+    def _update_sample_banner(self, df: pd.DataFrame | None) -> None:
+        muestra = df.attrs.get('muestra') if df is not None else None
+        if muestra:
+            self._sample_label.setText(
+                f"Muestra aleatoria: {muestra['filas']:,} de ~{muestra['filas_estimadas']:,} filas. "
+                "Filtros, orden y estadísticas se calculan solo sobre la muestra."
+            )
+        self._sample_banner.setVisible(bool(muestra))
+
     def _create_search_section(self, parent_layout: QVBoxLayout) -> None:
         search_frame = QFrame()
         search_frame.setStyleSheet("""
@@ -152,6 +194,7 @@ class DataView(QWidget):
         self.table_view.setSortingEnabled(True)
         self.table_view.setShowGrid(False)
         self.table_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._prefetcher = ChunkPrefetcher(self.table_view)
 
         header = self.table_view.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)  # type: ignore[attr-defined]
@@ -400,10 +443,14 @@ class DataView(QWidget):
     # ------------------------------------------------------------------
 
     def set_data(self, df: pd.DataFrame) -> None:
-        self.original_df = df.copy()
+        self._set_disk_mode(False)
+        self._update_sample_banner(df)
+        # Sin copia: el PaginationManager filtra y ordena con posiciones sobre este DataFrame
+        self.original_df = df
 
         if self.pagination_manager is None:
             self.pagination_manager = PaginationManager(df, self.page_size_spin.value())
+            self._page_model = PagedTableModel(self.pagination_manager)
             self._connect_pagination_signals()
         else:
             self.pagination_manager.set_data(df)
@@ -415,6 +462,47 @@ class DataView(QWidget):
         self._populate_quick_filters(df)
         self.update_view()
 
+    def set_lazy_model(self, model: DiskBackedModel) -> None:
+        """Mostrar un archivo navegado desde disco, sin paginación (filtros y orden solo si la fuente los consulta)"""
+        self._set_disk_mode(True, queryable=isinstance(model, SqliteQueryModel))
+        self._update_sample_banner(None)
+        self.pagination_manager = None
+        self._page_model = None
+        self._emitted_data_version = None
+        self.original_df = None
+        self.pandas_model = model
+        self.table_view.setModel(model)
+        self._prefetcher.reset()
+
+        self.search_column_combo.clear()
+        self.search_column_combo.addItems(model.source.columns)
+        self._populate_quick_filters(pd.DataFrame())
+        self.update_lazy_info()
+
+    def update_lazy_info(self) -> None:
+        """Actualizar el contador de filas mientras el índice se construye"""
+        if not isinstance(self.pandas_model, DiskBackedModel):
+            return
+        self.pandas_model.refresh_row_count()
+        source = self.pandas_model.source
+        suffix = "" if source.is_complete else " (indexando...)"
+        self.page_info_label.setText(f"{source.row_count} registros leídos desde disco{suffix}")
+        self.page_number_label.setText("")
+
+    def _set_disk_mode(self, enabled: bool, queryable: bool = False) -> None:
+        """Deshabilitar paginación al navegar desde disco, y filtros y orden si la fuente no los consulta"""
+        # setSortingEnabled(True) reordena el modelo con el indicador actual: solo llamarlo si cambia
+        sorting = not enabled or queryable
+        if self.table_view.isSortingEnabled() != sorting:
+            self.table_view.setSortingEnabled(sorting)
+        for widget in (self.search_input, self.filter_btn, self.clear_search_btn):
+            widget.setEnabled(not enabled or queryable)
+        self.page_size_spin.setEnabled(not enabled)
+        if enabled:
+            for btn in (self.first_page_btn, self.prev_page_btn,
+                        self.next_page_btn, self.last_page_btn):
+                btn.setEnabled(False)
+
     def _connect_pagination_signals(self) -> None:
         assert self.pagination_manager is not None
         self.pagination_manager.page_changed.connect(self._on_page_changed)
@@ -422,57 +510,41 @@ class DataView(QWidget):
         self.pagination_manager.data_changed.connect(self._on_data_changed)
         self.pagination_manager.total_pages_changed.connect(self._on_total_pages_changed)
 
-    def _connect_model_signals(self) -> None:
-        if self.pandas_model is not None:
-            self.pandas_model.layoutChanged.connect(self._on_model_sorted)
-
-    def _on_model_sorted(self) -> None:
-        if self.pandas_model is None or self.pagination_manager is None or self.original_df is None:
-            return
-        if self._sorting_in_progress:
-            return
-
-        self._sorting_in_progress = True
-        try:
-            sorted_data = self.pandas_model.get_sorted_data()
-            if len(sorted_data) < len(self.original_df):
-                full_sorted = self.original_df.sort_values(
-                    sorted_data.columns[0], ascending=False
-                )
-            else:
-                full_sorted = sorted_data
-
-            self.pagination_manager.set_data(full_sorted, preserve_page=True)
-            self.original_df = full_sorted.copy()
-        finally:
-            self._sorting_in_progress = False
-
     def update_view(self) -> None:
-        if self.pagination_manager is None or self.original_df is None:
-            return
-        if self._sorting_in_progress:
+        if self.pagination_manager is None or self.original_df is None or self._page_model is None:
             return
 
-        current_page_data = self.pagination_manager.get_page_data()
-        self.pandas_model = VirtualizedPandasModel(current_page_data)
-        self.table_view.setModel(self.pandas_model)
-        self._connect_model_signals()
+        # El modelo se enlaza una vez; páginas, filtros y orden solo mueven su ventana
+        if self.table_view.model() is not self._page_model:
+            self.pandas_model = self._page_model
+            self.table_view.setModel(self._page_model)
+            self._prefetcher.reset()
+        self._page_model.refresh()
 
         self._update_page_info()
         self._update_pagination_buttons()
-        self.data_updated.emit(self.pagination_manager.filtered_df)
+        # Cambiar de página no cambia los datos; la señal no lleva las filas para no materializarlas
+        if self.pagination_manager.data_version != self._emitted_data_version:
+            self._emitted_data_version = self.pagination_manager.data_version
+            self.data_updated.emit()
 
     # ------------------------------------------------------------------
     # Filters
     # ------------------------------------------------------------------
 
     def _apply_text_filter(self) -> None:
-        if self.pagination_manager is None:
-            return
-
         column = self.search_column_combo.currentText()
         term = self.search_input.text().strip()
 
+        if isinstance(self.pandas_model, SqliteQueryModel):
+            if column and term:
+                self._apply_query_filters([{'column': column, 'term': term, 'case_sensitive': False}])
+                self.filter_applied.emit(column, term)
+            return
+
+        if self.pagination_manager is None:
+            return
+
         if not column or not term:
             return
 
@@ -483,6 +555,12 @@ class DataView(QWidget):
             QMessageBox.critical(self, "Error", f"Error de búsqueda: {e}")
 
     def clear_filter(self) -> None:
+        if isinstance(self.pandas_model, SqliteQueryModel):
+            self._apply_query_filters([])
+            self.search_input.clear()
+            self.filter_cleared.emit()
+            return
+
         if self.pagination_manager:
             self.pagination_manager.clear_filter()
             self.search_input.clear()
@@ -495,6 +573,15 @@ class DataView(QWidget):
 
             self.filter_cleared.emit()
 
+    def _apply_query_filters(self, filters: list[dict]) -> None:
+        """Resolver los filtros en la base de datos del modelo SQLite"""
+        assert isinstance(self.pandas_model, SqliteQueryModel)
+        try:
+            self.pandas_model.apply_filters(filters)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Error de búsqueda: {e}")
+        self.update_lazy_info()
+
     # ------------------------------------------------------------------
     # Pagination UI
     # ------------------------------------------------------------------
@@ -146,6 +146,23 @@ class InfoModal(QDialog):
                     f"Valores nulos totales: {basic_stats.get('valores_nulos_total', 'N/A'):,}",
                 ]
 
+                # Resumen de la compactación de tipos aplicada al cargar
+                compactacion = df.attrs.get('compactacion')
+                if compactacion:
+                    antes = compactacion['memoria_antes_mb']
+                    despues = compactacion['memoria_despues_mb']
+                    ahorro = (1 - despues / antes) * 100 if antes else 0.0
+                    basic_info.append(
+                        f"Memoria al cargar: {antes:.2f} MB → {despues:.2f} MB tras compactar tipos ({ahorro:.0f}% menos)"
+                    )
+
+                # Las estadísticas de una muestra aleatoria no son las del archivo completo
+                muestra = df.attrs.get('muestra')
+                if muestra:
+                    basic_info.append(
+                        f"Muestra aleatoria: {muestra['filas']:,} de ~{muestra['filas_estimadas']:,} filas estimadas"
+                    )
+
                 for info_text in basic_info:
                     info_label = QLabel(info_text)
                     basic_layout.addWidget(info_label)
@@ -1,11 +1,16 @@
 """
 Diálogo de Opciones de Carga para Flash View Sheet
-Permite configurar opciones como saltar filas y renombrar columnas
+Permite configurar opciones como saltar filas, renombrar columnas y
+seleccionar columnas/filtros que se aplican durante la lectura
 """
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QSpinBox, QPushButton,
                                  QGroupBox, QFormLayout, QDialogButtonBox, QTableWidget,
-                                 QTableWidgetItem, QCheckBox, QWidget)
+                                 QTableWidgetItem, QCheckBox, QWidget, QListWidget,
+                                 QListWidgetItem, QComboBox, QHBoxLayout)
+
+from core.loaders.selection import FILTER_OPERATORS
 
 class LoadOptionsDialog(QDialog):
     """
@@ -15,10 +20,15 @@ class LoadOptionsDialog(QDialog):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("Opciones de Carga")
-        self.resize(600, 400)
+        self.resize(600, 640)
         self.skip_rows: int = 0
         self.column_names: dict[str, str] = {}
         self.enable_column_visibility: bool = False
+        self.columns: list[str] | None = None
+        self.filters: list[tuple[str, str, str]] = []
+        self.hdf5_key: str | None = None
+        self._available_columns: list[str] = []
+        self._hdf5_filepath: str | None = None
         self.setup_ui()
         
     def setup_ui(self) -> None:
@@ -53,6 +63,39 @@ class LoadOptionsDialog(QDialog):
         
         main_layout.addWidget(rename_group)
 
+        # Grupo: Clave HDF5 (solo visible para archivos HDF5)
+        self.hdf5_group = QGroupBox("Objeto HDF5")
+        hdf5_layout = QFormLayout(self.hdf5_group)
+        self.hdf5_key_combo = QComboBox()
+        self.hdf5_key_combo.setToolTip("Objeto del archivo a leer; las columnas se actualizan al cambiarlo")
+        self.hdf5_key_combo.currentTextChanged.connect(self._on_hdf5_key_changed)
+        hdf5_layout.addRow("Clave:", self.hdf5_key_combo)
+        self.hdf5_group.hide()
+        main_layout.addWidget(self.hdf5_group)
+
+        # Grupo: Columnas y filtros aplicados al leer el archivo
+        read_group = QGroupBox("Columnas y filtros de lectura")
+        read_layout = QHBoxLayout(read_group)
+
+        self.columns_list = QListWidget()
+        self.columns_list.setToolTip("Solo las columnas marcadas se leerán del archivo")
+        read_layout.addWidget(self.columns_list, 1)
+
+        filters_layout = QVBoxLayout()
+        self.filters_table = QTableWidget(0, 3)
+        self.filters_table.setHorizontalHeaderLabels(["Columna", "Operador", "Valor"])
+        self.filters_table.horizontalHeader().setStretchLastSection(True)
+        self.filters_table.setToolTip("Filtros combinados con Y; para un rango usa >= y <= sobre la misma columna "
+                                      "(en HDF5, la columna 'index' filtra por el índice, p. ej. una ventana de tiempo)")
+        filters_layout.addWidget(self.filters_table)
+
+        add_filter_btn = QPushButton("Añadir Filtro")
+        add_filter_btn.clicked.connect(self.add_filter_row)
+        filters_layout.addWidget(add_filter_btn)
+        read_layout.addLayout(filters_layout, 2)
+
+        main_layout.addWidget(read_group)
+
         # Grupo: Opciones Adicionales
         additional_group = QGroupBox("Opciones Adicionales")
         additional_layout = QVBoxLayout(additional_group)
@@ -76,13 +119,59 @@ class LoadOptionsDialog(QDialog):
         self.table.setItem(row, 0, QTableWidgetItem(""))
         self.table.setItem(row, 1, QTableWidgetItem(""))
         
+    def add_filter_row(self) -> None:
+        """Añadir una fila de filtro (columna, operador, valor)"""
+        row = self.filters_table.rowCount()
+        self.filters_table.insertRow(row)
+
+        column_combo = QComboBox()
+        column_combo.setEditable(True)
+        column_combo.addItems(self._available_columns)
+        self.filters_table.setCellWidget(row, 0, column_combo)
+
+        operator_combo = QComboBox()
+        operator_combo.addItems(list(FILTER_OPERATORS))
+        self.filters_table.setCellWidget(row, 1, operator_combo)
+
+        self.filters_table.setItem(row, 2, QTableWidgetItem(""))
+        
     def set_columns(self, columns: list[str]) -> None:
         """Establecer las columnas originales"""
+        self._available_columns = list(columns)
         self.table.setRowCount(0)
         for col in columns:
             self.add_row()
             self.table.item(self.table.rowCount()-1, 0).setText(col)
+
+        self.columns_list.clear()
+        for col in columns:
+            item = QListWidgetItem(col)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked)
+            self.columns_list.addItem(item)
             
+    def set_hdf5_keys(self, filepath: str, keys: list[str], current_key: str | None = None) -> None:
+        """Mostrar la selección de clave HDF5 con las claves del archivo"""
+        self._hdf5_filepath = filepath
+        self.hdf5_key_combo.blockSignals(True)
+        self.hdf5_key_combo.clear()
+        self.hdf5_key_combo.addItems(keys)
+        if current_key in keys:
+            self.hdf5_key_combo.setCurrentText(current_key)
+        self.hdf5_key_combo.blockSignals(False)
+        self.hdf5_group.show()
+
+    def _on_hdf5_key_changed(self, key: str) -> None:
+        """Listar las columnas de la clave elegida sin leer sus filas"""
+        if not key or self._hdf5_filepath is None:
+            return
+        from core.loaders.hdf5_loader import Hdf5Loader
+        try:
+            columns = Hdf5Loader(self._hdf5_filepath).get_columns(key)
+        except Exception:
+            return
+        self.set_columns(columns)
+
     def get_options(self) -> tuple[int, dict[str, str], bool]:
         """Obtener las opciones configuradas"""
         self.skip_rows = self.skip_spin.value()
@@ -94,3 +183,30 @@ class LoadOptionsDialog(QDialog):
                 self.column_names[original] = new
         self.enable_column_visibility = self.column_visibility_checkbox.isChecked()
         return self.skip_rows, self.column_names, self.enable_column_visibility
+
+    def get_read_options(self) -> tuple[list[str] | None, list[tuple[str, str, str]]]:
+        """Obtener columnas a leer (None = todas) y filtros de filas"""
+        checked = [
+            self.columns_list.item(i).text()
+            for i in range(self.columns_list.count())
+            if self.columns_list.item(i).checkState() == Qt.Checked
+        ]
+        self.columns = checked if 0 < len(checked) < self.columns_list.count() else None
+
+        self.filters = []
+        for row in range(self.filters_table.rowCount()):
+            column_combo = self.filters_table.cellWidget(row, 0)
+            operator_combo = self.filters_table.cellWidget(row, 1)
+            value_item = self.filters_table.item(row, 2)
+            column = column_combo.currentText().strip() if isinstance(column_combo, QComboBox) else ""
+            value = value_item.text().strip() if value_item else ""
+            if column and value and isinstance(operator_combo, QComboBox):
+                self.filters.append((column, operator_combo.currentText(), value))
+        return self.columns, self.filters
+
+    def get_hdf5_key(self) -> str | None:
+        """Obtener la clave HDF5 elegida (None si el archivo no es HDF5)"""
+        if self._hdf5_filepath is None:
+            return None
+        self.hdf5_key = self.hdf5_key_combo.currentText() or None
+        return self.hdf5_key
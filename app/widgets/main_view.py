@@ -206,7 +206,7 @@ class MainView(QWidget):
     """
     load_file_clicked = Signal()
     files_dropped = Signal(list)  # lista de rutas válidas (multi-archivo)
-    reload_with_options = Signal(str, int, dict, bool)
+    reload_with_options = Signal(str, int, dict, bool, list, list, str)
     recent_file_clicked = Signal(str)
     recent_file_remove = Signal(str)
     
@@ -214,6 +214,7 @@ class MainView(QWidget):
         super().__init__(parent)
         self.current_file: str | None = None
         self._original_columns: list[str] = []
+        self._hdf5_keys: dict[str, str] = {}  # clave HDF5 elegida por archivo
         self._file_widgets: dict[str, FileItemWidget] = {}
         
         self.setAcceptDrops(True) # Habilitar Drag & Drop en toda la vista
@@ -450,10 +451,22 @@ class MainView(QWidget):
         dialog = LoadOptionsDialog(self)
         if self._original_columns:
             dialog.set_columns(self._original_columns)
+        if self.current_file and Path(self.current_file).suffix.lower() in ('.h5', '.hdf5'):
+            from core.loaders.hdf5_loader import Hdf5Loader
+            try:
+                dialog.set_hdf5_keys(self.current_file, Hdf5Loader(self.current_file).list_keys(),
+                                      self._hdf5_keys.get(self.current_file))
+            except Exception:
+                pass
 
         if dialog.exec():
             skip_rows, column_names, enable_column_visibility = dialog.get_options()
-            self.reload_with_options.emit(self.current_file, skip_rows, column_names, enable_column_visibility)
+            columns, filters = dialog.get_read_options()
+            hdf5_key = dialog.get_hdf5_key()
+            if hdf5_key:
+                self._hdf5_keys[self.current_file] = hdf5_key
+            self.reload_with_options.emit(self.current_file, skip_rows, column_names, enable_column_visibility,
+                                          columns or [], filters, hdf5_key or "")
 
     def set_original_columns(self, columns: list[str]) -> None:
         self._original_columns = columns
@@ -11,15 +11,48 @@ class OptimizationConfig:
     # Límites para activar optimizaciones
     VIRTUALIZATION_THRESHOLD = 5000  # Número de filas para activar paginación virtual
     CHUNK_LOADING_THRESHOLD = 100 * 1024 * 1024  # 100MB para activar carga por chunks
+    EXCEL_STREAMING_THRESHOLD = 5 * 1024 * 1024  # 5MB para leer Excel fila a fila con progreso
+    JSON_LINES_STREAMING_THRESHOLD = 10 * 1024 * 1024  # 10MB para leer JSON Lines por chunks con progreso
+    XML_STREAMING_THRESHOLD = 20 * 1024 * 1024  # 20MB para leer XML registro a registro con iterparse
+    COMPRESSED_STREAMING_THRESHOLD = 10 * 1024 * 1024  # 10MB comprimidos para descomprimir por chunks con progreso
+    LAZY_CSV_THRESHOLD = 1024 * 1024 * 1024  # 1GB para navegar CSV directamente desde disco
+    LAZY_COLUMNAR_THRESHOLD = 256 * 1024 * 1024  # 256MB para navegar Parquet/Feather por row groups
+    FEATHER_MMAP_THRESHOLD = 64 * 1024 * 1024  # 64MB para navegar Feather sin comprimir mapeado en memoria
+    SQLITE_QUERY_THRESHOLD = 128 * 1024 * 1024  # 128MB para consultar SQLite bajo demanda
+
+    # Configuración de la caché persistente de datasets parseados (~/.flashsheet/cache)
+    DATASET_CACHE_ENABLED = True
+    DATASET_CACHE_MIN_FILE_SIZE = 20 * 1024 * 1024  # 20MB para guardar una copia Feather del archivo parseado
+    DATASET_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 2GB máximo en disco; se expulsan las copias menos usadas
+
+    # Configuración de vista previa mientras se carga el archivo completo
+    PREVIEW_THRESHOLD = 5 * 1024 * 1024  # 5MB para mostrar primero el encabezado y las primeras filas
+    PREVIEW_ROWS = 1000                  # Filas de la vista previa
+
+    # Configuración de la muestra aleatoria (vistazo rápido a CSV/JSON Lines grandes)
+    SAMPLE_ROWS = 10000  # Filas leídas en posiciones aleatorias del archivo
 
     # Configuración de paginación virtual
     DEFAULT_CHUNK_SIZE = 1000  # Filas por chunk en el modelo virtual
     MAX_CACHE_CHUNKS = 10  # Número máximo de chunks en cache
+    MAX_CACHE_BYTES = 256 * 1024 * 1024  # 256MB máximo de chunks en cache (texto formateado y filas leídas de disco)
+    PREFETCH_CHUNKS = 2  # Chunks preparados en segundo plano por delante del scroll (0 desactiva la precarga)
+    PREFETCH_HORIZON_SECONDS = 0.5  # Con scroll más rápido que un chunk en este tiempo se precargan PREFETCH_CHUNKS
 
     # Configuración de carga de archivos
     CSV_CHUNK_SIZE_SMALL = 50000   # Chunk size para archivos pequeños
     CSV_CHUNK_SIZE_MEDIUM = 25000  # Chunk size para archivos medianos
     CSV_CHUNK_SIZE_LARGE = 10000   # Chunk size para archivos grandes
+    EXCEL_CHUNK_SIZE = 10000       # Filas por chunk al leer Excel en streaming
+    JSON_LINES_CHUNK_SIZE = 50000  # Registros por chunk al leer JSON Lines en streaming
+    XML_CHUNK_SIZE = 10000         # Registros por chunk al leer XML en streaming
+    HDF5_CHUNK_SIZE = 100000       # Filas por chunk al leer tablas HDF5 con where
+
+    # Configuración de compactación de tipos tras la carga
+    COMPACT_DTYPES_ENABLED = True       # Reducir enteros/decimales y convertir texto repetido a category
+    COMPACT_CATEGORY_MAX_RATIO = 0.5    # Proporción máxima de valores distintos para usar category
+    COMPACT_ARROW_STRINGS = True        # Guardar el resto del texto como string[pyarrow]
+    COMPACT_BATCH_ROWS = 500000         # Filas leídas por chunks que se compactan juntas antes de seguir leyendo
 
     # Configuración de estadísticas
     STATS_SAMPLE_THRESHOLD = 100000  # Usar sample para datasets > 100k filas
@@ -63,6 +96,58 @@ class OptimizationConfig:
         """
         return row_count > cls.VIRTUALIZATION_THRESHOLD
 
+    @classmethod
+    def should_browse_from_disk(cls, file_size_bytes: int) -> bool:
+        """
+        Determinar si un CSV debe navegarse desde disco con índice de filas
+
+        Args:
+            file_size_bytes: Tamaño del archivo en bytes
+
+        Returns:
+            True si el archivo no debe cargarse completo en memoria
+        """
+        return file_size_bytes > cls.LAZY_CSV_THRESHOLD
+
+    @classmethod
+    def should_browse_row_groups(cls, file_size_bytes: int) -> bool:
+        """
+        Determinar si un Parquet/Feather debe navegarse desde disco por row groups
+
+        Args:
+            file_size_bytes: Tamaño del archivo en bytes
+
+        Returns:
+            True si el archivo no debe cargarse completo en memoria
+        """
+        return file_size_bytes > cls.LAZY_COLUMNAR_THRESHOLD
+
+    @classmethod
+    def should_memory_map_feather(cls, file_size_bytes: int) -> bool:
+        """
+        Determinar si un Feather sin comprimir debe navegarse mapeado en memoria
+
+        Args:
+            file_size_bytes: Tamaño del archivo en bytes
+
+        Returns:
+            True si conviene compartir la caché de páginas del sistema en lugar de copiarlo
+        """
+        return file_size_bytes > cls.FEATHER_MMAP_THRESHOLD
+
+    @classmethod
+    def should_query_sqlite(cls, file_size_bytes: int) -> bool:
+        """
+        Determinar si una base SQLite debe consultarse bajo demanda en lugar de cargarse
+
+        Args:
+            file_size_bytes: Tamaño del archivo en bytes
+
+        Returns:
+            True si filtros, orden y páginas deben resolverse en SQLite
+        """
+        return file_size_bytes > cls.SQLITE_QUERY_THRESHOLD
+
     @classmethod
     def should_optimize_filtering(cls, row_count: int) -> bool:
         """
@@ -102,9 +187,60 @@ def get_config_from_env() -> OptimizationConfig:
     if 'FLASH_CACHE_CHUNKS' in os.environ:
         config.MAX_CACHE_CHUNKS = int(os.environ['FLASH_CACHE_CHUNKS'])
 
+    if 'FLASH_CACHE_BYTES' in os.environ:
+        config.MAX_CACHE_BYTES = int(os.environ['FLASH_CACHE_BYTES'])
+
+    if 'FLASH_PREFETCH_CHUNKS' in os.environ:
+        config.PREFETCH_CHUNKS = int(os.environ['FLASH_PREFETCH_CHUNKS'])
+
     if 'FLASH_VIRT_THRESHOLD' in os.environ:
         config.VIRTUALIZATION_THRESHOLD = int(os.environ['FLASH_VIRT_THRESHOLD'])
 
+    if 'FLASH_EXCEL_STREAMING_THRESHOLD' in os.environ:
+        config.EXCEL_STREAMING_THRESHOLD = int(os.environ['FLASH_EXCEL_STREAMING_THRESHOLD'])
+
+    if 'FLASH_JSON_LINES_STREAMING_THRESHOLD' in os.environ:
+        config.JSON_LINES_STREAMING_THRESHOLD = int(os.environ['FLASH_JSON_LINES_STREAMING_THRESHOLD'])
+
+    if 'FLASH_XML_STREAMING_THRESHOLD' in os.environ:
+        config.XML_STREAMING_THRESHOLD = int(os.environ['FLASH_XML_STREAMING_THRESHOLD'])
+
+    if 'FLASH_COMPRESSED_STREAMING_THRESHOLD' in os.environ:
+        config.COMPRESSED_STREAMING_THRESHOLD = int(os.environ['FLASH_COMPRESSED_STREAMING_THRESHOLD'])
+
+    if 'FLASH_LAZY_CSV_THRESHOLD' in os.environ:
+        config.LAZY_CSV_THRESHOLD = int(os.environ['FLASH_LAZY_CSV_THRESHOLD'])
+
+    if 'FLASH_LAZY_COLUMNAR_THRESHOLD' in os.environ:
+        config.LAZY_COLUMNAR_THRESHOLD = int(os.environ['FLASH_LAZY_COLUMNAR_THRESHOLD'])
+
+    if 'FLASH_FEATHER_MMAP_THRESHOLD' in os.environ:
+        config.FEATHER_MMAP_THRESHOLD = int(os.environ['FLASH_FEATHER_MMAP_THRESHOLD'])
+
+    if 'FLASH_SQLITE_QUERY_THRESHOLD' in os.environ:
+        config.SQLITE_QUERY_THRESHOLD = int(os.environ['FLASH_SQLITE_QUERY_THRESHOLD'])
+
+    if 'FLASH_COMPACT_DTYPES' in os.environ:
+        config.COMPACT_DTYPES_ENABLED = os.environ['FLASH_COMPACT_DTYPES'] not in ('0', 'false', 'no')
+
+    if 'FLASH_PREVIEW_THRESHOLD' in os.environ:
+        config.PREVIEW_THRESHOLD = int(os.environ['FLASH_PREVIEW_THRESHOLD'])
+
+    if 'FLASH_PREVIEW_ROWS' in os.environ:
+        config.PREVIEW_ROWS = int(os.environ['FLASH_PREVIEW_ROWS'])
+
+    if 'FLASH_SAMPLE_ROWS' in os.environ:
+        config.SAMPLE_ROWS = int(os.environ['FLASH_SAMPLE_ROWS'])
+
+    if 'FLASH_DATASET_CACHE' in os.environ:
+        config.DATASET_CACHE_ENABLED = os.environ['FLASH_DATASET_CACHE'] not in ('0', 'false', 'no')
+
+    if 'FLASH_DATASET_CACHE_MIN_FILE_SIZE' in os.environ:
+        config.DATASET_CACHE_MIN_FILE_SIZE = int(os.environ['FLASH_DATASET_CACHE_MIN_FILE_SIZE'])
+
+    if 'FLASH_DATASET_CACHE_MAX_BYTES' in os.environ:
+        config.DATASET_CACHE_MAX_BYTES = int(os.environ['FLASH_DATASET_CACHE_MAX_BYTES'])
+
     return config
 
 
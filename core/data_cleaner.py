@@ -5,8 +5,12 @@ Todas las funciones operan sobre un DataFrame y devuelven otro DataFrame
 (o un dict con estadísticas). Sin efectos secundarios ni dependencias de UI.
 """
 
+import numpy as np
 import pandas as pd
 
+# Texto en cualquiera de sus tipos: object, string (también string[pyarrow]) y category tras compactar_tipos
+_TIPOS_TEXTO = ['object', 'string', 'category']
+
 
 def limpiar_nulos(df: pd.DataFrame, estrategia: str = 'eliminar') -> pd.DataFrame:
     """
@@ -20,7 +24,12 @@ def limpiar_nulos(df: pd.DataFrame, estrategia: str = 'eliminar') -> pd.DataFram
     if estrategia == 'eliminar':
         return df.dropna()
     if estrategia == 'cero':
-        return df.fillna(0)
+        result = df.copy()
+        # Una columna category solo acepta valores que ya estén entre sus categorías
+        for col in result.select_dtypes(include='category').columns:
+            if 0 not in result[col].cat.categories:
+                result[col] = result[col].cat.add_categories([0])
+        return result.fillna(0)
     if estrategia == 'promedio':
         result = df.copy()
         numeric_cols = result.select_dtypes(include='number').columns
@@ -35,13 +44,52 @@ def eliminar_duplicados(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def limpiar_espacios_texto(df: pd.DataFrame) -> pd.DataFrame:
-    """Aplicar str.strip() a todas las columnas de tipo object."""
+    """Aplicar str.strip() a todas las columnas de texto (object, string o category)."""
     result = df.copy()
-    for col in result.select_dtypes(include='object').columns:
-        result[col] = result[col].str.strip()
+    for col in result.select_dtypes(include=_TIPOS_TEXTO).columns:
+        result[col] = _quitar_espacios(result[col])
     return result
 
 
+def _quitar_espacios(serie: pd.Series) -> pd.Series:
+    """
+    str.strip() de una columna; en una category se limpian solo las categorías.
+
+    Las categorías que quedan iguales tras el strip se fusionan en una.
+    """
+    if not isinstance(serie.dtype, pd.CategoricalDtype):
+        return serie.str.strip()
+
+    categorias = serie.cat.categories
+    if not pd.api.types.is_string_dtype(categorias):
+        return serie
+    limpias = categorias.str.strip()
+    if limpias.is_unique:
+        return serie.cat.rename_categories(limpias)
+
+    unicas = limpias.unique()
+    nuevo_codigo = pd.Index(unicas).get_indexer(limpias)
+    codigos = serie.cat.codes.to_numpy()
+    codigos = np.where(codigos >= 0, nuevo_codigo[codigos], -1)
+    return pd.Series(
+        pd.Categorical.from_codes(codigos, categories=unicas, ordered=serie.cat.ordered),
+        index=serie.index, name=serie.name,
+    )
+
+
+def _tiene_espacios(serie: pd.Series) -> bool:
+    """Indicar si str.strip() cambiaría algún valor de la columna."""
+    if not isinstance(serie.dtype, pd.CategoricalDtype):
+        return bool(serie.str.strip().ne(serie).any())
+
+    categorias = serie.cat.categories
+    if not pd.api.types.is_string_dtype(categorias):
+        return False
+    con_espacios = np.asarray(categorias.str.strip() != categorias)
+    codigos = serie.cat.codes.to_numpy()
+    return bool(con_espacios[codigos[codigos >= 0]].any())
+
+
 def limpieza_rapida(df: pd.DataFrame) -> pd.DataFrame:
     """
     Aplica nulos→eliminar → duplicados → espacios.
@@ -68,8 +116,8 @@ def resumen_limpieza(df_original: pd.DataFrame, df_limpio: pd.DataFrame) -> dict
         if df_original[col].isna().any()
     ]
     cols_with_espacios = [
-        col for col in df_original.select_dtypes(include='object').columns
-        if df_original[col].str.strip().ne(df_original[col]).any()
+        col for col in df_original.select_dtypes(include=_TIPOS_TEXTO).columns
+        if _tiene_espacios(df_original[col])
     ]
     affected: list[str] = list(set(cols_with_nulos + cols_with_espacios))
 
@@ -4,9 +4,10 @@ Módulo para manejo de datos - carga, análisis y exportación
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import union_categoricals
 import os
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 import sys
 
 # Añadir directorio raíz para importar config
@@ -35,7 +36,8 @@ def cargar_datos(filepath: str, chunk_size: int | None = None) -> pd.DataFrame:
     loader = get_file_loader(filepath)
     
     # Aplicar optimización para archivos grandes
-    if chunk_size or (loader.can_load_chunks() and loader.get_memory_usage_info().get('file_size_mb', 0) > 100):
+    file_size = Path(filepath).stat().st_size
+    if chunk_size or (loader.can_load_chunks() and file_size > optimization_config.CHUNK_LOADING_THRESHOLD):
         if chunk_size is None:
             # Usar configuración de optimización
             file_info = loader.get_memory_usage_info()
@@ -54,7 +56,7 @@ def cargar_datos(filepath: str, chunk_size: int | None = None) -> pd.DataFrame:
 
     return loader.load()
 
-def cargar_datos_con_opciones(filepath: str, skip_rows: int = 0, column_names: dict | None = None, chunk_size: int | None = None, separator: str | None = None, sheet_name: str | None = None) -> pd.DataFrame:
+def cargar_datos_con_opciones(filepath: str, skip_rows: int = 0, column_names: dict | None = None, chunk_size: int | None = None, separator: str | None = None, sheet_name: str | None = None, on_chunk: Callable[[pd.DataFrame, int], None] | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, on_progress: Callable[[int, int], None] | None = None, key: str | None = None, compact_dtypes: bool = False) -> pd.DataFrame:
     """
     Cargar datos desde un archivo con opciones adicionales usando el sistema de loaders
 
@@ -65,57 +67,470 @@ def cargar_datos_con_opciones(filepath: str, skip_rows: int = 0, column_names: d
         chunk_size: Tamaño de chunk para lectura (si el formato lo soporta)
         separator: Separador personalizado para archivos CSV/TSV
         sheet_name: Nombre de la hoja para archivos Excel
+        on_chunk: Callback opcional invocado con cada chunk parcial y el total
+            de filas leídas hasta el momento (solo en carga por chunks)
+        columns: Columnas a conservar (proyección), aplicada mientras se lee el archivo;
+            Parquet, Feather, HDF5, Excel y SQLite no leen las demás columnas
+        filters: Filtros de filas (columna, operador, valor) combinados con AND y aplicados
+            al leer cada chunk (en Parquet y HDF5 también por row group, en SQLite con WHERE)
+        on_progress: Callback opcional con (filas_leidas, filas_totales) durante la
+            lectura en streaming (CSV, Excel, JSON Lines, XML, HDF5); filas_totales es 0 si no se conoce
+        key: Clave del objeto a leer en archivos HDF5 (por defecto la primera)
+        compact_dtypes: Compactar los tipos de las columnas tras la carga (ver compactar_tipos)
 
     Returns:
         DataFrame de Pandas con los datos cargados y opciones aplicadas
+
+    Los archivos de texto y Excel grandes se guardan ya parseados en la caché
+    persistente (core.dataset_cache); reabrirlos con las mismas opciones lee esa
+    copia mapeada en memoria sin volver a parsear el original.
     """
+    from core.dataset_cache import build_cache_key, dataset_cache
     from core.loaders import get_file_loader
     from core.loaders.csv_loader import CsvLoader
     from core.loaders.excel_loader import ExcelLoader
+    from core.loaders.hdf5_loader import Hdf5Loader
+    from core.loaders.json_loader import JsonLoader
+    from core.loaders.parquet_loader import ParquetLoader
+    from core.loaders.sqlite_loader import SqliteLoader
+    from core.loaders.xml_loader import XmlLoader
 
     # Usar el factory pattern para cargar el archivo
     loader = get_file_loader(filepath)
     is_csv = isinstance(loader, CsvLoader)
     is_excel = isinstance(loader, ExcelLoader)
+    is_parquet = isinstance(loader, ParquetLoader)
+    is_json_lines = isinstance(loader, JsonLoader) and loader.is_json_lines()
+    is_xml = isinstance(loader, XmlLoader)
+    is_hdf5 = isinstance(loader, Hdf5Loader)
+    is_sqlite = isinstance(loader, SqliteLoader)
+
+    # Los formatos columnares ya se leen rápido; solo se cachea lo que hay que parsear
+    file_size = Path(filepath).stat().st_size
+    cache_key = None
+    cacheable = is_csv or is_excel or isinstance(loader, JsonLoader) or is_xml
+    if (cacheable and optimization_config.DATASET_CACHE_ENABLED
+            and file_size > optimization_config.DATASET_CACHE_MIN_FILE_SIZE):
+        cache_key = build_cache_key(filepath, skip_rows=skip_rows, column_names=column_names or {},
+                                    separator=separator, sheet_name=sheet_name, columns=columns,
+                                    filters=filters, compact_dtypes=compact_dtypes)
+        cached = dataset_cache.get(cache_key)
+        if cached is not None:
+            return cached
     
     # Aplicar optimización para archivos grandes
-    # Nota: load_in_chunks no soporta skip_rows/column_names, usar carga normal si se requieren
+    # Nota: solo los loaders CSV, Excel, JSON Lines, XML, HDF5 y SQLite aplican skip_rows/column_names por chunk,
+    # y Parquet además columnas y filtros; el resto usa carga normal si se requieren
     has_options = (skip_rows > 0) or (column_names is not None and len(column_names) > 0)
-    if not has_options and (chunk_size or (loader.can_load_chunks() and loader.get_memory_usage_info().get('file_size_mb', 0) > 100)):
+    has_selection = bool(columns) or bool(filters)
+    if loader.compression:
+        chunk_threshold = optimization_config.COMPRESSED_STREAMING_THRESHOLD
+    elif is_excel:
+        chunk_threshold = optimization_config.EXCEL_STREAMING_THRESHOLD
+    elif is_json_lines:
+        chunk_threshold = optimization_config.JSON_LINES_STREAMING_THRESHOLD
+    elif is_xml:
+        chunk_threshold = optimization_config.XML_STREAMING_THRESHOLD
+    else:
+        chunk_threshold = optimization_config.CHUNK_LOADING_THRESHOLD
+    use_chunks = chunk_size or (loader.can_load_chunks() and file_size > chunk_threshold)
+    selects_in_chunks = is_csv or is_excel or is_json_lines or is_xml or is_hdf5 or is_sqlite
+    if use_chunks and (selects_in_chunks or (not has_options and (is_parquet or not has_selection))):
         if chunk_size is None:
             # Usar configuración de optimización
-            file_info = loader.get_memory_usage_info()
-            estimated_rows = file_info.get('estimated_data_rows', 1000)
-            if estimated_rows > optimization_config.VIRTUALIZATION_THRESHOLD:
-                chunk_size = 1000
+            if is_csv:
+                chunk_size = optimization_config.get_csv_chunk_size(file_size)
+            elif is_excel:
+                chunk_size = optimization_config.EXCEL_CHUNK_SIZE
+            elif is_json_lines:
+                chunk_size = optimization_config.JSON_LINES_CHUNK_SIZE
+            elif is_xml:
+                chunk_size = optimization_config.XML_CHUNK_SIZE
+            elif is_hdf5:
+                chunk_size = optimization_config.HDF5_CHUNK_SIZE
             else:
-                chunk_size = 10000
+                estimated_rows = loader.get_memory_usage_info().get('estimated_data_rows', 1000)
+                if estimated_rows > optimization_config.VIRTUALIZATION_THRESHOLD:
+                    chunk_size = 1000
+                else:
+                    chunk_size = 10000
         
         try:
             if is_csv:
-                df = loader.load_in_chunks(chunk_size, separator=separator)
+                chunks = loader.iter_chunks(chunk_size, skip_rows, column_names, separator=separator,
+                                            progress_callback=on_progress, columns=columns, filters=filters)
+            elif is_excel:
+                chunks = loader.iter_chunks(chunk_size, skip_rows, column_names, sheet_name=sheet_name,
+                                            progress_callback=on_progress, columns=columns, filters=filters)
+            elif is_json_lines or is_xml:
+                chunks = loader.iter_chunks(chunk_size, skip_rows, column_names, progress_callback=on_progress,
+                                            columns=columns, filters=filters)
+            elif is_sqlite:
+                chunks = loader.iter_chunks(chunk_size, skip_rows=skip_rows, column_names=column_names,
+                                            columns=columns, filters=filters)
+            elif is_hdf5:
+                chunks = loader.iter_chunks(chunk_size, skip_rows, column_names, key=key, columns=columns,
+                                            filters=filters, progress_callback=on_progress)
+            elif is_parquet:
+                chunks = loader.iter_chunks(chunk_size, columns=columns, filters=filters)
             else:
-                df = loader.load_in_chunks(chunk_size)
+                chunks = loader.iter_chunks(chunk_size)
+            df = _consumir_chunks(chunks, on_chunk, compact=compact_dtypes)
+            compactado = compact_dtypes
+        except InterruptedError:
+            raise
         except Exception as e:
             # Si falla el chunk loading, usar carga normal
             print(f"Chunk loading falló, usando carga normal: {str(e)}")
-            if is_csv:
-                df = loader.load(skip_rows, column_names, separator=separator)
-            elif is_excel:
-                df = loader.load(skip_rows, column_names, sheet_name=sheet_name)
-            else:
-                df = loader.load(skip_rows, column_names)
+            df = _cargar_completo(loader, skip_rows, column_names, separator, sheet_name, columns, filters, key)
+            compactado = False
     else:
         # Carga normal con opciones
-        if is_csv:
-            df = loader.load(skip_rows, column_names, separator=separator)
-        elif is_excel:
-            df = loader.load(skip_rows, column_names, sheet_name=sheet_name)
+        df = _cargar_completo(loader, skip_rows, column_names, separator, sheet_name, columns, filters, key)
+        compactado = False
+
+    if compact_dtypes and not compactado:
+        df = compactar_tipos(df)
+
+    if cache_key is not None:
+        dataset_cache.put(cache_key, df, str(Path(filepath).resolve()))
+
+    return df
+
+def _cargar_completo(loader: Any, skip_rows: int, column_names: dict | None, separator: str | None,
+                     sheet_name: str | None, columns: list[str] | None,
+                     filters: list[tuple[str, str, Any]] | None, key: str | None) -> pd.DataFrame:
+    """
+    Cargar un archivo completo con el loader, aplicando columnas y filtros al leer
+    """
+    from core.loaders.csv_loader import CsvLoader
+    from core.loaders.excel_loader import ExcelLoader
+    from core.loaders.hdf5_loader import Hdf5Loader
+
+    if isinstance(loader, CsvLoader):
+        return loader.load(skip_rows, column_names, separator=separator, columns=columns, filters=filters)
+    if isinstance(loader, ExcelLoader):
+        return loader.load(skip_rows, column_names, sheet_name=sheet_name, columns=columns, filters=filters)
+    if isinstance(loader, Hdf5Loader):
+        return loader.load(skip_rows, column_names, key=key, columns=columns, filters=filters)
+    return loader.load(skip_rows, column_names, columns=columns, filters=filters)
+
+def cargar_vista_previa(filepath: str, n_rows: int | None = None, skip_rows: int = 0, column_names: dict | None = None, separator: str | None = None, sheet_name: str | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, key: str | None = None) -> pd.DataFrame | None:
+    """
+    Leer solo el encabezado y las primeras filas de un archivo
+
+    Usa la lectura incremental de cada formato (primer chunk del CSV, filas de
+    Excel en modo streaming, primer lote de Parquet, LIMIT en SQLite...) y se
+    detiene en cuanto tiene n_rows filas, así que su costo no depende del
+    tamaño del archivo.
+
+    Args:
+        filepath: Ruta del archivo
+        n_rows: Filas a leer (por defecto OptimizationConfig.PREVIEW_ROWS)
+        skip_rows, column_names, separator, sheet_name, columns, filters, key:
+            Mismas opciones que cargar_datos_con_opciones
+
+    Returns:
+        DataFrame con las primeras filas, o None si el formato no permite leer
+        una parte sin cargar el archivo completo (JSON, YAML, Pickle, Feather,
+        .xls sin calamine, HDF5 en formato fixed)
+    """
+    from core.loaders import get_file_loader
+    from core.loaders.csv_loader import CsvLoader
+    from core.loaders.excel_loader import CALAMINE_AVAILABLE, ExcelLoader
+    from core.loaders.hdf5_loader import Hdf5Loader
+    from core.loaders.json_loader import JsonLoader
+    from core.loaders.parquet_loader import ParquetLoader
+    from core.loaders.sqlite_loader import SqliteLoader
+    from core.loaders.xml_loader import XmlLoader
+
+    if n_rows is None:
+        n_rows = optimization_config.PREVIEW_ROWS
+
+    loader = get_file_loader(filepath)
+    if isinstance(loader, CsvLoader):
+        chunks = loader.iter_chunks(n_rows, skip_rows, column_names, separator=separator,
+                                    columns=columns, filters=filters)
+    elif isinstance(loader, ExcelLoader):
+        if not CALAMINE_AVAILABLE and Path(filepath).suffix.lower() != '.xlsx':
+            return None
+        chunks = loader.iter_chunks(n_rows, skip_rows, column_names, sheet_name=sheet_name,
+                                    columns=columns, filters=filters)
+    elif isinstance(loader, (JsonLoader, XmlLoader)):
+        if not loader.can_load_chunks():
+            return None
+        chunks = loader.iter_chunks(n_rows, skip_rows, column_names, columns=columns, filters=filters)
+    elif isinstance(loader, Hdf5Loader):
+        if not loader.is_table(key):
+            return None
+        chunks = loader.iter_chunks(n_rows, skip_rows, column_names, key=key, columns=columns, filters=filters)
+    elif isinstance(loader, ParquetLoader):
+        if skip_rows or column_names:
+            return None
+        chunks = loader.iter_chunks(n_rows, columns=columns, filters=filters)
+    elif isinstance(loader, SqliteLoader):
+        chunks = loader.iter_chunks(n_rows, skip_rows=skip_rows, column_names=column_names,
+                                    columns=columns, filters=filters)
+    else:
+        return None
+
+    try:
+        first = next(iter(chunks), None)
+    finally:
+        # Cerrar el generador libera el archivo sin leer el resto
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+    if first is None:
+        return None
+    return first.head(n_rows).reset_index(drop=True)
+
+def cargar_muestra(filepath: str, n_rows: int | None = None, skip_rows: int = 0, column_names: dict | None = None, separator: str | None = None, columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None, seed: int | None = None) -> pd.DataFrame:
+    """
+    Leer una muestra aleatoria de filas de un CSV/TSV o JSON Lines sin cargarlo completo
+
+    En archivos grandes sin comprimir se salta a posiciones aleatorias del
+    archivo, así que el tiempo depende del tamaño de la muestra y no del
+    archivo; los comprimidos se recorren una vez con reservoir sampling.
+
+    Args:
+        filepath: Ruta del archivo
+        n_rows: Filas de la muestra (por defecto OptimizationConfig.SAMPLE_ROWS)
+        skip_rows, column_names, separator, columns, filters:
+            Mismas opciones que cargar_datos_con_opciones (columnas y filtros se
+            aplican sobre la muestra)
+        seed: Semilla para obtener siempre la misma muestra
+
+    Returns:
+        DataFrame con las filas en el orden del archivo; df.attrs['muestra']
+        guarda las filas leídas y las filas estimadas del archivo
+
+    Raises:
+        ValueError: Si el formato no se puede muestrear por líneas
+    """
+    from core.loaders import get_file_loader
+    from core.loaders.csv_loader import CsvLoader
+    from core.loaders.json_loader import JsonLoader
+    from core.loaders.selection import select_frame
+
+    if n_rows is None:
+        n_rows = optimization_config.SAMPLE_ROWS
+
+    loader = get_file_loader(filepath)
+    if isinstance(loader, CsvLoader):
+        df = loader.load_sample(n_rows, skip_rows, separator=separator, seed=seed)
+        filas_estimadas = max(loader.count_rows() - skip_rows, 0)
+    elif isinstance(loader, JsonLoader) and loader.is_json_lines():
+        df = loader.load_sample(n_rows, skip_rows, seed=seed)
+        filas_estimadas = max(loader.get_memory_usage_info().get('estimated_data_rows', 0) - skip_rows, 0)
+    else:
+        raise ValueError("La muestra aleatoria solo está disponible para archivos CSV/TSV y JSON Lines")
+
+    df = select_frame(df, columns, filters)
+    if column_names:
+        df = df.rename(columns=column_names)
+    df.attrs['muestra'] = {
+        'filas': len(df),
+        'filas_estimadas': max(filas_estimadas, len(df)),
+    }
+    return df
+
+def _consumir_chunks(chunks: Iterator[pd.DataFrame], on_chunk: Callable[[pd.DataFrame, int], None] | None = None, compact: bool = False) -> pd.DataFrame:
+    """
+    Consumir un iterador de chunks notificando cada chunk parcial a medida que llega
+
+    Sin compactar, los chunks se guardan tal cual y se concatenan al final, así
+    que el pico de memoria es de unas dos veces el DataFrame. Con compact, los
+    chunks se agrupan en lotes de COMPACT_BATCH_ROWS filas que se compactan al
+    completarse: solo un lote queda sin compactar y la concatenación final
+    trabaja sobre datos ya compactados.
+
+    Args:
+        chunks: Iterador de DataFrames parciales
+        on_chunk: Callback opcional con (chunk, filas_leidas_hasta_ahora)
+        compact: Compactar los tipos por lotes mientras se lee (ver compactar_tipos)
+
+    Returns:
+        DataFrame con todos los chunks concatenados
+    """
+    chunk_list: list[pd.DataFrame] = []
+    lotes: list[pd.DataFrame] = []
+    filas_pendientes = 0
+    rows_loaded = 0
+    for chunk in chunks:
+        chunk_list.append(chunk)
+        rows_loaded += len(chunk)
+        filas_pendientes += len(chunk)
+        if on_chunk is not None:
+            on_chunk(chunk, rows_loaded)
+        if compact and filas_pendientes >= optimization_config.COMPACT_BATCH_ROWS:
+            lotes.append(compactar_tipos(_concatenar(chunk_list)))
+            chunk_list = []
+            filas_pendientes = 0
+
+    if not compact:
+        return _concatenar(chunk_list)
+    if chunk_list or not lotes:
+        lotes.append(compactar_tipos(_concatenar(chunk_list)))
+    return _unir_lotes_compactados(lotes)
+
+def _concatenar(chunk_list: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenar chunks con un índice nuevo"""
+    if not chunk_list:
+        return pd.DataFrame()
+    if len(chunk_list) == 1:
+        return chunk_list[0].reset_index(drop=True)
+    return pd.concat(chunk_list, ignore_index=True)
+
+def _unir_lotes_compactados(lotes: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenar lotes compactados por separado conservando las columnas category
+
+    Cada lote tiene sus propias categorías; pd.concat convertiría la columna a
+    object, así que se unen con union_categoricals. La unión puede tener muchos
+    más valores distintos que cada lote (o mezclar lotes de texto y category),
+    así que se vuelve a aplicar la regla de compactar_tipos sobre la columna
+    unida: queda category solo si cumple la proporción y ocupa menos que el
+    texto. La memoria antes es la suma de los lotes sin compactar y la memoria
+    después se mide sobre el DataFrame final.
+    """
+    if len(lotes) == 1:
+        return lotes[0]
+
+    memoria_antes = sum(lote.attrs['compactacion']['memoria_antes_mb'] for lote in lotes)
+    tipos_originales: dict[str, str] = {}
+    for lote in lotes:
+        for columna, conversion in lote.attrs['compactacion']['columnas_convertidas'].items():
+            tipos_originales.setdefault(columna, conversion.split(' -> ')[0])
+
+    columnas: dict[int, pd.Series] = {}
+    for position in range(lotes[0].shape[1]):
+        partes = [lote.iloc[:, position] for lote in lotes]
+        if any(isinstance(parte.dtype, pd.CategoricalDtype) for parte in partes):
+            unida = pd.Series(union_categoricals([parte.astype('category') for parte in partes], ignore_order=True), name=partes[0].name)
+            tipo_original = tipos_originales.get(str(partes[0].name))
+            if tipo_original is not None:
+                # La columna era texto al leerla: comprobar que category sigue compensando
+                unida = _recompactar_categoria(unida, partes, tipo_original)
+            columnas[position] = unida
+        elif any(isinstance(parte.dtype, pd.StringDtype) for parte in partes):
+            # Igual con string[pyarrow]: concatenarlo con object volvería a object
+            tipo = next(parte.dtype for parte in partes if isinstance(parte.dtype, pd.StringDtype))
+            columnas[position] = pd.concat([parte.astype(tipo) for parte in partes], ignore_index=True)
         else:
-            df = loader.load(skip_rows, column_names)
+            columnas[position] = pd.concat(partes, ignore_index=True)
+    df = pd.concat(columnas, axis=1)
+    df.columns = lotes[0].columns
+
+    memoria_despues = int(df.memory_usage(deep=True, index=True).sum()) / 1024 / 1024
+    df.attrs['compactacion'] = {
+        'memoria_antes_mb': memoria_antes,
+        'memoria_despues_mb': memoria_despues,
+        'columnas_convertidas': {
+            columna: f"{tipo} -> {df[columna].dtype}"
+            for columna, tipo in tipos_originales.items()
+            if columna in df.columns and str(df[columna].dtype) != tipo
+        },
+    }
+    return df
+
+def _recompactar_categoria(unida: pd.Series, partes: list[pd.Series], tipo_original: str) -> pd.Series:
+    """
+    Elegir entre la columna category unida y su versión de texto con la regla de compactar_tipos
+    """
+    tipo_texto = next((parte.dtype for parte in partes if isinstance(parte.dtype, pd.StringDtype)), None)
+    if tipo_texto is None and optimization_config.COMPACT_ARROW_STRINGS and tipo_original == 'object':
+        tipo_texto = 'string[pyarrow]'
+    texto = pd.concat([parte.astype(tipo_texto or tipo_original) for parte in partes], ignore_index=True)
+    if (len(unida.cat.categories) <= optimization_config.COMPACT_CATEGORY_MAX_RATIO * len(unida)
+            and unida.memory_usage(deep=True, index=False) < texto.memory_usage(deep=True, index=False)):
+        return unida
+    return texto
+
+def compactar_tipos(df: pd.DataFrame, category_max_ratio: float | None = None, arrow_strings: bool | None = None) -> pd.DataFrame:
+    """
+    Reducir la memoria del DataFrame ajustando los tipos de sus columnas sin perder datos
+
+    - Enteros: al tipo entero más pequeño que contiene todos los valores
+    - Decimales: a float32 solo si cada valor se representa exactamente
+    - Texto con pocos valores distintos: a category
+    - Texto con muchos valores distintos: a string[pyarrow] (opcional)
+
+    Una columna solo se convierte si la conversión ocupa menos memoria. El
+    resumen queda en df.attrs['compactacion'] con la memoria antes y después.
 
+    Args:
+        df: DataFrame recién cargado (se modifica en el lugar)
+        category_max_ratio: Proporción máxima de valores distintos para usar category
+            (por defecto OptimizationConfig.COMPACT_CATEGORY_MAX_RATIO)
+        arrow_strings: Convertir el texto restante a string[pyarrow]
+            (por defecto OptimizationConfig.COMPACT_ARROW_STRINGS)
+
+    Returns:
+        El mismo DataFrame con los tipos compactados
+    """
+    if category_max_ratio is None:
+        category_max_ratio = optimization_config.COMPACT_CATEGORY_MAX_RATIO
+    if arrow_strings is None:
+        arrow_strings = optimization_config.COMPACT_ARROW_STRINGS
+
+    # Memoria por posición de columna (más el índice): se mide una sola vez
+    memoria = df.memory_usage(deep=True, index=True)
+    memoria_antes = int(memoria.sum())
+    memoria_despues = memoria_antes
+    columnas_convertidas: dict[str, str] = {}
+
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        try:
+            compacted = _compactar_columna(column, category_max_ratio, arrow_strings)
+        except (TypeError, ValueError):
+            continue
+        if compacted is None or compacted.dtype == column.dtype:
+            continue
+        antes = int(memoria.iloc[position + 1])
+        despues = int(compacted.memory_usage(deep=True, index=False))
+        if despues >= antes:
+            continue
+        df.isetitem(position, compacted)
+        memoria_despues -= antes - despues
+        columnas_convertidas[str(df.columns[position])] = f"{column.dtype} -> {compacted.dtype}"
+
+    df.attrs['compactacion'] = {
+        'memoria_antes_mb': memoria_antes / 1024 / 1024,
+        'memoria_despues_mb': memoria_despues / 1024 / 1024,
+        'columnas_convertidas': columnas_convertidas,
+    }
     return df
 
+def _compactar_columna(column: pd.Series, category_max_ratio: float, arrow_strings: bool) -> pd.Series | None:
+    """
+    Calcular la versión compacta de una columna, o None si no aplica
+    """
+    if pd.api.types.is_bool_dtype(column) or len(column) == 0:
+        return None
+    if pd.api.types.is_integer_dtype(column):
+        return pd.to_numeric(column, downcast='integer')
+    if pd.api.types.is_float_dtype(column):
+        if column.dtype != np.float64:
+            return None
+        reduced = column.astype(np.float32)
+        # Solo sin pérdida: cada valor debe volver idéntico (los NaN se conservan)
+        if ((reduced.astype(np.float64) == column) | column.isna()).all():
+            return reduced
+        return None
+
+    is_text = pd.api.types.is_string_dtype(column) or (
+        column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string'
+    )
+    if not is_text:
+        return None
+    if column.nunique(dropna=True) <= category_max_ratio * len(column):
+        return column.astype('category')
+    if arrow_strings and column.dtype == object:
+        return column.astype('string[pyarrow]')
+    return None
+
 def get_supported_file_formats() -> list:
     """
     Get list of all supported file formats
@@ -223,7 +638,7 @@ def obtener_estadisticas_basicas(df: pd.DataFrame) -> dict:
             'total_filas': len(df),
             'total_columnas': len(df.columns),
             'columnas_numericas': len(df.select_dtypes(include=['number']).columns),
-            'columnas_texto': len(df.select_dtypes(include=['object']).columns),
+            'columnas_texto': len(df.select_dtypes(include=['object', 'category', 'string']).columns),
             'columnas_fecha': len(df.select_dtypes(include=['datetime']).columns),
             'memoria_uso_mb': df.memory_usage(deep=True).sum() / 1024 / 1024,
             'filas_duplicadas': df.duplicated(keep=False).sum(),
@@ -564,7 +979,7 @@ def agregar_datos(df: pd.DataFrame, operaciones: list) -> pd.DataFrame:
         try:
             if grupo:
                 # Agregación por grupos
-                df_agregado = df.groupby(grupo).agg(funciones).reset_index()
+                df_agregado = df.groupby(grupo, observed=True).agg(funciones).reset_index()
             else:
                 # Agregación global
                 df_agregado = df.agg(funciones).to_frame().T.reset_index(drop=True)
@@ -956,7 +1371,7 @@ class ExcelTemplateSplitter:
         
         try:
             # Obtener grupos únicos
-            groups = list(self.df.groupby(self.config.separator_column))
+            groups = list(self.df.groupby(self.config.separator_column, observed=True))
             
             for group_name, group_df in groups:
                 # Generar nombre de archivo
@@ -1087,7 +1502,7 @@ class ExcelTemplateSplitter:
         groups_processed = 0
         group_errors = []
         
-        for group_name, group_df in self.df.groupby(self.config.separator_column):
+        for group_name, group_df in self.df.groupby(self.config.separator_column, observed=True):
             try:
                 # Verificar cancelación
                 if hasattr(self, '_cancelled') and self._cancelled:
@@ -1277,15 +1692,15 @@ class ExcelTemplateSplitter:
         counter = 1
         
         while True:
-            new_path = f"{name_part}_{counter:02d}{ext}"
-            if not Path(new_path).exists():
-                return new_path
+            new_path = p.with_name(f"{name_part}_{counter:02d}{ext}")
+            if not new_path.exists():
+                return str(new_path)
             counter += 1
             
             # Límite de seguridad
             if counter > 999:
                 timestamp = str(int(time.time()))
-                return f"{name_part}_{timestamp}{ext}"
+                return str(p.with_name(f"{name_part}_{timestamp}{ext}"))
     
     def cancel_operation(self) -> None:
         """Cancelar operación en curso"""
@@ -0,0 +1,265 @@
+"""
+Caché persistente de datasets parseados
+
+Guarda una copia columnar (Feather/Arrow IPC sin comprimir) de cada archivo
+parseado en ~/.flashsheet/cache. La clave combina la ruta resuelta, el tamaño,
+la fecha de modificación y las opciones de carga, así que editar el archivo o
+cambiar las opciones invalida la entrada. Al reabrirlo la copia se lee mapeada
+en memoria en lugar de volver a parsear el original: las columnas numéricas
+sin nulos y el texto quedan como vistas del mapa, y el sistema operativo solo
+carga las páginas que se tocan.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather, ipc
+
+from config import optimization_config
+
+# Formato de las entradas; cambiarlo invalida las copias escritas por versiones anteriores
+CACHE_FORMAT_VERSION = 1
+
+_INDEX_FILE = "index.json"
+
+
+def _default_cache_dir() -> Path:
+    return Path.home() / ".flashsheet" / "cache"
+
+
+def build_cache_key(filepath: str, **options: Any) -> str:
+    """
+    Calcular la clave de caché de un archivo y sus opciones de carga
+
+    Args:
+        filepath: Ruta del archivo original
+        **options: Opciones que cambian el resultado (skip_rows, separator, sheet_name, ...)
+
+    Returns:
+        Hash hexadecimal de la huella del archivo y las opciones
+    """
+    path = Path(filepath).resolve()
+    stat = path.stat()
+    fingerprint = {
+        'version': CACHE_FORMAT_VERSION,
+        'path': str(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'options': {name: value for name, value in sorted(options.items())},
+    }
+    encoded = json.dumps(fingerprint, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def _leer_copia_mapeada(entry_path: Path) -> pd.DataFrame:
+    """
+    Leer una copia Feather como DataFrame cuyas columnas apuntan al archivo mapeado
+
+    El archivo se mapea en modo copy-on-write (np.memmap 'c') y se convierte
+    con split_blocks y self_destruct. Las columnas numéricas y de fecha sin
+    nulos y los códigos de las category quedan como vistas del mapa: el
+    sistema operativo solo carga las páginas que se leen, y escribir en una
+    columna copia solo las páginas tocadas, sin cambiar la copia en disco.
+    Arrow marca esas vistas como de solo lectura, así que se rehacen sobre el
+    mismo mapa. El texto queda en arrays de Arrow sobre el mapa; las columnas
+    con nulos, los booleanos y las fechas con zona horaria sí se copian a
+    memoria de pandas.
+    """
+    mapped = np.memmap(entry_path, dtype=np.uint8, mode='c')
+    table = ipc.open_file(pa.BufferReader(pa.py_buffer(mapped))).read_all()
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+
+    inicio = mapped.ctypes.data
+    for position in range(df.shape[1]):
+        column = df.iloc[:, position]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            data = column.array.codes
+        elif isinstance(column.dtype, np.dtype):
+            data = column.to_numpy()
+        else:
+            if isinstance(column.dtype, pd.DatetimeTZDtype):
+                # Sin constructor público sobre un array existente: se copia para poder editarla
+                df.isetitem(position, column.copy())
+            continue
+        address = data.__array_interface__['data'][0]
+        if not inicio <= address < inicio + mapped.size:
+            continue
+        view = np.ndarray(data.shape, data.dtype, buffer=mapped, offset=address - inicio, strides=data.strides)
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            view = pd.Categorical.from_codes(view, dtype=column.dtype, validate=False)
+        df.isetitem(position, pd.Series(view, index=df.index, name=column.name, copy=False))
+    return df
+
+
+class DatasetCache:
+    """
+    Caché en disco de DataFrames con límite de tamaño y expulsión LRU
+
+    El índice (index.json) guarda por clave el tamaño de la copia y el archivo
+    de origen; solo se reescribe al guardar o borrar entradas. El último acceso
+    es la fecha de modificación de la copia, que cada lectura actualiza, y al
+    superar max_bytes se borran las entradas usadas hace más tiempo.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None, max_bytes: int = 2 * 1024 * 1024 * 1024) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else _default_cache_dir()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # Sin carpeta de caché las escrituras fallan y las lecturas no encuentran nada
+            pass
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.feather"
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        path = self.cache_dir / _INDEX_FILE
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _write_index(self, index: dict[str, dict[str, Any]]) -> None:
+        path = self.cache_dir / _INDEX_FILE
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """
+        Leer una entrada mapeando en memoria su copia Feather
+
+        Las columnas numéricas, de fecha, category y texto no se copian: son
+        vistas del archivo mapeado (ver _leer_copia_mapeada).
+
+        Returns:
+            DataFrame almacenado, o None si no existe o no se puede leer
+        """
+        with self._lock:
+            entry_path = self._entry_path(key)
+            if not entry_path.exists():
+                return None
+            try:
+                df = _leer_copia_mapeada(entry_path)
+            except Exception:
+                index = self._read_index()
+                self._remove_entry(index, key)
+                self._write_index(index)
+                return None
+            try:
+                # Marcar el acceso para la expulsión LRU sin reescribir el índice
+                os.utime(entry_path)
+            except OSError:
+                pass
+            return df
+
+    def put(self, key: str, df: pd.DataFrame, source: str = "") -> bool:
+        """
+        Guardar un DataFrame y expulsar las entradas menos recientes si se supera el límite
+
+        Args:
+            key: Clave calculada con build_cache_key
+            df: Datos parseados
+            source: Ruta del archivo original (informativa)
+
+        Returns:
+            True si la copia se guardó; False si los datos no se pueden
+            representar en Arrow o la copia no cabe en la caché
+        """
+        with self._lock:
+            entry_path = self._entry_path(key)
+            tmp_path = entry_path.with_suffix('.tmp')
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                # Sin compresión y en un solo lote: la lectura convierte las columnas
+                # en vistas del archivo mapeado (varios lotes obligarían a unirlos copiando)
+                feather.write_feather(table, tmp_path, compression='uncompressed', chunksize=max(table.num_rows, 1))
+                size = tmp_path.stat().st_size
+                if size > self.max_bytes:
+                    tmp_path.unlink()
+                    return False
+                os.replace(tmp_path, entry_path)
+            except Exception:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                return False
+
+            index = self._read_index()
+            index[key] = {'size': size, 'source': source}
+            self._evict(index, keep=key)
+            self._write_index(index)
+            return True
+
+    def _last_access(self, key: str) -> float:
+        try:
+            return self._entry_path(key).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def _evict(self, index: dict[str, dict[str, Any]], keep: str | None = None) -> None:
+        total = sum(entry.get('size', 0) for entry in index.values())
+        by_age = sorted(index, key=self._last_access)
+        for key in by_age:
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= index[key].get('size', 0)
+            self._remove_entry(index, key)
+
+    def _remove_entry(self, index: dict[str, dict[str, Any]], key: str) -> None:
+        index.pop(key, None)
+        try:
+            self._entry_path(key).unlink()
+        except OSError:
+            # Ya borrada, o todavía mapeada por un DataFrame en Windows
+            pass
+
+    def total_bytes(self) -> int:
+        """
+        Obtener el espacio ocupado por las copias en caché
+        """
+        with self._lock:
+            return sum(entry.get('size', 0) for entry in self._read_index().values())
+
+    def clear(self) -> int:
+        """
+        Borrar todas las copias en caché, incluidas las escrituras interrumpidas (.tmp)
+
+        Returns:
+            Bytes liberados
+        """
+        with self._lock:
+            freed = 0
+            for pattern in ("*.feather", "*.tmp"):
+                for path in self.cache_dir.glob(pattern):
+                    try:
+                        size = path.stat().st_size
+                        path.unlink()
+                    except OSError:
+                        continue
+                    freed += size
+            self._write_index({})
+            return freed
+
+
+# Caché global de la aplicación
+dataset_cache = DatasetCache(max_bytes=optimization_config.DATASET_CACHE_MAX_BYTES)
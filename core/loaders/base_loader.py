@@ -4,9 +4,63 @@ Abstract base class for all file format loaders
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator
 import pandas as pd
 from pathlib import Path
+from .compression import get_compression, get_data_extension, estimate_compressed_line_count
+
+# Sampling parameters for estimate_line_count
+SAMPLE_BLOCKS = 8
+SAMPLE_BLOCK_SIZE = 64 * 1024
+COUNT_BLOCK_SIZE = 1024 * 1024
+
+def estimate_line_count(filepath: str, exact: bool = False) -> int:
+    """
+    Estimate the number of lines in a text file without scanning all of it
+    
+    Reads a few evenly spaced blocks, measures the average line length and
+    extrapolates to the file size. Small files, or exact=True, are counted
+    exactly with buffered binary reads. Compressed files are estimated from a
+    decompressed sample of their start.
+    
+    Args:
+        filepath: Path to the file
+        exact: Count every newline instead of sampling
+        
+    Returns:
+        Number of lines (estimated unless exact=True or the file is small)
+    """
+    file_size = Path(filepath).stat().st_size
+    if file_size == 0:
+        return 0
+    if get_compression(filepath):
+        return estimate_compressed_line_count(filepath)
+    
+    with open(filepath, 'rb') as f:
+        if exact or file_size <= SAMPLE_BLOCKS * SAMPLE_BLOCK_SIZE:
+            newlines = 0
+            last_byte = b''
+            while True:
+                block = f.read(COUNT_BLOCK_SIZE)
+                if not block:
+                    break
+                newlines += block.count(b'\n')
+                last_byte = block[-1:]
+            return newlines + (0 if last_byte == b'\n' else 1)
+        
+        sampled_bytes = 0
+        sampled_newlines = 0
+        step = (file_size - SAMPLE_BLOCK_SIZE) / (SAMPLE_BLOCKS - 1)
+        for i in range(SAMPLE_BLOCKS):
+            f.seek(int(i * step))
+            block = f.read(SAMPLE_BLOCK_SIZE)
+            sampled_bytes += len(block)
+            sampled_newlines += block.count(b'\n')
+    
+    if sampled_newlines == 0:
+        return 1
+    average_line_length = sampled_bytes / sampled_newlines
+    return max(1, round(file_size / average_line_length))
 
 class FileLoader(ABC):
     """
@@ -14,8 +68,12 @@ class FileLoader(ABC):
     All specific file loaders should inherit from this class
     """
 
+    # Text formats that can be read through a decompressing stream set this to True
+    supports_compression: bool = False
+
     def __init__(self, filepath: str) -> None:
         self.filepath = filepath
+        self.compression = get_compression(filepath)
         self._validate_file()
 
     def _validate_file(self) -> None:
@@ -24,7 +82,10 @@ class FileLoader(ABC):
         if not p.exists():
             raise FileNotFoundError(f"File not found: {self.filepath}")
         
-        extension = p.suffix.lower()
+        if self.compression and not self.supports_compression:
+            raise ValueError(f"Compressed files are not supported by {self.__class__.__name__}")
+        
+        extension = get_data_extension(self.filepath)
         if extension not in self.get_supported_extensions():
             raise ValueError(
                 f"File format '{extension}' not supported by {self.__class__.__name__}. "
@@ -86,6 +147,22 @@ class FileLoader(ABC):
             f"Chunk loading not supported by {self.__class__.__name__}"
         )
 
+    def iter_chunks(self, chunk_size: int = 1000) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the file as a sequence of DataFrame chunks
+
+        Loaders that can parse incrementally should override this so callers
+        receive rows as soon as they are parsed. The default implementation
+        yields the result of load_in_chunks() as a single chunk.
+
+        Args:
+            chunk_size: Number of rows per chunk
+
+        Yields:
+            DataFrame chunks in file order
+        """
+        yield self.load_in_chunks(chunk_size)
+
     def get_memory_usage_info(self) -> dict[str, Any]:
         """
         Get memory usage information for the file
@@ -112,9 +189,6 @@ class FileLoader(ABC):
             Estimated number of rows
         """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as _:
-                file_size = Path(self.filepath).stat().st_size
-                line_length = 100  # Rough estimate
-                return file_size // line_length
+            return estimate_line_count(self.filepath)
         except Exception:
             return 0
\ No newline at end of file
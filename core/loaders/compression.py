@@ -0,0 +1,171 @@
+"""
+Compressed Input
+Recognizes compound extensions (data.csv.gz) and decompresses files while they
+are read, without writing a decompressed copy to disk
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import zstandard
+    ZSTANDARD_AVAILABLE = True
+except ImportError:
+    ZSTANDARD_AVAILABLE = False
+
+# Compression suffix -> codec name
+COMPRESSION_EXTENSIONS: dict[str, str] = {
+    '.gz': 'gzip',
+    '.bz2': 'bz2',
+    '.xz': 'xz',
+    '.zst': 'zstd',
+}
+
+# Decompressed bytes sampled to estimate the line count of a compressed file
+LINE_SAMPLE_BYTES = 4 * 1024 * 1024
+READ_BLOCK_SIZE = 1024 * 1024
+
+def get_compression(filepath: str) -> str | None:
+    """
+    Get the codec implied by the file name (None for uncompressed files)
+    """
+    return COMPRESSION_EXTENSIONS.get(Path(filepath).suffix.lower())
+
+
+def get_data_extension(filepath: str) -> str:
+    """
+    Get the extension of the data format, ignoring a compression suffix
+
+    'events.json.bz2' -> '.json', 'data.csv' -> '.csv'
+    """
+    path = Path(filepath)
+    if path.suffix.lower() in COMPRESSION_EXTENSIONS:
+        return Path(path.stem).suffix.lower()
+    return path.suffix.lower()
+
+
+def get_extension(filepath: str) -> str:
+    """
+    Get the full extension, compound for compressed files
+
+    'data.csv.gz' -> '.csv.gz', 'data.csv' -> '.csv'
+    """
+    path = Path(filepath)
+    if path.suffix.lower() in COMPRESSION_EXTENSIONS:
+        return Path(path.stem).suffix.lower() + path.suffix.lower()
+    return path.suffix.lower()
+
+
+class SourceFile:
+    """
+    A data file opened for reading, decompressed on the fly when compressed
+
+    stream yields the decompressed bytes; position and size are measured on
+    the file itself (compressed offsets), so they drive byte-level progress.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+        self.compression = get_compression(filepath)
+        self.size = Path(filepath).stat().st_size
+        self._raw: BinaryIO = open(filepath, 'rb')
+        try:
+            self.stream: BinaryIO = self._decompress(self._raw)
+        except Exception:
+            self._raw.close()
+            raise
+
+    def _decompress(self, raw: BinaryIO) -> BinaryIO:
+        if self.compression is None:
+            return raw
+        if self.compression == 'gzip':
+            return gzip.GzipFile(fileobj=raw, mode='rb')
+        if self.compression == 'bz2':
+            return bz2.BZ2File(raw, mode='rb')
+        if self.compression == 'xz':
+            return lzma.LZMAFile(raw, mode='rb')
+        if ZSTANDARD_AVAILABLE:
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "zstandard or PyArrow is required to read .zst files. "
+                "Install it with: pip install zstandard"
+            )
+        return pa.CompressedInputStream(pa.PythonFile(raw, mode='r'), 'zstd')
+
+    @property
+    def input(self) -> Any:
+        """
+        What to hand to a parser: the path of an uncompressed file (so the parser
+        can use its own I/O) or the decompressed stream
+        """
+        return self.stream if self.compression else self.filepath
+
+    @property
+    def position(self) -> int:
+        """
+        Bytes of the file consumed so far
+        """
+        return self._raw.tell()
+
+    def estimate_total(self, items_read: int) -> int:
+        """
+        Extrapolate a total (rows, records) from the share of the file consumed
+        """
+        if self.position <= 0:
+            return items_read
+        return max(items_read, round(items_read * self.size / self.position))
+
+    def open_text(self, encoding: str = 'utf-8') -> io.TextIOWrapper:
+        """
+        Wrap the decompressed stream for text reads
+        """
+        return io.TextIOWrapper(self.stream, encoding=encoding)
+
+    def close(self) -> None:
+        try:
+            if self.stream is not self._raw:
+                self.stream.close()
+        finally:
+            self._raw.close()
+
+    def __enter__(self) -> 'SourceFile':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def open_source(filepath: str) -> SourceFile:
+    """
+    Open a data file for reading, decompressing it on the fly if needed
+    """
+    return SourceFile(filepath)
+
+
+def estimate_compressed_line_count(filepath: str) -> int:
+    """
+    Estimate the lines of a compressed text file from a decompressed sample
+
+    Decompresses up to LINE_SAMPLE_BYTES from the start and extrapolates the
+    lines per compressed byte to the file size.
+    """
+    with open_source(filepath) as source:
+        sampled = 0
+        newlines = 0
+        last_byte = b''
+        while sampled < LINE_SAMPLE_BYTES:
+            block = source.stream.read(READ_BLOCK_SIZE)
+            if not block:
+                # The whole file fit in the sample: the count is exact
+                return newlines + (0 if last_byte in (b'\n', b'') else 1)
+            sampled += len(block)
+            newlines += block.count(b'\n')
+            last_byte = block[-1:]
+        return source.estimate_total(newlines)
@@ -3,20 +3,42 @@ CSV/TSV File Loader
 Handles Comma-Separated Values and Tab-Separated Values formats
 """
 
+import io
 import pandas as pd
 from pathlib import Path
-from typing import Any
-from .base_loader import FileLoader
+from typing import Any, Callable, Iterator
+from .base_loader import FileLoader, estimate_line_count
+from .compression import get_data_extension, open_source
+from .csv_row_index import CsvRowIndex
+from .sampling import sample_lines
+from .selection import filter_table, required_columns, select_chunks, select_frame
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 class CsvLoader(FileLoader):
     """
     File loader for CSV and TSV formats
+
+    Parses with the multi-threaded pyarrow CSV reader when possible and falls
+    back to the pandas C parser for dialects pyarrow cannot handle.
+    Compressed files (data.csv.gz) are decompressed while they are parsed.
     """
 
+    supports_compression = True
+
+    # Set to False to always use the pandas parser
+    use_arrow_engine: bool = True
+
     def get_supported_extensions(self) -> list[str]:
         return ['.csv', '.tsv']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, separator: str | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load CSV/TSV file into DataFrame
         
@@ -24,25 +46,27 @@ class CsvLoader(FileLoader):
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
             separator: Custom separator character (overrides default detection)
+            columns: Columns to keep (None keeps all); other columns are not parsed
+            filters: Row filters as (column, operator, value) tuples combined with AND
             
         Returns:
             DataFrame with loaded data
         """
         try:
-            # Determine separator: explicit > extension-based > default comma
-            if separator is not None:
-                sep = separator
-            elif self.filepath.lower().endswith('.tsv'):
-                sep = '\t'
-            else:
-                sep = ','
+            sep = self._resolve_separator(separator)
+            
+            df = None
+            if self._can_use_arrow(sep):
+                try:
+                    df = self._load_with_arrow(sep, skip_rows, columns, filters)
+                except Exception as e:
+                    print(f"PyArrow CSV engine failed, falling back to pandas: {str(e)}")
             
-            # Load with skip_rows if specified
-            if skip_rows > 0:
-                df = pd.read_csv(self.filepath, sep=sep, header=skip_rows)
-                df = df.reset_index(drop=True)
-            else:
-                df = pd.read_csv(self.filepath, sep=sep)
+            if df is None:
+                with open_source(self.filepath) as source:
+                    df = pd.read_csv(source.input, sep=sep, skiprows=self._pandas_skiprows(skip_rows),
+                                     usecols=required_columns(columns, filters))
+                df = select_frame(df, columns, filters)
             
             # Apply column renaming if specified
             if column_names:
@@ -61,14 +85,15 @@ class CsvLoader(FileLoader):
             file_size = Path(self.filepath).stat().st_size
             
             # Get first few lines to detect delimiter
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                first_line = f.readline().strip()
-                delimiter = '\t' if self.filepath.lower().endswith('.tsv') else ','
+            with open_source(self.filepath) as source:
+                first_line = source.open_text().readline().strip()
+                delimiter = '\t' if get_data_extension(self.filepath) == '.tsv' else ','
                 delimiter = delimiter if delimiter in first_line else ','
             
             return {
                 'format': 'CSV/TSV',
                 'delimiter': delimiter,
+                'compression': self.compression,
                 'file_size_bytes': file_size,
                 'file_size_mb': round(file_size / (1024 * 1024), 6)
             }
@@ -87,30 +112,254 @@ class CsvLoader(FileLoader):
         Load CSV/TSV file in chunks for better memory management
         """
         try:
-            if separator is not None:
-                sep = separator
-            elif self.filepath.lower().endswith('.tsv'):
-                sep = '\t'
-            else:
-                sep = ','
-            
-            chunk_list = []
-            for chunk in pd.read_csv(self.filepath, sep=sep, chunksize=chunk_size):
-                chunk_list.append(chunk)
-            
+            chunk_list = list(self.iter_chunks(chunk_size, separator=separator))
             return pd.concat(chunk_list, ignore_index=True)
             
         except Exception as e:
             raise Exception(f"Error loading CSV/TSV file in chunks: {str(e)}")
 
+    def iter_chunks(self, chunk_size: int = 1000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    separator: str | None = None,
+                    progress_callback: Callable[[int, int], None] | None = None,
+                    columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream CSV/TSV file as DataFrame chunks while it is being parsed
+        
+        Args:
+            chunk_size: Number of rows per chunk
+            skip_rows: Number of rows to skip at the beginning (next row is the header)
+            column_names: Dictionary for renaming columns
+            separator: Custom separator character (overrides default detection)
+            progress_callback: Called with (rows_parsed, estimated_total_rows) before each chunk;
+                for compressed files the total is extrapolated from the compressed bytes consumed
+            columns: Columns to keep (None keeps all); other columns are not parsed
+            filters: Row filters applied to each parsed chunk; chunks with no
+                matching rows are skipped (an empty frame is yielded if nothing matches)
+            
+        Yields:
+            DataFrame chunks with the same columns and options as load()
+        """
+        sep = self._resolve_separator(separator)
+        usecols = required_columns(columns, filters)
+        # Parsed rows, before filtering: a pandas fallback resumes after them
+        rows_done = 0
+        total_rows = self.count_rows() if progress_callback is not None and not self.compression else 0
+        
+        def report(source: Any, rows: int) -> None:
+            if progress_callback is not None:
+                progress_callback(rows, source.estimate_total(rows) if self.compression else max(total_rows, rows))
+        
+        def parsed_with_arrow(source: Any) -> Iterator[pd.DataFrame]:
+            nonlocal rows_done
+            for chunk in self._iter_chunks_arrow(source.input, sep, skip_rows, chunk_size, usecols):
+                rows_done += len(chunk)
+                report(source, rows_done)
+                yield chunk
+        
+        def parsed_with_pandas(source: Any) -> Iterator[pd.DataFrame]:
+            nonlocal rows_done
+            rows_parsed = 0
+            with pd.read_csv(source.input, sep=sep, skiprows=self._pandas_skiprows(skip_rows),
+                             chunksize=chunk_size, usecols=usecols) as reader:
+                for chunk in reader:
+                    rows_parsed += len(chunk)
+                    # Skip rows already delivered by the pyarrow engine
+                    if rows_done >= len(chunk):
+                        rows_done -= len(chunk)
+                        continue
+                    if rows_done:
+                        chunk = chunk.iloc[rows_done:]
+                        rows_done = 0
+                    report(source, rows_parsed)
+                    yield chunk
+        
+        if self._can_use_arrow(sep):
+            try:
+                with open_source(self.filepath) as source:
+                    for chunk in select_chunks(parsed_with_arrow(source), columns, filters):
+                        yield chunk.rename(columns=column_names) if column_names else chunk
+                return
+            except Exception as e:
+                print(f"PyArrow CSV engine failed after {rows_done} rows, falling back to pandas: {str(e)}")
+        
+        with open_source(self.filepath) as source:
+            for chunk in select_chunks(parsed_with_pandas(source), columns, filters):
+                yield chunk.rename(columns=column_names) if column_names else chunk
+
+    def load_sample(self, n_rows: int, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    separator: str | None = None, seed: int | None = None) -> pd.DataFrame:
+        """
+        Load n_rows random data rows without parsing the whole file
+        
+        Rows are picked by sample_lines (random seeks on large uncompressed
+        files, one reservoir pass otherwise) and parsed under the header with
+        the same type inference as load(). Quoted values spanning several
+        lines are not supported.
+        
+        Args:
+            n_rows: Number of rows to sample (all rows if the file has fewer)
+            skip_rows: Number of rows to skip at the beginning (next row is the header)
+            column_names: Dictionary for renaming columns
+            separator: Custom separator character (overrides default detection)
+            seed: Seed for a reproducible sample
+            
+        Returns:
+            DataFrame with the sampled rows in file order
+        """
+        try:
+            sep = self._resolve_separator(separator)
+            sample = sample_lines(self.filepath, n_rows, skip_rows + 1, seed)
+            content = b''.join(sample.leading[skip_rows:] + sample.lines)
+            df = pd.read_csv(io.BytesIO(content), sep=sep)
+            if column_names:
+                df = df.rename(columns=column_names)
+            return df
+        except Exception as e:
+            raise Exception(f"Error sampling CSV/TSV file {self.filepath}: {str(e)}")
+
+    def _can_use_arrow(self, sep: str) -> bool:
+        """
+        Check whether the pyarrow engine can parse this dialect
+        (single-character, non-regex separators only)
+        """
+        return self.use_arrow_engine and PYARROW_AVAILABLE and len(sep) == 1
+
+    @staticmethod
+    def _pandas_skiprows(skip_rows: int) -> int | None:
+        """
+        Skip physical lines before the header, blank ones included, like the
+        pyarrow reader (pandas' header=N would count only non-blank lines)
+        """
+        return skip_rows if skip_rows > 0 else None
+
+    @staticmethod
+    def _arrow_options(sep: str, skip_rows: int, include_columns: list[str] | None = None) -> tuple[Any, Any, Any]:
+        """
+        Build pyarrow read/parse/convert options mirroring pandas.read_csv defaults
+        """
+        read_options = pa_csv.ReadOptions(use_threads=True, skip_rows=skip_rows)
+        parse_options = pa_csv.ParseOptions(delimiter=sep)
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True, include_columns=include_columns or [])
+        return read_options, parse_options, convert_options
+
+    def _load_with_arrow(self, sep: str, skip_rows: int, columns: list[str] | None = None,
+                         filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
+        """
+        Parse the whole file with the multi-threaded pyarrow CSV reader
+
+        Only the projected and filtered columns are converted, and rows are
+        filtered on the Arrow table before it becomes a DataFrame.
+        """
+        read_options, parse_options, convert_options = self._arrow_options(
+            sep, skip_rows, required_columns(columns, filters))
+        self._keep_temporal_as_text(read_options, parse_options, convert_options)
+        
+        with open_source(self.filepath) as source:
+            table = pa_csv.read_csv(source.input, read_options=read_options,
+                                    parse_options=parse_options, convert_options=convert_options)
+        return filter_table(table, filters, columns).to_pandas()
+
+    def _iter_chunks_arrow(self, csv_input: Any, sep: str, skip_rows: int, chunk_size: int,
+                           include_columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a path or decompressed stream with the pyarrow CSV reader, re-batched to chunk_size rows
+        """
+        read_options, parse_options, convert_options = self._arrow_options(sep, skip_rows, include_columns)
+        self._keep_temporal_as_text(read_options, parse_options, convert_options)
+        
+        with pa_csv.open_csv(csv_input, read_options=read_options,
+                             parse_options=parse_options, convert_options=convert_options) as reader:
+            pending: list[Any] = []
+            pending_rows = 0
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                while pending_rows >= chunk_size:
+                    table = pa.Table.from_batches(pending)
+                    yield table.slice(0, chunk_size).to_pandas()
+                    rest = table.slice(chunk_size)
+                    pending = rest.to_batches()
+                    pending_rows = rest.num_rows
+            if pending_rows:
+                yield pa.Table.from_batches(pending).to_pandas()
+
+    def _keep_temporal_as_text(self, read_options: Any, parse_options: Any, convert_options: Any) -> None:
+        """
+        Probe the schema of the first block and read date-like columns as text, as pandas does
+
+        The probe opens the file separately, so the reader that follows can
+        consume a decompressed stream from its start.
+        """
+        with open_source(self.filepath) as source:
+            with pa_csv.open_csv(source.input, read_options=read_options,
+                                 parse_options=parse_options, convert_options=convert_options) as reader:
+                schema = reader.schema
+        self._check_arrow_columns(schema.names)
+        convert_options.column_types = {
+            field.name: pa.string() for field in schema if self._is_temporal(field.type)
+        }
+
+    @staticmethod
+    def _check_arrow_columns(names: list[str]) -> None:
+        """
+        Reject headers pandas would rename (blank or duplicated names)
+        """
+        if any(name == '' for name in names) or len(set(names)) != len(names):
+            raise ValueError("Blank or duplicated column names require the pandas parser")
+
+    @staticmethod
+    def _is_temporal(arrow_type: Any) -> bool:
+        return pa.types.is_temporal(arrow_type)
+
+    def _resolve_separator(self, separator: str | None) -> str:
+        """
+        Determine separator: explicit > extension-based > default comma
+        """
+        if separator is not None:
+            return separator
+        if get_data_extension(self.filepath) == '.tsv':
+            return '\t'
+        return ','
+
+    def create_row_index(self, step: int = 1000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                         separator: str | None = None) -> CsvRowIndex:
+        """
+        Create a byte-offset row index for random access without loading the file
+        
+        The header is read immediately; call build() on the result (usually from a
+        background thread) to index the data rows.
+        
+        Args:
+            step: Number of rows between indexed offsets
+            skip_rows: Number of rows to skip at the beginning (next row is the header)
+            column_names: Dictionary for renaming columns
+            separator: Custom separator character (overrides default detection)
+            
+        Returns:
+            CsvRowIndex for this file
+        """
+        if self.compression:
+            raise ValueError("Compressed files cannot be indexed for random access")
+        return CsvRowIndex(self.filepath, self._resolve_separator(separator), skip_rows, column_names, step)
+
+    def count_rows(self, exact: bool = False) -> int:
+        """
+        Count data rows in the CSV/TSV file (header excluded)
+        
+        Args:
+            exact: Count every line instead of extrapolating from sampled blocks
+            
+        Returns:
+            Number of data rows (estimated unless exact=True or the file is small)
+        """
+        return max(0, estimate_line_count(self.filepath, exact=exact) - 1)
+
     def _estimate_rows(self) -> int:
         """
-        Estimate number of rows in CSV/TSV file
+        Estimate number of rows in CSV/TSV file by sampling
         """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                # Count lines efficiently
-                line_count = sum(1 for _ in f)
-                return line_count - 1  # Subtract header row
+            return self.count_rows()
         except Exception:
-            return super()._estimate_rows()
\ No newline at end of file
+            return super()._estimate_rows()
@@ -0,0 +1,133 @@
+"""
+CSV Row Index
+Byte-offset index for random access to rows of large CSV/TSV files
+"""
+
+import io
+from pathlib import Path
+from typing import Any, Callable
+import numpy as np
+import pandas as pd
+
+# Bytes read per block while scanning for newlines
+INDEX_BLOCK_SIZE = 4 * 1024 * 1024
+
+class CsvRowIndex:
+    """
+    Index of newline byte offsets for a CSV/TSV file
+
+    Stores the byte offset of every `step`-th data row, so any range of rows
+    can be parsed straight from disk by seeking to the nearest indexed row.
+    The index is built by a single sequential pass (build) and can be read
+    while it is still growing. Rows are delimited by physical lines, so quoted
+    values containing newlines are not supported.
+    """
+
+    def __init__(self, filepath: str, separator: str = ',', skip_rows: int = 0,
+                 column_names: dict[str, str] | None = None, step: int = 1000) -> None:
+        self.filepath = filepath
+        self.separator = separator
+        self.step = step
+        self.file_size: int = Path(filepath).stat().st_size
+        self.row_count: int = 0
+        self.bytes_indexed: int = 0
+        self.is_complete: bool = False
+        self._offsets: Any = []
+
+        self.columns: list[str] = []
+        self.data_start: int = 0
+        self._read_header(skip_rows, column_names)
+
+    def _read_header(self, skip_rows: int, column_names: dict[str, str] | None) -> None:
+        """
+        Read the header line (after skip_rows lines) and locate the first data row
+        """
+        with open(self.filepath, 'rb') as f:
+            for _ in range(skip_rows):
+                f.readline()
+            header_line = f.readline()
+            self.data_start = f.tell()
+
+        header = pd.read_csv(io.BytesIO(header_line), sep=self.separator, nrows=0)
+        if column_names:
+            header = header.rename(columns=column_names)
+        self.columns = [str(col) for col in header.columns]
+        self._offsets = [self.data_start] if self.data_start < self.file_size else []
+
+    def build(self, progress_callback: Callable[[int, int], None] | None = None,
+              should_stop: Callable[[], bool] | None = None) -> None:
+        """
+        Scan the file once, recording the offset of every `step`-th row
+
+        Args:
+            progress_callback: Called with (bytes_indexed, file_size) after each block
+            should_stop: Returns True to abort the scan early
+        """
+        offsets: list[int] = self._offsets
+        rows = 0
+        position = self.data_start
+        last_byte = b'\n'
+
+        with open(self.filepath, 'rb') as f:
+            f.seek(self.data_start)
+            while True:
+                if should_stop is not None and should_stop():
+                    return
+                block = f.read(INDEX_BLOCK_SIZE)
+                if not block:
+                    break
+
+                newline_positions = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 10)
+                # Row `rows + i + 1` starts right after the i-th newline of this block
+                row_numbers = rows + 1 + np.arange(len(newline_positions))
+                starts = newline_positions[row_numbers % self.step == 0] + position + 1
+                offsets.extend(int(start) for start in starts if start < self.file_size)
+
+                rows += len(newline_positions)
+                position += len(block)
+                last_byte = block[-1:]
+                self.row_count = rows
+                self.bytes_indexed = position
+                if progress_callback is not None:
+                    progress_callback(position, self.file_size)
+
+        # A final line without a trailing newline is still a row
+        if position > self.data_start and last_byte != b'\n':
+            self.row_count = rows + 1
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self.is_complete = True
+
+    def read_rows(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        Parse rows [start, stop) directly from disk
+
+        Args:
+            start: First row (0-based, header excluded)
+            stop: Row after the last one to read
+
+        Returns:
+            DataFrame indexed by absolute row position
+        """
+        stop = min(stop, self.row_count)
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        block = start // self.step
+        with open(self.filepath, 'rb') as f:
+            f.seek(int(self._offsets[block]))
+            df = pd.read_csv(
+                f, sep=self.separator, header=None, names=self.columns,
+                skiprows=start - block * self.step, nrows=stop - start,
+                skip_blank_lines=False
+            )
+
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def get_memory_usage(self) -> int:
+        """
+        Get the size in bytes of the offset array
+        """
+        if isinstance(self._offsets, np.ndarray):
+            return int(self._offsets.nbytes)
+        return len(self._offsets) * 8
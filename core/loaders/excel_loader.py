@@ -5,8 +5,16 @@ Handles Excel formats (.xlsx, .xls)
 
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from .base_loader import FileLoader
+from .excel_metadata import read_sheet_dimensions, count_xlsx_rows
+from .selection import required_columns, select_chunks, select_frame
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
 
 class ExcelLoader(FileLoader):
     """
@@ -16,7 +24,8 @@ class ExcelLoader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.xlsx', '.xls']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, sheet_name: str | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, sheet_name: str | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load Excel file into DataFrame
         
@@ -24,6 +33,8 @@ class ExcelLoader(FileLoader):
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
             sheet_name: Name of the sheet to load (default: first sheet)
+            columns: Columns to keep (projection); cells of other columns are not converted
+            filters: Row filters as (column, operator, value) tuples, combined with AND
             
         Returns:
             DataFrame with loaded data
@@ -31,13 +42,16 @@ class ExcelLoader(FileLoader):
         try:
             # Determine which sheet to load
             sheet = 0 if sheet_name is None else sheet_name
+            engine = 'calamine' if CALAMINE_AVAILABLE else None
+            usecols = required_columns(columns, filters)
 
             # For Excel, use header=skip_rows to use the row after skipping as header
             if skip_rows > 0:
-                df = pd.read_excel(self.filepath, sheet_name=sheet, header=skip_rows)
+                df = pd.read_excel(self.filepath, sheet_name=sheet, header=skip_rows, engine=engine, usecols=usecols)
                 df = df.reset_index(drop=True)
             else:
-                df = pd.read_excel(self.filepath, sheet_name=sheet)
+                df = pd.read_excel(self.filepath, sheet_name=sheet, engine=engine, usecols=usecols)
+            df = select_frame(df, columns, filters)
             
             # Apply column renaming if specified
             if column_names:
@@ -65,11 +79,15 @@ class ExcelLoader(FileLoader):
                 sheets = ['Default']
                 sheet_count = 1
             
+            dimensions = read_sheet_dimensions(self.filepath)
+            
             return {
                 'format': 'Excel',
                 'extension': extension,
                 'sheets': sheets,
                 'sheet_count': sheet_count,
+                'rows': max(dimensions[0] - 1, 0) if dimensions else None,
+                'column_count': dimensions[1] if dimensions else None,
                 'file_size_bytes': file_size,
                 'file_size_mb': round(file_size / (1024 * 1024), 2)
             }
@@ -79,24 +97,242 @@ class ExcelLoader(FileLoader):
     @staticmethod
     def can_load_chunks() -> bool:
         """
-        Excel files do not support chunk loading directly
+        Excel files are streamed row by row (calamine or openpyxl read-only)
+        """
+        return True
+
+    def load_in_chunks(self, chunk_size: int = 10000, sheet_name: str | None = None) -> pd.DataFrame:
+        """
+        Load Excel file streaming its rows in chunks
+        """
+        try:
+            chunk_list = list(self.iter_chunks(chunk_size, sheet_name=sheet_name))
+            if not chunk_list:
+                return self.load(sheet_name=sheet_name)
+            return pd.concat(chunk_list, ignore_index=True)
+            
+        except Exception as e:
+            raise Exception(f"Error loading Excel file in chunks: {str(e)}")
+
+    def iter_chunks(self, chunk_size: int = 10000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    sheet_name: str | None = None,
+                    progress_callback: Callable[[int, int], None] | None = None,
+                    columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a sheet as DataFrame chunks
+        
+        Rows are read with calamine when installed, otherwise with openpyxl in
+        read-only mode (.xlsx only; .xls without calamine is loaded in one chunk).
+        Like read_excel, the row after skip_rows is the header and trailing
+        empty rows are dropped.
+        
+        Args:
+            chunk_size: Number of rows per chunk
+            skip_rows: Number of rows to skip at the beginning (next row is the header)
+            column_names: Dictionary for renaming columns
+            sheet_name: Name of the sheet to load (default: first sheet)
+            progress_callback: Called with (rows_parsed, total_rows) after each chunk;
+                when the sheet does not declare its size, total_rows is extrapolated
+                from the bytes of sheet XML read so far (openpyxl), else it is rows_parsed
+            columns: Columns to keep (projection); cells of other columns are dropped as rows are read
+            filters: Row filters as (column, operator, value) tuples, combined with AND
+            
+        Yields:
+            DataFrame chunks in sheet order; chunks left empty by the filters are skipped
         """
-        return False
+        estimate_total: Callable[[int], int] | None = None
+        if CALAMINE_AVAILABLE:
+            rows, total_rows = self._iter_calamine_rows(sheet_name)
+        elif Path(self.filepath).suffix.lower() == '.xlsx':
+            rows, total_rows, estimate_total = self._iter_openpyxl_rows(sheet_name)
+        else:
+            df = self.load(skip_rows, column_names, sheet_name=sheet_name, columns=columns, filters=filters)
+            if progress_callback is not None:
+                progress_callback(len(df), len(df))
+            yield df
+            return
+
+        for chunk in select_chunks(self._iter_frames(rows, total_rows, chunk_size, skip_rows,
+                                                     required_columns(columns, filters), progress_callback,
+                                                     estimate_total),
+                                   columns, filters):
+            yield chunk.rename(columns=column_names) if column_names else chunk
+
+    def _iter_frames(self, rows: Iterator[tuple[Any, ...]], total_rows: int, chunk_size: int, skip_rows: int,
+                     usecols: list[str] | None,
+                     progress_callback: Callable[[int, int], None] | None,
+                     estimate_total: Callable[[int], int] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Group sheet rows into DataFrame chunks, keeping only usecols when given
+
+        estimate_total extrapolates the row count from the rows read so far
+        when the sheet does not declare it (total_rows 0).
+        """
+        for _ in range(skip_rows):
+            if next(rows, None) is None:
+                return
+        header = next(rows, None)
+        if header is None:
+            return
+        header = self._trim_row(header)
+        total_rows = max(total_rows - skip_rows - 1, 0)
+
+        buffer: list[tuple[Any, ...]] = []
+        pending_empty: list[tuple[Any, ...]] = []
+        rows_parsed = 0
+        for row in rows:
+            row = self._trim_row(row)
+            # Empty rows are kept only if data follows them
+            if not row:
+                pending_empty.append(row)
+                continue
+            buffer.extend(pending_empty)
+            pending_empty = []
+            buffer.append(row)
+            if len(buffer) >= chunk_size:
+                rows_parsed += len(buffer)
+                if progress_callback is not None:
+                    expected = total_rows or (estimate_total(rows_parsed) if estimate_total is not None else 0)
+                    progress_callback(rows_parsed, max(expected, rows_parsed))
+                yield self._rows_to_frame(header, buffer, usecols)
+                buffer = []
+
+        if buffer:
+            rows_parsed += len(buffer)
+            if progress_callback is not None:
+                progress_callback(rows_parsed, rows_parsed)
+            yield self._rows_to_frame(header, buffer, usecols)
+
+    def _iter_openpyxl_rows(self, sheet_name: str | None) -> tuple[Iterator[tuple[Any, ...]], int, Callable[[int], int]]:
+        """
+        Open a sheet with openpyxl in read-only mode
+
+        The read-only worksheet parses its XML from a stream it opens in the
+        workbook archive; that stream is kept to know how many bytes of the
+        sheet have been read.
+
+        Returns:
+            Tuple (row value iterator, declared row count or 0,
+            function extrapolating the row count from the bytes read)
+        """
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(self.filepath, read_only=True, data_only=True)
+        worksheet = workbook[sheet_name] if sheet_name is not None else workbook.worksheets[0]
+
+        streams: list[Any] = []
+        open_source = worksheet._get_source
+
+        def tracked_source() -> Any:
+            stream = open_source()
+            streams.append(stream)
+            return stream
+
+        worksheet._get_source = tracked_source
+        xml_size = workbook._archive.getinfo(worksheet._worksheet_path).file_size
+
+        def estimate_total(rows_read: int) -> int:
+            try:
+                position = streams[-1].tell() if streams else 0
+            except (OSError, ValueError):
+                return rows_read
+            if position <= 0:
+                return rows_read
+            return max(rows_read, round(rows_read * xml_size / position))
+
+        def rows() -> Iterator[tuple[Any, ...]]:
+            try:
+                yield from worksheet.iter_rows(values_only=True)
+            finally:
+                workbook.close()
+
+        return rows(), worksheet.max_row or 0, estimate_total
+
+    def _iter_calamine_rows(self, sheet_name: str | None) -> tuple[Iterator[tuple[Any, ...]], int]:
+        """
+        Open a sheet with calamine
+
+        Returns:
+            Tuple (row value iterator, row count)
+        """
+        workbook = CalamineWorkbook.from_path(self.filepath)
+        sheet = workbook.get_sheet_by_name(sheet_name) if sheet_name is not None else workbook.get_sheet_by_index(0)
+        # calamine reports empty cells as ''
+        rows = (tuple(None if value == '' else value for value in row) for row in sheet.iter_rows())
+        return rows, sheet.total_height
+
+    @staticmethod
+    def _trim_row(row: tuple[Any, ...]) -> tuple[Any, ...]:
+        """
+        Drop trailing empty cells
+        """
+        end = len(row)
+        while end > 0 and row[end - 1] is None:
+            end -= 1
+        return tuple(row[:end])
+
+    @staticmethod
+    def _rows_to_frame(header: tuple[Any, ...], rows: list[tuple[Any, ...]],
+                       usecols: list[str] | None = None) -> pd.DataFrame:
+        """
+        Build a chunk from buffered rows, naming columns like read_excel
+
+        Only the cells of usecols are converted when it is given
+        """
+        width = max(len(header), max(len(row) for row in rows))
+        columns: list[Any] = []
+        seen: dict[Any, int] = {}
+        for i in range(width):
+            name = header[i] if i < len(header) and header[i] is not None else f"Unnamed: {i}"
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+
+        if usecols is not None:
+            positions = [i for i, name in enumerate(columns) if name in usecols]
+            columns = [columns[i] for i in positions]
+            rows = [tuple(row[i] if i < len(row) else None for i in positions) for row in rows]
+            width = len(columns)
+
+        # read_excel stores integral floats as int
+        records = [
+            tuple(int(value) if isinstance(value, float) and value.is_integer() else value for value in row)
+            + (None,) * (width - len(row))
+            for row in rows
+        ]
+        return pd.DataFrame.from_records(records, columns=columns).infer_objects()
+
+    def count_rows(self, sheet_name: str | None = None) -> int:
+        """
+        Count data rows of a sheet (header excluded) from workbook metadata
+        
+        Uses the sheet's recorded dimension; only when it is missing are the
+        rows counted by streaming the sheet.
+        
+        Args:
+            sheet_name: Sheet to inspect (default: first sheet)
+            
+        Returns:
+            Number of data rows
+        """
+        dimensions = read_sheet_dimensions(self.filepath, sheet_name)
+        if dimensions is not None:
+            return max(dimensions[0] - 1, 0)
+
+        rows = count_xlsx_rows(self.filepath, sheet_name) if Path(self.filepath).suffix.lower() == '.xlsx' else None
+        if rows is None:
+            rows = sum(len(chunk) for chunk in self.iter_chunks(sheet_name=sheet_name)) + 1
+        return max(rows - 1, 0)
 
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in Excel file
         """
         try:
-            # Load a small sample to count rows
-            df_sample = pd.read_excel(self.filepath, nrows=1000)
-            file_size = Path(self.filepath).stat().st_size
-            
-            # Rough estimation based on file size
-            sample_size = 1000
-            sample_estimated_size = len(df_sample) * len(df_sample.columns) * 10  # rough estimate
-            if sample_estimated_size > 0:
-                return int((file_size / sample_estimated_size) * sample_size)
-            return 0
+            return self.count_rows()
         except Exception:
-            return super()._estimate_rows()
\ No newline at end of file
+            return 0
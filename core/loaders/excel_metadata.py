@@ -0,0 +1,233 @@
+"""
+Excel Sheet Metadata
+Reads sheet sizes from workbook metadata without parsing cells:
+the <dimension> element of .xlsx worksheets and the BIFF DIMENSIONS record of .xls
+"""
+
+import mmap
+import re
+import struct
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Iterator
+
+# Bytes of worksheet XML searched for <dimension>; it precedes <sheetData>
+DIMENSION_SEARCH_BYTES = 16 * 1024
+# Decompressed bytes read per block when counting <row> elements
+ROW_COUNT_BLOCK_SIZE = 1024 * 1024
+
+_DIMENSION_RE = re.compile(rb'<(?:\w+:)?dimension\s+ref="\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?"')
+_ROW_RE = re.compile(rb'<(?:\w+:)?row[\s>/]')
+
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+_CFB_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+_CFB_END_OF_CHAIN = 0xFFFFFFFA
+
+_BIFF_EOF = 0x000A
+_BIFF_BOUNDSHEET = 0x0085
+_BIFF_DIMENSIONS = 0x0200
+
+def read_sheet_dimensions(filepath: str, sheet_name: str | None = None) -> tuple[int, int] | None:
+    """
+    Get the used range size of a sheet from workbook metadata
+
+    Args:
+        filepath: Path to the .xlsx or .xls file
+        sheet_name: Sheet to inspect (default: first sheet)
+
+    Returns:
+        Tuple (rows, columns) of the used range including the header row,
+        or None if the workbook does not record it
+    """
+    try:
+        if Path(filepath).suffix.lower() == '.xls':
+            return _read_xls_dimensions(filepath, sheet_name)
+        return _read_xlsx_dimensions(filepath, sheet_name)
+    except Exception:
+        return None
+
+
+def count_xlsx_rows(filepath: str, sheet_name: str | None = None) -> int | None:
+    """
+    Count <row> elements by streaming the worksheet XML (no cell parsing)
+
+    Returns:
+        Number of rows including the header row, or None if the file cannot be read
+    """
+    try:
+        with zipfile.ZipFile(filepath) as archive:
+            with archive.open(_xlsx_sheet_member(archive, sheet_name)) as sheet:
+                rows = 0
+                tail = b''
+                while True:
+                    block = sheet.read(ROW_COUNT_BLOCK_SIZE)
+                    if not block:
+                        break
+                    # Carry a few bytes so tags split across blocks are counted once
+                    data = tail + block
+                    rows += len(_ROW_RE.findall(data, 0, max(len(data) - 16, 0)))
+                    tail = data[max(len(data) - 16, 0):]
+                rows += len(_ROW_RE.findall(tail))
+                return rows
+    except Exception:
+        return None
+
+
+def _column_number(letters: bytes) -> int:
+    number = 0
+    for letter in letters:
+        number = number * 26 + (letter - ord('A') + 1)
+    return number
+
+
+def _xlsx_sheet_member(archive: zipfile.ZipFile, sheet_name: str | None) -> str:
+    """
+    Resolve the zip member holding a worksheet through workbook.xml and its relationships
+    """
+    workbook = ET.fromstring(archive.read('xl/workbook.xml'))
+    sheets = workbook.findall(f'{_NS_MAIN}sheets/{_NS_MAIN}sheet')
+    if sheet_name is None:
+        sheet = sheets[0]
+    else:
+        sheet = next(s for s in sheets if s.get('name') == sheet_name)
+    relation_id = sheet.get(f'{_NS_REL}id')
+
+    relations = ET.fromstring(archive.read('xl/_rels/workbook.xml.rels'))
+    target = next(r.get('Target') for r in relations.iter(f'{_NS_PKG_REL}Relationship')
+                  if r.get('Id') == relation_id)
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join('xl', target))
+
+
+def _read_xlsx_dimensions(filepath: str, sheet_name: str | None) -> tuple[int, int] | None:
+    with zipfile.ZipFile(filepath) as archive:
+        with archive.open(_xlsx_sheet_member(archive, sheet_name)) as sheet:
+            head = sheet.read(DIMENSION_SEARCH_BYTES)
+
+    match = _DIMENSION_RE.search(head)
+    # A single-cell ref ("A1") is what writers emit when they do not track the range
+    if match is None or match.group(3) is None:
+        return None
+    first_col, first_row, last_col, last_row = match.groups()
+    return int(last_row) - int(first_row) + 1, _column_number(last_col) - _column_number(first_col) + 1
+
+
+class _CfbStream:
+    """
+    Read-only access to one stream of an OLE2 compound file (the .xls container)
+    """
+
+    def __init__(self, data: mmap.mmap, name: str) -> None:
+        if data[:8] != _CFB_MAGIC:
+            raise ValueError("Not a compound file")
+        self._data = data
+        self._sector_size = 1 << struct.unpack_from('<H', data, 0x1E)[0]
+        fat_count, directory_start = struct.unpack_from('<II', data, 0x2C)
+        mini_cutoff, = struct.unpack_from('<I', data, 0x38)
+        difat_start, difat_count = struct.unpack_from('<II', data, 0x44)
+
+        # FAT sector numbers: 109 in the header, the rest in the DIFAT chain
+        fat_sectors = list(struct.unpack_from('<109I', data, 0x4C))
+        per_sector = self._sector_size // 4
+        sector = difat_start
+        for _ in range(difat_count):
+            entries = struct.unpack_from(f'<{per_sector}I', data, self._offset(sector))
+            fat_sectors.extend(entries[:-1])
+            sector = entries[-1]
+        self._fat: list[int] = []
+        for sector in fat_sectors[:fat_count]:
+            self._fat.extend(struct.unpack_from(f'<{per_sector}I', data, self._offset(sector)))
+
+        for sector in self._chain(directory_start):
+            base = self._offset(sector)
+            for entry in range(base, base + self._sector_size, 128):
+                name_size, entry_type = struct.unpack_from('<HB', data, entry + 0x40)
+                entry_name = bytes(data[entry:entry + max(name_size - 2, 0)]).decode('utf-16-le')
+                if entry_type == 2 and entry_name == name:
+                    start, size = struct.unpack_from('<II', data, entry + 0x74)
+                    if size < mini_cutoff:
+                        raise ValueError("Streams in the mini stream are not supported")
+                    self.size = size
+                    self._sectors = list(self._chain(start))
+                    return
+        raise ValueError(f"Stream not found: {name}")
+
+    def _offset(self, sector: int) -> int:
+        return (sector + 1) * self._sector_size
+
+    def _chain(self, start: int) -> list[int]:
+        sectors = []
+        sector = start
+        while sector < _CFB_END_OF_CHAIN and len(sectors) <= len(self._fat):
+            sectors.append(sector)
+            sector = self._fat[sector]
+        return sectors
+
+    def read(self, position: int, size: int) -> bytes:
+        """
+        Read bytes at a position of the stream, following the sector chain
+        """
+        result = b''
+        while size > 0 and position < self.size:
+            index, within = divmod(position, self._sector_size)
+            count = min(size, self._sector_size - within, self.size - position)
+            start = self._offset(self._sectors[index]) + within
+            result += self._data[start:start + count]
+            position += count
+            size -= count
+        return result
+
+
+def _iter_biff_records(stream: _CfbStream, position: int) -> Iterator[tuple[int, bytes]]:
+    """
+    Yield (record_type, data) from a position of a BIFF stream until its EOF record
+    """
+    while position + 4 <= stream.size:
+        record_type, length = struct.unpack('<HH', stream.read(position, 4))
+        yield record_type, stream.read(position + 4, length)
+        if record_type == _BIFF_EOF:
+            return
+        position += 4 + length
+
+
+def _read_xls_dimensions(filepath: str, sheet_name: str | None) -> tuple[int, int] | None:
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        try:
+            stream = _CfbStream(data, 'Workbook')
+            biff8 = True
+        except ValueError:
+            stream = _CfbStream(data, 'Book')
+            biff8 = False
+
+        # Workbook globals list each sheet's BOF position (BOUNDSHEET records)
+        sheet_position = None
+        for record_type, record in _iter_biff_records(stream, 0):
+            if record_type != _BIFF_BOUNDSHEET:
+                continue
+            name_length = record[6]
+            if not biff8:
+                name = record[7:7 + name_length].decode('latin-1')
+            elif record[7] & 1:
+                name = record[8:8 + name_length * 2].decode('utf-16-le')
+            else:
+                name = record[8:8 + name_length].decode('latin-1')
+            if sheet_name is None or name == sheet_name:
+                sheet_position = struct.unpack_from('<I', record, 0)[0]
+                break
+        if sheet_position is None:
+            return None
+
+        for record_type, record in _iter_biff_records(stream, sheet_position):
+            if record_type == _BIFF_DIMENSIONS:
+                if len(record) >= 14:  # BIFF8: 32-bit row numbers
+                    first_row, last_row_after, first_col, last_col_after = struct.unpack_from('<IIHH', record)
+                else:
+                    first_row, last_row_after, first_col, last_col_after = struct.unpack_from('<HHHH', record)
+                return last_row_after - first_row, last_col_after - first_col
+        return None
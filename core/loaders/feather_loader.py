@@ -7,6 +7,8 @@ import pandas as pd
 from pathlib import Path
 from typing import Any
 from .base_loader import FileLoader
+from .row_group_source import FeatherBatchSource, batch_in_memory_map
+from .selection import filter_table, required_columns
 
 class FeatherLoader(FileLoader):
     """
@@ -16,13 +18,17 @@ class FeatherLoader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.feather']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load Feather file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
+            columns: Columns to read (projection); other columns are not read from the file
+            filters: Row filters as (column, operator, value) tuples, applied to the
+                Arrow table before it is converted to pandas
             
         Returns:
             DataFrame with loaded data
@@ -37,12 +43,14 @@ class FeatherLoader(FileLoader):
                     "Install it with: pip install pyarrow"
                 )
             
-            # Load Feather file
-            df = pd.read_feather(self.filepath)
+            # Memory-map the file: uncompressed columns are read without an intermediate copy
+            import pyarrow.feather as pf
+            table = pf.read_table(self.filepath, columns=required_columns(columns, filters), memory_map=True)
             
             # Apply skip_rows if specified
-            if 0 < skip_rows < len(df):
-                df = df.iloc[skip_rows:].reset_index(drop=True)
+            if 0 < skip_rows < table.num_rows:
+                table = table.slice(skip_rows)
+            df = filter_table(table, filters, columns).to_pandas()
             
             # Apply column renaming if specified
             if column_names:
@@ -63,7 +71,7 @@ class FeatherLoader(FileLoader):
             # Get Feather metadata
             try:
                 import pyarrow.feather as pf
-                feather_file = pf.read_table(self.filepath)
+                feather_file = pf.read_table(self.filepath, memory_map=True)
                 
                 return {
                     'format': 'Feather',
@@ -72,6 +80,7 @@ class FeatherLoader(FileLoader):
                     'rows': len(feather_file),
                     'file_size_bytes': file_size,
                     'file_size_mb': round(file_size / (1024 * 1024), 2),
+                    'memory_mappable': self.is_memory_mappable(),
                     'pyarrow_version': pf.__version__
                 }
             except ImportError:
@@ -119,13 +128,43 @@ class FeatherLoader(FileLoader):
         except Exception as e:
             raise Exception(f"Error loading Feather file in chunks: {str(e)}")
 
+    def is_memory_mappable(self) -> bool:
+        """
+        Check whether record batches can be read zero-copy from a memory map
+        
+        True for uncompressed Feather v2 / Arrow IPC files: their columns point
+        straight into the OS page cache, shared by every process mapping the file.
+        Only the first batch is inspected.
+        """
+        try:
+            import pyarrow as pa
+            mapped = pa.memory_map(self.filepath, 'r')
+            reader = pa.ipc.open_file(mapped)
+            if reader.num_record_batches == 0:
+                return False
+            return batch_in_memory_map(mapped, reader.get_batch(0))
+        except Exception:
+            return False
+
+    def create_row_group_source(self) -> FeatherBatchSource:
+        """
+        Memory-map the file for random access by record batch without loading it
+        
+        Returns:
+            FeatherBatchSource for this file (uncompressed Feather v2 / Arrow IPC only)
+            
+        Raises:
+            ValueError: If the file is compressed (see is_memory_mappable)
+        """
+        return FeatherBatchSource(self.filepath)
+
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in Feather file
         """
         try:
             import pyarrow.feather as pf
-            feather_file = pf.read_table(self.filepath)
+            feather_file = pf.read_table(self.filepath, memory_map=True)
             return len(feather_file)
         except Exception:
             return super()._estimate_rows()
\ No newline at end of file
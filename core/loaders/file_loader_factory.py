@@ -6,6 +6,7 @@ Factory pattern for creating appropriate file loaders based on file extension
 from typing import Type, Any
 from pathlib import Path
 from .base_loader import FileLoader
+from .compression import COMPRESSION_EXTENSIONS, get_extension
 from .csv_loader import CsvLoader
 from .excel_loader import ExcelLoader
 from .json_loader import JsonLoader
@@ -32,12 +33,15 @@ class FileLoaderFactory:
             '.xlsx': ExcelLoader,
             '.xls': ExcelLoader,
             '.json': JsonLoader,
+            '.jsonl': JsonLoader,
+            '.ndjson': JsonLoader,
             '.xml': XmlLoader,
             
             # New formats to be implemented
             '.parquet': ParquetLoader,
             '.feather': FeatherLoader,
             '.hdf5': Hdf5Loader,
+            '.h5': Hdf5Loader,
             '.pkl': PickleLoader,
             '.pickle': PickleLoader,
             '.db': SqliteLoader,
@@ -45,6 +49,12 @@ class FileLoaderFactory:
             '.yaml': YamlLoader,
             '.yml': YamlLoader,
         }
+        
+        # Compressed text formats (data.csv.gz) are read by the loader of the inner format
+        for extension, loader_class in list(self._loader_mapping.items()):
+            if loader_class.supports_compression:
+                for compression_extension in COMPRESSION_EXTENSIONS:
+                    self._loader_mapping[extension + compression_extension] = loader_class
 
     def get_loader(self, filepath: str) -> FileLoader:
         """
@@ -62,7 +72,7 @@ class FileLoaderFactory:
         if not Path(filepath).exists():
             raise FileNotFoundError(f"File not found: {filepath}")
         
-        extension = Path(filepath).suffix.lower()
+        extension = get_extension(filepath)
         
         if extension not in self._loader_mapping:
             supported_formats = list(self._loader_mapping.keys())
@@ -84,8 +94,7 @@ class FileLoaderFactory:
         Returns:
             True if the file format is supported
         """
-        extension = Path(filepath).suffix.lower()
-        return extension in self._loader_mapping
+        return get_extension(filepath) in self._loader_mapping
 
     def get_supported_extensions(self) -> list[str]:
         """
@@ -109,7 +118,7 @@ class FileLoaderFactory:
         if not self.is_supported(filepath):
             return {"error": "Unsupported file format"}
         
-        extension = Path(filepath).suffix.lower()
+        extension = get_extension(filepath)
         loader_class = self._loader_mapping[extension]
         loader = loader_class(filepath)
         
@@ -151,10 +160,13 @@ class FileLoaderFactory:
             '.xlsx': 'Excel Workbook - Microsoft Excel format',
             '.xls': 'Excel Spreadsheet - Legacy Microsoft Excel format',
             '.json': 'JavaScript Object Notation - Structured text format',
+            '.jsonl': 'JSON Lines - One JSON record per line',
+            '.ndjson': 'Newline-Delimited JSON - One JSON record per line',
             '.xml': 'eXtensible Markup Language - Structured markup format',
             '.parquet': 'Apache Parquet - Columnar storage format for big data',
             '.feather': 'Feather Format - Fast columnar storage format',
             '.hdf5': 'HDF5 - Hierarchical Data Format for scientific data',
+            '.h5': 'HDF5 - Hierarchical Data Format for scientific data',
             '.pkl': 'Pickle Format - Python serialized objects',
             '.pickle': 'Pickle Format - Python serialized objects',
             '.db': 'SQLite Database - Lightweight SQL database',
@@ -163,7 +175,13 @@ class FileLoaderFactory:
             '.yml': 'YAML Format - Human-readable data serialization',
         }
         
-        return descriptions.get(extension.lower(), f"Unknown format: {extension}")
+        extension = extension.lower()
+        compression_extension = Path(extension).suffix
+        if compression_extension in COMPRESSION_EXTENSIONS and extension != compression_extension:
+            inner = extension[:-len(compression_extension)]
+            if inner in descriptions:
+                return f"{descriptions[inner]} ({COMPRESSION_EXTENSIONS[compression_extension]} compressed)"
+        return descriptions.get(extension, f"Unknown format: {extension}")
 
 # Global factory instance
 _global_factory = FileLoaderFactory()
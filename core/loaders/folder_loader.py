@@ -6,6 +6,7 @@ Handles loading and scanning of folders containing Excel files
 from typing import Any
 from pathlib import Path
 import pandas as pd
+from .excel_loader import ExcelLoader
 
 class FolderLoader:
     """
@@ -162,29 +163,16 @@ class FolderLoader:
     @staticmethod
     def _estimate_rows(file_path: str) -> int:
         """
-        Estimate number of rows in Excel file (optimized)
+        Get the number of data rows of the first sheet from its dimension metadata
 
         Args:
             file_path: Path to the Excel file
 
         Returns:
-            Estimated number of rows
+            Number of data rows (0 if it cannot be determined)
         """
         try:
-            # Use a smaller sample for faster estimation
-            df_sample = pd.read_excel(file_path, nrows=100)
-            if len(df_sample) == 0:
-                return 0
-
-            file_size = Path(file_path).stat().st_size
-
-            # More accurate estimation based on file size and sample
-            # Excel files have overhead, so we adjust the estimation
-            avg_bytes_per_row = file_size / len(df_sample) * 0.1  # Conservative estimate
-            estimated_rows = int(file_size / avg_bytes_per_row)
-
-            # Cap at reasonable maximum to avoid unrealistic estimates
-            return min(estimated_rows, 1000000)
+            return ExcelLoader(file_path).count_rows()
         except Exception:
             return 0
 
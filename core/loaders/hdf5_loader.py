@@ -5,8 +5,9 @@ Handles Hierarchical Data Format version 5 (requires tables)
 
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from .base_loader import FileLoader
+from .selection import coerce_filter_value, compare, normalize_operator
 
 class Hdf5Loader(FileLoader):
     """
@@ -16,33 +17,67 @@ class Hdf5Loader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.hdf5', '.h5']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def list_keys(self) -> list[str]:
+        """
+        List the pandas objects stored in the file
+
+        Returns:
+            Keys in store order (e.g. ['/measurements', '/meta/devices'])
+        """
+        self._require_tables()
+        with pd.HDFStore(self.filepath, mode='r') as store:
+            return store.keys()
+
+    def get_columns(self, key: str | None = None) -> list[str]:
+        """
+        Get the column names of a stored object without reading its rows
+
+        A non-default index (e.g. the timestamps of a time series) is listed
+        first, as it becomes a column when the data is loaded.
+        """
+        self._require_tables()
+        with pd.HDFStore(self.filepath, mode='r') as store:
+            key = self._resolve_key(store, key)
+            storer = store.get_storer(key)
+            if storer.is_table:
+                empty = store.select(key, stop=0)
+            else:
+                empty = store.select(key).iloc[:0]
+        return list(self._index_to_column(empty).columns)
+
+    def is_table(self, key: str | None = None) -> bool:
+        """
+        Check if a stored object uses the queryable PyTables "table" format
+        """
+        self._require_tables()
+        with pd.HDFStore(self.filepath, mode='r') as store:
+            return bool(store.get_storer(self._resolve_key(store, key)).is_table)
+
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, key: str | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load HDF5 file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
+            key: Stored object to read (default: the first key)
+            columns: Columns to read (None reads all)
+            filters: Row filters as (column, operator, value) tuples combined with AND;
+                on "table" stores, filters on data columns and the index run as
+                PyTables where queries so only matching rows are read
             
         Returns:
             DataFrame with loaded data
         """
         try:
-            # Check if tables is available
-            try:
-                import tables  # noqa
-            except ImportError:
-                raise ImportError(
-                    "PyTables is required to load HDF5 files. "
-                    "Install it with: pip install tables"
-                )
-            
-            # Load HDF5 file
-            df = pd.read_hdf(self.filepath)
-            
-            # Apply skip_rows if specified
-            if 0 < skip_rows < len(df):
-                df = df.iloc[skip_rows:].reset_index(drop=True)
+            chunk_list = list(self._iter_selection(key, columns, filters, skip_rows, chunk_size=None))
+            if not chunk_list:
+                df = pd.DataFrame(columns=columns or self.get_columns(key))
+            elif len(chunk_list) == 1:
+                df = chunk_list[0]
+            else:
+                df = pd.concat(chunk_list, ignore_index=True)
             
             # Apply column renaming if specified
             if column_names:
@@ -63,16 +98,17 @@ class Hdf5Loader(FileLoader):
             # Get HDF5 metadata
             try:
                 import tables
-                import h5py
                 
-                with h5py.File(self.filepath, 'r') as f:
-                    # Get all keys (datasets)
-                    keys = list(f.keys())
+                with pd.HDFStore(self.filepath, mode='r') as store:
+                    # Get all keys (pandas objects) and whether they can be queried
+                    keys = store.keys()
+                    table_keys = [key for key in keys if store.get_storer(key).is_table]
                     
                 return {
                     'format': 'HDF5',
                     'datasets': keys,
                     'dataset_count': len(keys),
+                    'table_keys': table_keys,
                     'file_size_bytes': file_size,
                     'file_size_mb': round(file_size / (1024 * 1024), 2),
                     'pytables_version': tables.__version__
@@ -82,7 +118,7 @@ class Hdf5Loader(FileLoader):
                     'format': 'HDF5',
                     'file_size_bytes': file_size,
                     'file_size_mb': round(file_size / (1024 * 1024), 2),
-                    'note': 'PyTables/h5py not available for detailed metadata'
+                    'note': 'PyTables not available for detailed metadata'
                 }
                 
         except Exception as e:
@@ -95,39 +131,202 @@ class Hdf5Loader(FileLoader):
         """
         return True
 
-    def load_in_chunks(self, chunk_size: int = 1000) -> pd.DataFrame:
+    def load_in_chunks(self, chunk_size: int = 1000, key: str | None = None, columns: list[str] | None = None,
+                       filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load HDF5 file in chunks
         """
         try:
-            # Check if tables is available
-            try:
-                import tables  # noqa
-            except ImportError:
-                raise ImportError(
-                    "PyTables is required to load HDF5 files. "
-                    "Install it with: pip install tables"
-                )
-            
-            # Load entire file (HDF5 chunking is complex)
-            df = pd.read_hdf(self.filepath)
-            
-            # Split into chunks if requested
-            if chunk_size < len(df):
-                chunk_list = [df.iloc[i:i+chunk_size] for i in range(0, len(df), chunk_size)]
-                return pd.concat(chunk_list, ignore_index=True)
-            else:
-                return df
+            chunk_list = list(self.iter_chunks(chunk_size, key=key, columns=columns, filters=filters))
+            if not chunk_list:
+                return self.load(key=key, columns=columns, filters=filters)
+            return pd.concat(chunk_list, ignore_index=True)
             
         except Exception as e:
             raise Exception(f"Error loading HDF5 file in chunks: {str(e)}")
 
+    def iter_chunks(self, chunk_size: int = 1000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    key: str | None = None, columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None,
+                    progress_callback: Callable[[int, int], None] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a stored object as DataFrame chunks
+
+        "table" stores are read chunksize rows at a time, with the filters on
+        data columns and the index pushed into the PyTables where query; "fixed"
+        stores cannot be partially read and are loaded whole, then split.
+
+        Args:
+            chunk_size: Number of rows per chunk
+            skip_rows: Number of matching rows to skip at the beginning
+            column_names: Dictionary for renaming columns
+            key: Stored object to read (default: the first key)
+            columns: Columns to read (None reads all)
+            filters: Row filters as (column, operator, value) tuples combined with AND
+            progress_callback: Called with (rows_read, total_rows) before each chunk
+
+        Yields:
+            DataFrame chunks in store order
+        """
+        for chunk in self._iter_selection(key, columns, filters, skip_rows, chunk_size, progress_callback):
+            yield chunk.rename(columns=column_names) if column_names else chunk
+
+    @staticmethod
+    def _require_tables() -> None:
+        try:
+            import tables  # noqa
+        except ImportError:
+            raise ImportError(
+                "PyTables is required to load HDF5 files. "
+                "Install it with: pip install tables"
+            )
+
+    @staticmethod
+    def _resolve_key(store: pd.HDFStore, key: str | None) -> str:
+        keys = store.keys()
+        if not keys:
+            raise ValueError("No dataset in HDF5 file")
+        if key is None:
+            return keys[0]
+        if ('/' + key.lstrip('/')) not in keys:
+            raise ValueError(f"Key '{key}' not found in HDF5 file. Available keys: {keys}")
+        return key
+
+    @staticmethod
+    def _index_column(df: pd.DataFrame) -> str | None:
+        """
+        Name the index takes as a column, or None for a plain positional index
+
+        Timestamps and named indexes carry data and are shown as a column;
+        unnamed integer indexes are just row positions.
+        """
+        if isinstance(df.index, pd.MultiIndex) or (df.index.name is None and pd.api.types.is_integer_dtype(df.index)):
+            return None
+        return df.index.name if df.index.name is not None else 'index'
+
+    @classmethod
+    def _index_to_column(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Turn a meaningful index into a column so it is shown and kept across chunks
+        """
+        if cls._index_column(df) is None:
+            return df.reset_index(drop=True)
+        return df.reset_index()
+
+    def _iter_selection(self, key: str | None, columns: list[str] | None, filters: list[tuple[str, str, Any]] | None,
+                        skip_rows: int, chunk_size: int | None,
+                        progress_callback: Callable[[int, int], None] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Read the selected rows and columns of a stored object, in chunks when chunk_size is given
+        """
+        self._require_tables()
+        with pd.HDFStore(self.filepath, mode='r') as store:
+            key = self._resolve_key(store, key)
+            storer = store.get_storer(key)
+            stored = store.select(key, stop=0) if storer.is_table else store.select(key)
+            index_column = self._index_column(stored)
+            template = self._index_to_column(stored)
+            where, local_filters = self._split_filters(storer, template, index_column, filters)
+
+            read_columns = None
+            if columns:
+                missing = [column for column in columns if column not in template.columns]
+                if missing:
+                    raise ValueError(f"Columns not found in HDF5 key '{key}': {missing}")
+                # Columns filtered in pandas must be read even if they are not shown
+                wanted = set(columns) | {column for column, _, _ in local_filters}
+                # The index is always read; PyTables only selects the other columns
+                read_columns = [column for column in stored.columns if column in wanted]
+
+            if not storer.is_table:
+                # Fixed stores cannot be partially read: the whole object is already in memory
+                chunks: Iterator[pd.DataFrame] = iter([template])
+                total_rows = len(template)
+            elif chunk_size is None:
+                chunks = iter([self._index_to_column(store.select(key, where=where or None, columns=read_columns))])
+                total_rows = 0
+            else:
+                iterator = store.select(key, where=where or None, columns=read_columns,
+                                        chunksize=chunk_size, iterator=True)
+                # Rows matching the where query, or all rows without one
+                coordinates = getattr(iterator, 'coordinates', None)
+                total_rows = len(coordinates) if coordinates is not None else int(storer.nrows)
+                chunks = (self._index_to_column(chunk) for chunk in iterator)
+
+            rows_read = 0
+            for chunk in chunks:
+                rows_read += len(chunk)
+                for column, operator, value in local_filters:
+                    chunk = chunk[compare(chunk[column], operator, value)]
+                if columns:
+                    chunk = chunk[[column for column in template.columns if column in columns]]
+                if skip_rows >= len(chunk):
+                    skip_rows -= len(chunk)
+                    continue
+                if skip_rows:
+                    chunk = chunk.iloc[skip_rows:]
+                    skip_rows = 0
+                chunk = chunk.reset_index(drop=True)
+
+                if chunk_size is None or storer.is_table:
+                    if progress_callback is not None:
+                        progress_callback(min(rows_read, total_rows) if total_rows else rows_read, total_rows)
+                    yield chunk
+                    continue
+                for start in range(0, len(chunk), chunk_size):
+                    if progress_callback is not None:
+                        progress_callback(min(start + chunk_size, len(chunk)), len(chunk))
+                    yield chunk.iloc[start:start + chunk_size].reset_index(drop=True)
+
+    def _split_filters(self, storer: Any, template: pd.DataFrame, index_column: str | None,
+                       filters: list[tuple[str, str, Any]] | None) -> tuple[list[str], list[tuple[str, str, Any]]]:
+        """
+        Split filters into PyTables where terms and filters applied to each chunk in pandas
+
+        Only the index and the data columns of "table" stores can be queried by
+        PyTables; other columns, and every column of "fixed" stores, are filtered
+        in pandas. Text values are converted to the column type.
+        """
+        where: list[str] = []
+        local: list[tuple[str, str, Any]] = []
+        queryable = set(storer.data_columns or []) if storer.is_table else set()
+
+        for column, operator, value in filters or []:
+            if column not in template.columns:
+                raise ValueError(f"Filter column '{column}' not found in HDF5 data")
+            operator = normalize_operator(operator)
+            value = coerce_filter_value(template[column].dtype, value)
+
+            if storer.is_table and column == index_column:
+                where.append(f"index {operator} {self._where_literal(value)}")
+            elif column in queryable and column.isidentifier():
+                where.append(f"{column} {operator} {self._where_literal(value)}")
+            else:
+                local.append((column, operator, value))
+        return where, local
+
+    @staticmethod
+    def _where_literal(value: Any) -> str:
+        """
+        Write a filter value as a literal of a PyTables where expression
+        """
+        if isinstance(value, pd.Timestamp):
+            return repr(str(value))
+        if isinstance(value, str):
+            return repr(value)
+        return str(value)
+
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in HDF5 file
         """
         try:
-            df = pd.read_hdf(self.filepath, stop=1000)
-            return len(df)
+            with pd.HDFStore(self.filepath, mode='r') as store:
+                key = self._resolve_key(store, None)
+                storer = store.get_storer(key)
+                # Table stores record their row count; fixed stores their shape
+                if storer.is_table:
+                    return int(storer.nrows)
+                return int(storer.shape[0]) if storer.shape else 0
         except Exception:
             return super()._estimate_rows()
\ No newline at end of file
@@ -1,39 +1,80 @@
 """
 JSON File Loader
-Handles JavaScript Object Notation format
+Handles JavaScript Object Notation format and line-delimited JSON (JSON Lines / NDJSON)
 """
 
+import io
+import json
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from .base_loader import FileLoader
+from .compression import get_data_extension, open_source
+from .sampling import sample_lines
+from .selection import select_chunks, select_frame
+
+# Extensions that always hold one JSON record per line
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+# Bytes read from a .json file to detect line-delimited content
+JSON_LINES_SNIFF_BYTES = 1024 * 1024
 
 class JsonLoader(FileLoader):
     """
     File loader for JSON format
     """
 
+    supports_compression = True
+
     def get_supported_extensions(self) -> list[str]:
-        return ['.json']
+        return ['.json', '.jsonl', '.ndjson']
+
+    def is_json_lines(self) -> bool:
+        """
+        Check if the file holds one JSON record per line
+
+        .jsonl/.ndjson files always do; a .json file does when its first line is a
+        complete JSON object and another object starts on the next non-empty line.
+        """
+        if get_data_extension(self.filepath) in JSON_LINES_EXTENSIONS:
+            return True
+        try:
+            with open_source(self.filepath) as source:
+                f = source.open_text()
+                first_line = f.readline(JSON_LINES_SNIFF_BYTES).strip()
+                if not first_line.startswith('{') or not isinstance(json.loads(first_line), dict):
+                    return False
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        return line.startswith('{')
+        except (ValueError, OSError):
+            pass
+        return False
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load JSON file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning (not applicable for JSON, kept for interface compatibility)
             column_names: Dictionary for renaming columns
+            columns: Columns to keep (projection)
+            filters: Row filters as (column, operator, value) tuples, combined with AND
             
         Returns:
             DataFrame with loaded data
         """
         try:
             # Load JSON file
-            df = pd.read_json(self.filepath)
+            lines = self.is_json_lines()
+            with open_source(self.filepath) as source:
+                df = pd.read_json(source.input, lines=lines)
             
             # Apply skip_rows if specified (for JSON, this means removing first n rows)
             if 0 < skip_rows < len(df):
                 df = df.iloc[skip_rows:].reset_index(drop=True)
+            df = select_frame(df, columns, filters)
             
             # Apply column renaming if specified
             if column_names:
@@ -53,39 +94,131 @@ class JsonLoader(FileLoader):
             
             # Get basic JSON structure information
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    content = f.read(1000)  # Read first 1KB to get structure
+                with open_source(self.filepath) as source:
+                    content = source.open_text().read(1000)  # Read first 1KB to get structure
                     is_array = content.strip().startswith('[')
                     
             except Exception:
                 is_array = False
             
             return {
-                'format': 'JSON',
+                'format': 'JSON Lines' if self.is_json_lines() else 'JSON',
                 'is_array': is_array,
+                'is_json_lines': self.is_json_lines(),
+                'compression': self.compression,
                 'file_size_bytes': file_size,
                 'file_size_mb': round(file_size / (1024 * 1024), 6)
             }
         except Exception as e:
             return {'error': str(e)}
 
-    @staticmethod
-    def can_load_chunks() -> bool:
+    def can_load_chunks(self) -> bool:
         """
-        JSON files do not support chunk loading
+        Line-delimited JSON supports chunk loading; a single JSON document does not
         """
-        return False
+        return self.is_json_lines()
+
+    def load_in_chunks(self, chunk_size: int = 1000) -> pd.DataFrame:
+        """
+        Load line-delimited JSON file in chunks for better memory management
+        """
+        try:
+            chunk_list = list(self.iter_chunks(chunk_size))
+            if not chunk_list:
+                return pd.DataFrame()
+            return pd.concat(chunk_list, ignore_index=True)
+
+        except Exception as e:
+            raise Exception(f"Error loading JSON file in chunks {self.filepath}: {str(e)}")
+
+    def iter_chunks(self, chunk_size: int = 1000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    progress_callback: Callable[[int, int], None] | None = None,
+                    columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a line-delimited JSON file as DataFrame chunks while it is being parsed
+        
+        Args:
+            chunk_size: Number of records per chunk
+            skip_rows: Number of records to skip at the beginning
+            column_names: Dictionary for renaming columns
+            progress_callback: Called with (records_parsed, estimated_total_records) before each chunk;
+                for compressed files the total is extrapolated from the compressed bytes consumed
+            columns: Columns to keep (projection), applied to each parsed chunk
+            filters: Row filters as (column, operator, value) tuples, combined with AND
+            
+        Yields:
+            DataFrame chunks with the same columns and options as load(); chunks left
+            empty by the filters are skipped
+        """
+        if not self.is_json_lines():
+            raise ValueError(f"Chunk loading requires line-delimited JSON: {self.filepath}")
+
+        with open_source(self.filepath) as source:
+            for chunk in select_chunks(self._iter_parsed(source, chunk_size, skip_rows, progress_callback),
+                                       columns, filters):
+                yield chunk.rename(columns=column_names) if column_names else chunk
+
+    def _iter_parsed(self, source: Any, chunk_size: int, skip_rows: int,
+                     progress_callback: Callable[[int, int], None] | None) -> Iterator[pd.DataFrame]:
+        """
+        Parse records from an open source in chunks, skipping the first skip_rows
+        """
+        total_rows = self._estimate_rows() if progress_callback is not None and not self.compression else 0
+        rows_parsed = 0
+        with pd.read_json(source.input, lines=True, chunksize=chunk_size) as reader:
+            for chunk in reader:
+                rows_parsed += len(chunk)
+                if skip_rows >= len(chunk):
+                    skip_rows -= len(chunk)
+                    continue
+                if skip_rows:
+                    chunk = chunk.iloc[skip_rows:]
+                    skip_rows = 0
+                if progress_callback is not None:
+                    estimated = source.estimate_total(rows_parsed) if self.compression else max(total_rows, rows_parsed)
+                    progress_callback(rows_parsed, estimated)
+                yield chunk
+
+    def load_sample(self, n_rows: int, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    seed: int | None = None) -> pd.DataFrame:
+        """
+        Load n_rows random records of a line-delimited JSON file without parsing all of it
+        
+        Args:
+            n_rows: Number of records to sample (all records if the file has fewer)
+            skip_rows: Number of lines at the beginning that are never sampled
+            column_names: Dictionary for renaming columns
+            seed: Seed for a reproducible sample
+            
+        Returns:
+            DataFrame with the sampled records in file order
+        """
+        if not self.is_json_lines():
+            raise ValueError(f"Sampling requires line-delimited JSON: {self.filepath}")
+        try:
+            sample = sample_lines(self.filepath, n_rows, skip_rows, seed)
+            if not sample.lines:
+                return pd.DataFrame()
+            df = pd.read_json(io.BytesIO(b''.join(sample.lines)), lines=True)
+            if column_names:
+                df = df.rename(columns=column_names)
+            return df
+        except Exception as e:
+            raise Exception(f"Error sampling JSON file {self.filepath}: {str(e)}")
 
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in JSON file
         """
+        if self.is_json_lines():
+            return super()._estimate_rows()
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open_source(self.filepath) as source:
+                content = source.open_text().read()
                 # Count objects in array (rough estimate)
                 if content.strip().startswith('[') and content.strip().endswith(']'):
                     return content.count('{')  # Count objects
                 return 1  # Single object
         except Exception:
-            return super()._estimate_rows()
\ No newline at end of file
+            return super()._estimate_rows()
@@ -5,8 +5,10 @@ Handles Apache Parquet format (requires pyarrow)
 
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from .base_loader import FileLoader
+from .row_group_source import ParquetRowGroupSource
+from .selection import arrow_filter_expression
 
 class ParquetLoader(FileLoader):
     """
@@ -16,13 +18,18 @@ class ParquetLoader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.parquet']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load Parquet file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
+            columns: Columns to read (None reads all); others are never decoded
+            filters: Row filters as (column, operator, value) tuples combined with AND;
+                operators are ==, !=, <, <=, >, >=. Row groups whose statistics
+                cannot match are skipped
             
         Returns:
             DataFrame with loaded data
@@ -30,15 +37,21 @@ class ParquetLoader(FileLoader):
         try:
             # Check if pyarrow is available
             try:
-                import pyarrow  # noqa
+                import pyarrow.parquet as pq
             except ImportError:
                 raise ImportError(
                     "PyArrow is required to load Parquet files. "
                     "Install it with: pip install pyarrow"
                 )
             
-            # Load Parquet file
-            df = pd.read_parquet(self.filepath)
+            # Load Parquet file, projecting columns and pushing filters down to pyarrow
+            table = pq.read_table(
+                self.filepath,
+                columns=columns or None,
+                filters=self._build_filters(filters),
+                use_pandas_metadata=True
+            )
+            df = table.to_pandas()
             
             # Apply skip_rows if specified
             if 0 < skip_rows < len(df):
@@ -95,34 +108,74 @@ class ParquetLoader(FileLoader):
         """
         return True
 
-    def load_in_chunks(self, chunk_size: int = 1000) -> pd.DataFrame:
+    def load_in_chunks(self, chunk_size: int = 1000, columns: list[str] | None = None,
+                       filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load Parquet file in chunks
         """
         try:
-            # Check if pyarrow is available
-            try:
-                import pyarrow.parquet as pq
-            except ImportError:
-                raise ImportError(
-                    "PyArrow is required to load Parquet files. "
-                    "Install it with: pip install pyarrow"
-                )
-            
-            parquet_file = pq.ParquetFile(self.filepath)
-            chunk_list = []
-            
-            for i in range(parquet_file.num_row_groups):
-                # Read one row group as a chunk
-                table = parquet_file.read_row_group(i)
-                chunk_df = table.to_pandas()
-                chunk_list.append(chunk_df)
-            
+            chunk_list = list(self.iter_chunks(chunk_size, columns, filters))
+            if not chunk_list:
+                return self.load(columns=columns, filters=filters)
             return pd.concat(chunk_list, ignore_index=True)
             
         except Exception as e:
             raise Exception(f"Error loading Parquet file in chunks: {str(e)}")
 
+    def iter_chunks(self, chunk_size: int = 1000, columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream Parquet record batches, decoding only the requested columns and
+        the row groups that can satisfy the filters
+        
+        Args:
+            chunk_size: Maximum number of rows per chunk
+            columns: Columns to read (None reads all)
+            filters: Row filters as (column, operator, value) tuples combined with AND
+            
+        Yields:
+            DataFrame chunks in file order
+        """
+        try:
+            import pyarrow.dataset as ds
+        except ImportError:
+            raise ImportError(
+                "PyArrow is required to load Parquet files. "
+                "Install it with: pip install pyarrow"
+            )
+        
+        dataset = ds.dataset(self.filepath, format='parquet')
+        
+        for batch in dataset.to_batches(columns=columns or None, filter=self._build_filters(filters),
+                                        batch_size=chunk_size):
+            if batch.num_rows > 0:
+                yield batch.to_pandas()
+
+    def create_row_group_source(self, columns: list[str] | None = None) -> ParquetRowGroupSource:
+        """
+        Open the file for random access by row group without loading it
+        
+        Only the footer metadata is read; row groups are decoded on demand.
+        
+        Args:
+            columns: Columns to read (None reads all)
+            
+        Returns:
+            ParquetRowGroupSource for this file
+        """
+        return ParquetRowGroupSource(self.filepath, columns)
+
+    def _build_filters(self, filters: list[tuple[str, str, Any]] | None) -> Any:
+        """
+        Build the pyarrow filter expression, converting text values to the column type
+        and keeping null rows on != as the other formats do
+        """
+        if not filters:
+            return None
+        
+        import pyarrow.parquet as pq
+        return arrow_filter_expression(pq.read_schema(self.filepath), filters, 'Parquet')
+
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in Parquet file
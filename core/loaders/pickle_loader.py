@@ -10,6 +10,7 @@ from typing import Any
 import pandas as pd
 
 from .base_loader import FileLoader
+from .selection import select_frame
 
 class RestrictedUnpickler(pickle.Unpickler):
     """
@@ -110,13 +111,16 @@ class PickleLoader(FileLoader):
 
         return obj
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load Pickle file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning (not applicable for pickle, kept for interface compatibility)
             column_names: Dictionary for renaming columns
+            columns: Columns to keep (projection)
+            filters: Row filters as (column, operator, value) tuples, combined with AND
             
         Returns:
             DataFrame with loaded data
@@ -128,6 +132,7 @@ class PickleLoader(FileLoader):
             # Apply skip_rows if specified
             if 0 < skip_rows < len(df):
                 df = df.iloc[skip_rows:].reset_index(drop=True)
+            df = select_frame(df, columns, filters)
             
             # Apply column renaming if specified
             if column_names:
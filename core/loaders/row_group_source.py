@@ -0,0 +1,138 @@
+"""
+Row Group Sources
+Random access to columnar files (Parquet, Feather/Arrow IPC) one row group at a time
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any
+import numpy as np
+import pandas as pd
+
+class RowGroupSource(ABC):
+    """
+    Random-access view over a file stored as consecutive row groups
+
+    Only metadata is read up front; each group is decoded on demand by
+    read_group(). Subclasses provide the group sizes and the decoding.
+    """
+
+    def __init__(self, filepath: str, group_sizes: list[int], columns: list[str]) -> None:
+        self.filepath = filepath
+        self.columns = columns
+        self.boundaries: np.ndarray = np.concatenate(([0], np.cumsum(group_sizes, dtype=np.int64)))
+        self.row_count: int = int(self.boundaries[-1])
+        self.is_complete: bool = True
+
+    @property
+    def num_groups(self) -> int:
+        return len(self.boundaries) - 1
+
+    def group_for_row(self, row: int) -> int:
+        """
+        Get the index of the group containing a row
+        """
+        return int(np.searchsorted(self.boundaries, row, side='right')) - 1
+
+    def group_bounds(self, group: int) -> tuple[int, int]:
+        """
+        Get the [start, stop) row range of a group
+        """
+        return int(self.boundaries[group]), int(self.boundaries[group + 1])
+
+    def read_group(self, group: int) -> pd.DataFrame:
+        """
+        Decode one group
+
+        Returns:
+            DataFrame indexed by absolute row position
+        """
+        start, _ = self.group_bounds(group)
+        df = self._read_group(group)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def read_rows(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        Decode the groups overlapping rows [start, stop) and slice them
+
+        Returns:
+            DataFrame indexed by absolute row position
+        """
+        stop = min(stop, self.row_count)
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        first, last = self.group_for_row(start), self.group_for_row(stop - 1)
+        parts = [self.read_group(group) for group in range(first, last + 1)]
+        df = parts[0] if len(parts) == 1 else pd.concat(parts)
+        return df.loc[start:stop - 1]
+
+    @abstractmethod
+    def _read_group(self, group: int) -> pd.DataFrame:
+        """
+        Decode one group into a DataFrame (index is replaced by the caller)
+        """
+
+
+class ParquetRowGroupSource(RowGroupSource):
+    """
+    Row groups of a Parquet file, decoded with pyarrow
+    """
+
+    def __init__(self, filepath: str, columns: list[str] | None = None) -> None:
+        import pyarrow.parquet as pq
+
+        self._file = pq.ParquetFile(filepath)
+        metadata = self._file.metadata
+        group_sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        self._read_columns = columns or None
+        super().__init__(filepath, group_sizes, columns or self._file.schema_arrow.names)
+
+    def _read_group(self, group: int) -> pd.DataFrame:
+        table = self._file.read_row_group(group, columns=self._read_columns)
+        return table.to_pandas()
+
+
+def batch_in_memory_map(mapped: Any, batch: Any) -> bool:
+    """
+    Check that every buffer of a record batch points into a memory-mapped file
+
+    Uncompressed IPC batches are views of the map; compressed ones are
+    decompressed into new buffers elsewhere. Only the batch's own addresses
+    are compared, so other threads allocating Arrow memory do not matter.
+    """
+    position = mapped.tell()
+    mapped.seek(0)
+    region = mapped.read_buffer(mapped.size())
+    mapped.seek(position)
+    start, end = region.address, region.address + region.size
+    return all(
+        start <= buffer.address and buffer.address + buffer.size <= end
+        for column in batch.columns
+        for buffer in column.buffers()
+        if buffer is not None and buffer.size
+    )
+
+
+class FeatherBatchSource(RowGroupSource):
+    """
+    Record batches of an uncompressed Feather v2 / Arrow IPC file, memory-mapped
+
+    Batches are read zero-copy from the map, so listing their lengths only
+    touches the batch headers. Compressed files would have to be decompressed
+    batch by batch for that, so they are rejected: load them in memory instead.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        import pyarrow as pa
+
+        mapped = pa.memory_map(filepath, 'r')
+        self._reader = pa.ipc.open_file(mapped)
+        # Compression is per file: if the first batch is not a view of the map, no batch is
+        if self._reader.num_record_batches and not batch_in_memory_map(mapped, self._reader.get_batch(0)):
+            raise ValueError(f"Compressed Feather file cannot be browsed from disk: {filepath}")
+        group_sizes = [self._reader.get_batch(i).num_rows for i in range(self._reader.num_record_batches)]
+        super().__init__(filepath, group_sizes, self._reader.schema.names)
+
+    def _read_group(self, group: int) -> pd.DataFrame:
+        return self._reader.get_batch(group).to_pandas()
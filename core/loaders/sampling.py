@@ -0,0 +1,172 @@
+"""
+Random Sampling
+Random record samples of line-oriented text files (CSV/TSV, JSON Lines) that
+do not read the whole file when it can be avoided
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+from .compression import get_compression, open_source
+
+# Uncompressed files at least this large are sampled by seeking; smaller ones are read once
+SEEK_SAMPLE_MIN_SIZE = 64 * 1024 * 1024
+# Bytes read per block on a streaming pass
+SAMPLE_BLOCK_SIZE = 1024 * 1024
+# Rounds of extra random offsets drawn when probes land on lines already taken
+SEEK_ROUNDS = 4
+
+@dataclass
+class LineSample:
+    """
+    Lines picked from a file
+
+    leading holds the first lines of the file, never sampled (header,
+    skipped rows); lines holds the sampled lines in file order, each ending
+    with a newline.
+    """
+    leading: list[bytes]
+    lines: list[bytes]
+
+
+def sample_lines(filepath: str, k: int, skip_lines: int = 0, seed: int | None = None) -> LineSample:
+    """
+    Pick k random lines of a text file, after its first skip_lines lines
+
+    Large uncompressed files are sampled by seeking to random byte offsets
+    and taking the line that starts after each one, so only about k lines are
+    read whatever the file size. A line is then picked with a probability
+    proportional to the length of the line before it, which is close to
+    uniform when line lengths are similar. Compressed or small files, and
+    files with too few lines for the probes, are read once with reservoir
+    sampling (Algorithm L), which is exactly uniform.
+
+    Lines are split on newlines, so quoted values containing newlines are
+    not supported.
+
+    Args:
+        filepath: Path to the file (optionally compressed)
+        k: Number of lines to pick
+        skip_lines: Lines at the start that are returned as leading, not sampled
+        seed: Seed for a reproducible sample
+
+    Returns:
+        LineSample with the leading lines and min(k, available) sampled lines
+    """
+    rng = random.Random(seed)
+    if not get_compression(filepath) and Path(filepath).stat().st_size >= SEEK_SAMPLE_MIN_SIZE:
+        sample = _sample_by_seeking(filepath, k, skip_lines, rng)
+        if len(sample.lines) >= k:
+            return sample
+    with open_source(filepath) as source:
+        return _sample_stream(source.stream, k, skip_lines, rng)
+
+
+def _sample_by_seeking(filepath: str, k: int, skip_lines: int, rng: random.Random) -> LineSample:
+    """
+    Take the line after each of k random byte offsets, drawing more offsets for duplicates
+    """
+    with open(filepath, 'rb') as f:
+        leading = [_with_newline(f.readline()) for _ in range(skip_lines)]
+        data_start = f.tell()
+        size = Path(filepath).stat().st_size
+        picked: dict[int, bytes] = {}
+        if data_start >= size:
+            return LineSample(leading, [])
+
+        for _ in range(SEEK_ROUNDS):
+            missing = k - len(picked)
+            if missing <= 0:
+                break
+            # Sorted offsets turn the probes into one forward sweep over the file
+            for offset in sorted(rng.randrange(data_start, size) for _ in range(missing)):
+                if offset == data_start:
+                    line_start = data_start
+                else:
+                    # Finish the line holding offset - 1; the next line starts at or after offset
+                    f.seek(offset - 1)
+                    f.readline()
+                    line_start = f.tell()
+                if line_start in picked or line_start >= size:
+                    continue
+                f.seek(line_start)
+                line = f.readline()
+                if line.strip():
+                    picked[line_start] = _with_newline(line)
+                if len(picked) >= k:
+                    break
+
+    return LineSample(leading, [picked[start] for start in sorted(picked)])
+
+
+def _sample_stream(stream: BinaryIO, k: int, skip_lines: int, rng: random.Random) -> LineSample:
+    """
+    Reservoir-sample the non-empty lines of a stream in one pass (Algorithm L)
+
+    Blocks without a line to pick are only scanned for newlines, so the pass
+    costs little more than decompressing the file.
+    """
+    leading: list[bytes] = []
+    reservoir: list[tuple[int, bytes]] = []
+    weight = 1.0
+    line_no = 0       # Index of the first line in the current block
+    next_pick = 0     # Index of the next line entering the reservoir
+    carry = b''
+
+    def skip() -> int:
+        return math.floor(math.log(1.0 - rng.random()) / math.log(1.0 - weight)) if weight < 1.0 else 0
+
+    def take(index: int, line: bytes) -> None:
+        nonlocal weight, next_pick
+        if not line.strip():
+            # Empty lines are not records: the next line takes the pick
+            next_pick = index + 1
+            return
+        if len(reservoir) < k:
+            reservoir.append((index, line))
+            if len(reservoir) < k:
+                next_pick = index + 1
+                return
+            weight = math.exp(math.log(1.0 - rng.random()) / k)
+        else:
+            reservoir[rng.randrange(k)] = (index, line)
+            weight *= math.exp(math.log(1.0 - rng.random()) / k)
+        next_pick = index + 1 + skip()
+
+    while True:
+        block = stream.read(SAMPLE_BLOCK_SIZE)
+        if block:
+            data = carry + block
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                carry = data
+                continue
+            carry = data[end:]
+            data = data[:end]
+        elif carry:
+            data, carry = carry + b'\n', b''
+        else:
+            break
+
+        if len(leading) < skip_lines:
+            lines = data.split(b'\n')[:-1]
+            taken = min(skip_lines - len(leading), len(lines))
+            leading.extend(line + b'\n' for line in lines[:taken])
+            data = b''.join(line + b'\n' for line in lines[taken:])
+            if not data:
+                continue
+
+        count = data.count(b'\n')
+        if k > 0 and next_pick < line_no + count:
+            lines = data.split(b'\n')
+            while next_pick < line_no + count:
+                take(next_pick, lines[next_pick - line_no] + b'\n')
+        line_no += count
+
+    return LineSample(leading, [line for _, line in sorted(reservoir)])
+
+
+def _with_newline(line: bytes) -> bytes:
+    return line if line.endswith(b'\n') else line + b'\n'
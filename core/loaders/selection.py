@@ -0,0 +1,198 @@
+"""
+Read Selection
+Column projection and row filters shared by the loaders, so unused columns and
+rows are dropped while a file is read instead of after it is loaded
+"""
+
+from typing import Any, Iterable, Iterator
+import pandas as pd
+
+# Comparison operators accepted in (column, operator, value) filters
+FILTER_OPERATORS = ('==', '!=', '<', '<=', '>', '>=')
+
+def normalize_operator(operator: str) -> str:
+    """
+    Validate a filter operator, accepting '=' as '=='
+    """
+    operator = '==' if operator == '=' else operator
+    if operator not in FILTER_OPERATORS:
+        raise ValueError(f"Unsupported filter operator: '{operator}'")
+    return operator
+
+
+def required_columns(columns: list[str] | None, filters: list[tuple[str, str, Any]] | None) -> list[str] | None:
+    """
+    Columns that must be parsed: the projected ones plus those the filters read
+
+    Returns:
+        Column names in projection order, or None when every column is kept
+    """
+    if not columns:
+        return None
+    required = list(columns)
+    for column, _, _ in filters or []:
+        if column not in required:
+            required.append(column)
+    return required
+
+
+def coerce_filter_value(dtype: Any, value: Any) -> Any:
+    """
+    Convert a filter value typed as text into the Python type of a pandas column
+    """
+    if not isinstance(value, str):
+        return value
+    if pd.api.types.is_bool_dtype(dtype):
+        return value.strip().lower() in ('true', '1', 'yes', 'si', 'sí')
+    if pd.api.types.is_integer_dtype(dtype):
+        return int(value)
+    if pd.api.types.is_float_dtype(dtype):
+        return float(value)
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return pd.Timestamp(value)
+    return value
+
+
+def coerce_arrow_filter_value(arrow_type: Any, value: Any) -> Any:
+    """
+    Convert a filter value typed as text into the Python type of an Arrow column
+    """
+    import pyarrow as pa
+
+    if not isinstance(value, str):
+        return value
+    if pa.types.is_integer(arrow_type):
+        return int(value)
+    if pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+        return float(value)
+    if pa.types.is_boolean(arrow_type):
+        return value.strip().lower() in ('true', '1', 'yes', 'si', 'sí')
+    if pa.types.is_timestamp(arrow_type):
+        return pd.Timestamp(value).to_pydatetime()
+    if pa.types.is_date(arrow_type):
+        return pd.Timestamp(value).date()
+    return value
+
+
+def compare(series: pd.Series, operator: str, value: Any) -> pd.Series:
+    """
+    Evaluate a filter on a column
+    """
+    if operator == '==':
+        return series == value
+    if operator == '!=':
+        return series != value
+    if operator == '<':
+        return series < value
+    if operator == '<=':
+        return series <= value
+    if operator == '>':
+        return series > value
+    return series >= value
+
+
+def select_frame(df: pd.DataFrame, columns: list[str] | None = None,
+                 filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
+    """
+    Keep the rows matching every filter (AND) and then only the projected columns
+
+    Args:
+        df: Parsed rows (a chunk or a whole file) with at least the required columns
+        columns: Columns to keep, in this order (None keeps all)
+        filters: Row filters as (column, operator, value) tuples; text values
+            are converted to the column type
+
+    Returns:
+        Selected rows with a fresh positional index
+    """
+    if filters:
+        mask = pd.Series(True, index=df.index)
+        for column, operator, value in filters:
+            if column not in df.columns:
+                raise ValueError(f"Filter column '{column}' not found in file")
+            operator = normalize_operator(operator)
+            mask &= compare(df[column], operator, coerce_filter_value(df[column].dtype, value)).fillna(False).astype(bool)
+        df = df[mask].reset_index(drop=True)
+    if columns:
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"Columns not found in file: {missing}")
+        df = df[list(columns)]
+    return df
+
+
+def select_chunks(chunks: Iterable[pd.DataFrame], columns: list[str] | None = None,
+                  filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+    """
+    Apply select_frame to each chunk of a streaming read
+
+    Chunks left without rows are skipped, so the first chunk yielded already
+    holds matches; if nothing matches, a single empty frame with the selected
+    columns is yielded.
+    """
+    empty: pd.DataFrame | None = None
+    selected_any = False
+    for chunk in chunks:
+        chunk = select_frame(chunk, columns, filters)
+        if filters and chunk.empty:
+            empty = chunk
+            continue
+        selected_any = True
+        yield chunk
+    if not selected_any and empty is not None:
+        yield empty
+
+
+def arrow_filters(schema: Any, filters: list[tuple[str, str, Any]] | None,
+                  format_name: str = 'file') -> list[tuple[str, str, Any]] | None:
+    """
+    Normalize filters for pyarrow (filters_to_expression), converting values to the schema types
+    """
+    if not filters:
+        return None
+    normalized = []
+    for column, operator, value in filters:
+        if column not in schema.names:
+            raise ValueError(f"Filter column '{column}' not found in {format_name} schema")
+        operator = normalize_operator(operator)
+        normalized.append((column, operator, coerce_arrow_filter_value(schema.field(column).type, value)))
+    return normalized
+
+
+def arrow_filter_expression(schema: Any, filters: list[tuple[str, str, Any]] | None,
+                            format_name: str = 'file') -> Any:
+    """
+    Build a pyarrow compute expression for the filters, with the pandas null semantics
+
+    A null compared with != is True in pandas but null (dropped) in Arrow,
+    so != conditions also keep null rows.
+
+    Returns:
+        Expression combining every filter with AND, or None without filters
+    """
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    expression = None
+    for column, operator, value in arrow_filters(schema, filters, format_name) or []:
+        condition = pq.filters_to_expression([(column, operator, value)])
+        if operator == '!=':
+            # NaN != value is True in pandas
+            condition = condition | pc.field(column).is_null()
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def filter_table(table: Any, filters: list[tuple[str, str, Any]] | None, columns: list[str] | None = None) -> Any:
+    """
+    Apply filters and projection to an Arrow table before it is converted to pandas
+    """
+    expression = arrow_filter_expression(table.schema, filters)
+    if expression is not None:
+        table = table.filter(expression)
+    if columns:
+        missing = [column for column in columns if column not in table.schema.names]
+        if missing:
+            raise ValueError(f"Columns not found in file: {missing}")
+        table = table.select(list(columns))
+    return table
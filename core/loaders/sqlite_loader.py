@@ -3,10 +3,24 @@ SQLite File Loader
 Handles SQLite database files
 """
 
+import operator
+import sqlite3
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from .base_loader import FileLoader
+from .selection import normalize_operator, required_columns
+from .sqlite_query_source import SqliteQuerySource, quote_identifier
+
+# Python comparisons for filters built as SQLAlchemy expressions
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
 
 class SqliteLoader(FileLoader):
     """
@@ -16,7 +30,8 @@ class SqliteLoader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.db', '.sqlite', '.sqlite3']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, table_name: str | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None, table_name: str | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load SQLite database into DataFrame
         
@@ -24,6 +39,9 @@ class SqliteLoader(FileLoader):
             skip_rows: Number of rows to skip at the beginning
             column_names: Dictionary for renaming columns
             table_name: Name of the table to load (if None, load first table)
+            columns: Columns to select (projection), sent to SQLite as the SELECT list
+            filters: Row filters as (column, operator, value) tuples, sent to SQLite as
+                a WHERE clause (combined with AND) and evaluated after skip_rows
             
         Returns:
             DataFrame with loaded data
@@ -44,6 +62,17 @@ class SqliteLoader(FileLoader):
             stmt = sa.select(db_table)
             if skip_rows > 0:
                 stmt = stmt.offset(skip_rows)
+            if columns or filters:
+                source = stmt.subquery() if skip_rows > 0 else db_table
+                self._check_columns(source.c.keys(), required_columns(columns, filters) or [])
+                stmt = sa.select(*(source.c[name] for name in columns)) if columns else sa.select(source)
+                for column, op, value in filters or []:
+                    op = normalize_operator(op)
+                    condition = _COMPARISONS[op](source.c[column], value)
+                    if op == '!=':
+                        # NaN != value is True in pandas
+                        condition = sa.or_(source.c[column].is_(None), condition)
+                    stmt = stmt.where(condition)
             
             df = pd.read_sql(stmt, engine)
             
@@ -128,38 +157,131 @@ class SqliteLoader(FileLoader):
         """
         return True
 
-    def load_in_chunks(self, chunk_size: int = 1000) -> pd.DataFrame:
+    def load_in_chunks(self, chunk_size: int = 1000, table_name: str | None = None) -> pd.DataFrame:
         """
         Load SQLite file in chunks
         """
         try:
-            import sqlalchemy as sa
-            engine = sa.create_engine(f'sqlite:///{self.filepath}')
-            
-            # Get first table
-            table_name = self._get_first_table()
-            if table_name is None:
-                raise ValueError("No tables found in the database")
-            
-            chunk_list = []
-            offset = 0
+            chunk_list = list(self.iter_chunks(chunk_size, table_name))
+            if not chunk_list:
+                return self.load(table_name=table_name)
+            return pd.concat(chunk_list, ignore_index=True)
             
-            db_table = sa.Table(table_name, sa.MetaData(), autoload_with=engine)
+        except Exception as e:
+            raise Exception(f"Error loading SQLite file in chunks: {str(e)}")
+
+    def iter_chunks(self, chunk_size: int = 1000, table_name: str | None = None,
+                    skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a table as DataFrame chunks
+        
+        Rows come from a single forward cursor over one read-only connection
+        (fetchmany), so the table is scanned once instead of re-skipping rows
+        for every page.
+        
+        Args:
+            chunk_size: Number of rows per chunk
+            table_name: Name of the table to read (if None, read first table)
+            skip_rows: Number of rows to skip at the beginning
+            column_names: Dictionary for renaming columns
+            columns: Columns to select (projection)
+            filters: Row filters as (column, operator, value) tuples, evaluated by
+                SQLite after skip_rows
             
+        Yields:
+            DataFrame chunks in table order
+        """
+        if table_name is None:
+            table_name = self._get_first_table()
+        if table_name is None:
+            raise ValueError("No tables found in the database")
+
+        query, params = self._select_query(table_name, skip_rows, columns, filters)
+        connection = self._connect()
+        try:
+            if columns or filters:
+                table_columns = [row[1] for row in connection.execute(f"PRAGMA table_info({quote_identifier(table_name)})")]
+                self._check_columns(table_columns, required_columns(columns, filters) or [])
+            cursor = connection.execute(query, params)
+            names = [description[0] for description in cursor.description]
             while True:
-                stmt = sa.select(db_table).limit(chunk_size).offset(offset)
-                chunk_df = pd.read_sql(stmt, engine)
-                
-                if chunk_df.empty:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
                     break
-                
-                chunk_list.append(chunk_df)
-                offset += chunk_size
-            
-            return pd.concat(chunk_list, ignore_index=True)
+                chunk = pd.DataFrame.from_records(rows, columns=names)
+                yield chunk.rename(columns=column_names) if column_names else chunk
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _select_query(table_name: str, skip_rows: int = 0, columns: list[str] | None = None,
+                      filters: list[tuple[str, str, Any]] | None = None) -> tuple[str, list[Any]]:
+        """
+        Build the SELECT for a table with projection, filters and skipped rows
+
+        Returns:
+            Tuple (query, parameters)
+        """
+        source = quote_identifier(table_name)
+        params: list[Any] = []
+        if skip_rows > 0:
+            # Rows are skipped before filtering, as in the other loaders
+            source = f"(SELECT * FROM {source} LIMIT -1 OFFSET ?)"
+            params.append(skip_rows)
+        select_list = ", ".join(quote_identifier(column) for column in columns) if columns else "*"
+        query = f"SELECT {select_list} FROM {source}"
+        conditions = []
+        for column, op, value in filters or []:
+            op = normalize_operator(op)
+            column = quote_identifier(column)
+            if op == '!=':
+                # NaN != value is True in pandas
+                conditions.append(f"({column} IS NULL OR {column} != ?)")
+            else:
+                conditions.append(f"{column} {'=' if op == '==' else op} ?")
+            params.append(value)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query, params
+
+    @staticmethod
+    def _check_columns(available: list[str], required: list[str]) -> None:
+        """
+        Reject projected or filtered columns missing from the table
+        """
+        missing = [column for column in required if column not in available]
+        if missing:
+            raise ValueError(f"Columns not found in table: {missing}")
+
+    def create_query_source(self, table_name: str | None = None) -> SqliteQuerySource:
+        """
+        Open a table for query-on-demand browsing without loading it
+        
+        Filters and sorting applied to the source run in SQLite; only the
+        requested rows are fetched.
+        
+        Args:
+            table_name: Name of the table to browse (if None, first table)
             
-        except Exception as e:
-            raise Exception(f"Error loading SQLite file in chunks: {str(e)}")
+        Returns:
+            SqliteQuerySource over the table
+        """
+        if table_name is None:
+            table_names = self.get_table_names()
+            table_name = table_names[0] if table_names else None
+        if table_name is None:
+            raise ValueError("No tables found in the database")
+        # The source is created in a worker thread and then read from the GUI thread
+        return SqliteQuerySource(self.filepath, table_name, self._connect(check_same_thread=False))
+
+    def _connect(self, check_same_thread: bool = True) -> sqlite3.Connection:
+        """
+        Open a read-only connection to the database file
+        """
+        return sqlite3.connect(f"{Path(self.filepath).resolve().as_uri()}?mode=ro", uri=True,
+                               check_same_thread=check_same_thread)
 
     def get_table_names(self) -> list[str]:
         """
@@ -0,0 +1,211 @@
+"""
+SQLite Query Source
+Query-on-demand access to a SQLite table: filters and sorting run in the database
+"""
+
+import re
+import sqlite3
+from typing import Any
+import pandas as pd
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a table or column name for use in SQL
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _regexp(pattern: str, value: Any) -> bool:
+    return value is not None and re.search(pattern, str(value)) is not None
+
+
+def _casefold(value: Any) -> str | None:
+    return None if value is None else str(value).casefold()
+
+
+def build_where_clause(filters: list[dict[str, Any]]) -> tuple[str, list[Any]]:
+    """
+    Translate filter specs into a SQL WHERE clause
+
+    Specs use the same keys FilterService records in its history:
+    {'column', 'term', 'case_sensitive'} for text, {'column', 'term', 'regex'},
+    {'column', 'operator', 'value'} for numbers, {'column', 'start_date',
+    'end_date'} for dates and {'column', 'values', 'exclude'} for value lists.
+    Conditions keep the pandas semantics of the matching FilterService method.
+    Case-insensitive matches compare casefolded text, so non-ASCII letters
+    match in any case as with str.contains(case=False); SQL LIKE would only
+    fold ASCII. The connection must have the CASEFOLD and REGEXP functions
+    registered (SqliteQuerySource does it).
+
+    Returns:
+        Tuple (clause without the WHERE keyword, parameters); empty clause if no filters
+    """
+    conditions: list[str] = []
+    params: list[Any] = []
+
+    for spec in filters:
+        column = quote_identifier(spec['column'])
+        if 'term' in spec and spec.get('regex'):
+            conditions.append(f"{column} REGEXP ?")
+            params.append(spec['term'])
+        elif 'term' in spec:
+            if spec.get('case_sensitive'):
+                conditions.append(f"instr(CAST({column} AS TEXT), ?) > 0")
+                params.append(spec['term'])
+            else:
+                conditions.append(f"instr(CASEFOLD({column}), ?) > 0")
+                params.append(spec['term'].casefold())
+        elif 'operator' in spec:
+            operator = spec['operator']
+            if operator not in ('>', '<', '>=', '<=', '==', '!='):
+                raise ValueError(f"Unknown operator: {operator}")
+            if operator == '!=':
+                # NaN != value is True in pandas
+                conditions.append(f"({column} IS NULL OR {column} != ?)")
+            else:
+                conditions.append(f"{column} {'=' if operator == '==' else operator} ?")
+            params.append(float(spec['value']))
+        elif 'start_date' in spec or 'end_date' in spec:
+            # Values that are not dates are dropped, as pd.to_datetime(errors='coerce') does
+            conditions.append(f"julianday({column}) IS NOT NULL")
+            if spec.get('start_date'):
+                conditions.append(f"julianday({column}) >= julianday(?)")
+                params.append(str(pd.to_datetime(spec['start_date'])))
+            if spec.get('end_date'):
+                conditions.append(f"julianday({column}) <= julianday(?)")
+                params.append(str(pd.to_datetime(spec['end_date'])))
+        elif 'values' in spec:
+            # isin() matches missing values when the list has one; SQL IN never matches NULL
+            values = [value for value in spec['values'] if not pd.isna(value)]
+            has_null = len(values) < len(spec['values'])
+            listed = f"{column} IN ({', '.join('?' for _ in values)})" if values else "0"
+            if spec.get('exclude'):
+                null_clause = f"{column} IS NOT NULL AND " if has_null else f"{column} IS NULL OR "
+                conditions.append(f"({null_clause}NOT {listed})")
+            else:
+                conditions.append(f"({column} IS NULL OR {listed})" if has_null else listed)
+            params.extend(values)
+        else:
+            raise ValueError(f"Unsupported filter: {spec}")
+
+    return " AND ".join(conditions), params
+
+
+class SqliteQuerySource:
+    """
+    Filtered and sorted view of a SQLite table, read one page at a time
+
+    Filtering and sorting are pushed into SQL; read_rows() fetches only the
+    requested rows. Pages read in order over an unsorted rowid table continue
+    from the last rowid seen (keyset) instead of re-skipping rows with OFFSET.
+    """
+
+    def __init__(self, filepath: str, table_name: str, connection: sqlite3.Connection) -> None:
+        self.filepath = filepath
+        self.table_name = table_name
+        self.is_complete: bool = True
+        self._connection = connection
+        self._connection.create_function('REGEXP', 2, _regexp, deterministic=True)
+        self._connection.create_function('CASEFOLD', 1, _casefold, deterministic=True)
+        self._table = quote_identifier(table_name)
+
+        cursor = self._connection.execute(f"SELECT * FROM {self._table} LIMIT 0")
+        self.columns: list[str] = [description[0] for description in cursor.description]
+        self._has_rowid = self._check_rowid()
+
+        self.filters: list[dict[str, Any]] = []
+        self.sort_column: str | None = None
+        self.sort_ascending: bool = True
+        self._where = ""
+        self._params: list[Any] = []
+        # First row of a page -> rowid of the row before it
+        self._keyset: dict[int, int] = {}
+        self.row_count: int = self._count()
+
+    def _check_rowid(self) -> bool:
+        """
+        Views and WITHOUT ROWID tables have no rowid to page on
+        """
+        try:
+            self._connection.execute(f"SELECT rowid FROM {self._table} LIMIT 0")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    def _count(self) -> int:
+        where = f" WHERE {self._where}" if self._where else ""
+        return int(self._connection.execute(f"SELECT COUNT(*) FROM {self._table}{where}", self._params).fetchone()[0])
+
+    def set_filters(self, filters: list[dict[str, Any]]) -> None:
+        """
+        Replace the active filters and recount matching rows
+
+        Args:
+            filters: Filter specs (see build_where_clause)
+        """
+        for spec in filters:
+            if spec['column'] not in self.columns:
+                raise ValueError(f"Column '{spec['column']}' not found in table {self.table_name}")
+        self._where, self._params = build_where_clause(filters)
+        self.filters = list(filters)
+        self._keyset.clear()
+        self.row_count = self._count()
+
+    def set_sort(self, column: str | None, ascending: bool = True) -> None:
+        """
+        Order rows by a column (None restores table order); NULLs go last as in pandas
+        """
+        if column is not None and column not in self.columns:
+            raise ValueError(f"Column '{column}' not found in table {self.table_name}")
+        self.sort_column = column
+        self.sort_ascending = ascending
+        self._keyset.clear()
+
+    def read_rows(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        Fetch rows [start, stop) of the filtered, sorted result
+
+        Returns:
+            DataFrame indexed by absolute row position
+        """
+        stop = min(stop, self.row_count)
+        if start >= stop:
+            return pd.DataFrame(columns=self.columns)
+
+        conditions = [f"({self._where})"] if self._where else []
+        params = list(self._params)
+        use_keyset = self._has_rowid and self.sort_column is None and start in self._keyset
+        if use_keyset:
+            conditions.append("rowid > ?")
+            params.append(self._keyset[start])
+
+        select = "rowid, *" if self._has_rowid else "*"
+        query = f"SELECT {select} FROM {self._table}"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        if self.sort_column is not None:
+            direction = "ASC" if self.sort_ascending else "DESC"
+            query += f" ORDER BY {quote_identifier(self.sort_column)} IS NULL, {quote_identifier(self.sort_column)} {direction}"
+        elif self._has_rowid:
+            query += " ORDER BY rowid"
+        query += " LIMIT ?"
+        params.append(stop - start)
+        if not use_keyset:
+            query += " OFFSET ?"
+            params.append(start)
+
+        rows = self._connection.execute(query, params).fetchall()
+        if self._has_rowid:
+            if rows and self.sort_column is None:
+                self._keyset[start + len(rows)] = rows[-1][0]
+            rows = [row[1:] for row in rows]
+
+        df = pd.DataFrame.from_records(rows, columns=self.columns)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def close(self) -> None:
+        """
+        Close the database connection
+        """
+        self._connection.close()
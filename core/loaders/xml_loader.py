@@ -3,26 +3,54 @@ XML File Loader
 Handles eXtensible Markup Language format
 """
 
+import csv
+import io
 import pandas as pd
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from .base_loader import FileLoader
+from .compression import open_source
+from .selection import required_columns, select_chunks, select_frame
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Binary block size when scanning the file for rough element counts
+SCAN_BLOCK_SIZE = 1024 * 1024
 
 class XmlLoader(FileLoader):
     """
     File loader for XML format
+
+    Records are the elements named record_tag; by default the children of the
+    root element, as in pandas.read_xml. The application never sets
+    record_tag: the load options dialog has no field for it, so files opened
+    from the UI always use the tag of the root's first child (reported as
+    record_tag by get_file_info). Set it through the API to read other records.
     """
 
+    supports_compression = True
+
+    def __init__(self, filepath: str, record_tag: str | None = None) -> None:
+        super().__init__(filepath)
+        self.record_tag = record_tag
+
     def get_supported_extensions(self) -> list[str]:
         return ['.xml']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load XML file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning (not applicable for XML, kept for interface compatibility)
             column_names: Dictionary for renaming columns
+            columns: Columns to keep (projection)
+            filters: Row filters as (column, operator, value) tuples, combined with AND
             
         Returns:
             DataFrame with loaded data
@@ -30,7 +58,8 @@ class XmlLoader(FileLoader):
         try:
             # Try using pandas read_xml first (pandas 1.3.0+)
             try:
-                df = pd.read_xml(self.filepath)
+                with open_source(self.filepath) as source:
+                    df = pd.read_xml(source.input)
                 
                 # Apply skip_rows if specified
                 if 0 < skip_rows < len(df):
@@ -39,7 +68,8 @@ class XmlLoader(FileLoader):
             except AttributeError:
                 # Fallback to lxml for older pandas versions
                 from lxml import etree
-                tree = etree.parse(self.filepath)
+                with open_source(self.filepath) as source:
+                    tree = etree.parse(source.stream)
                 root = tree.getroot()
                 
                 data = []
@@ -55,6 +85,8 @@ class XmlLoader(FileLoader):
                 if 0 < skip_rows < len(df):
                     df = df.iloc[skip_rows:].reset_index(drop=True)
             
+            df = select_frame(df, columns, filters)
+            
             # Apply column renaming if specified
             if column_names:
                 df = df.rename(columns=column_names)
@@ -73,8 +105,8 @@ class XmlLoader(FileLoader):
             
             # Get basic XML structure information
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    content = f.read(1000)  # Read first 1KB
+                with open_source(self.filepath) as source:
+                    content = source.open_text().read(1000)  # Read first 1KB
                     root_tag = None
                     for line in content.split('\n'):
                         if line.strip().startswith('<') and not line.strip().startswith('<?'):
@@ -86,16 +118,22 @@ class XmlLoader(FileLoader):
             
             # Count elements (rough estimate)
             try:
-                with open(self.filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    element_count = content.count('<') // 2  # Rough estimate
+                element_count = self._count_tags() // 2
             except Exception:
                 element_count = 0
             
+            # Record elements the loader reads (the root's first child unless record_tag is set)
+            try:
+                record_tag = self.record_tag or (self._detect_record_tag() if LXML_AVAILABLE else None)
+            except Exception:
+                record_tag = None
+            
             return {
                 'format': 'XML',
                 'root_tag': root_tag,
+                'record_tag': record_tag.split('}')[-1] if record_tag else None,
                 'estimated_elements': element_count,
+                'compression': self.compression,
                 'file_size_bytes': file_size,
                 'file_size_mb': round(file_size / (1024 * 1024), 2)
             }
@@ -105,18 +143,163 @@ class XmlLoader(FileLoader):
     @staticmethod
     def can_load_chunks() -> bool:
         """
-        XML files do not support chunk loading
+        XML files support chunk loading through lxml iterparse
+        """
+        return LXML_AVAILABLE
+
+    def load_in_chunks(self, chunk_size: int = 1000) -> pd.DataFrame:
+        """
+        Load XML file in chunks for better memory management
+        """
+        try:
+            chunk_list = list(self.iter_chunks(chunk_size))
+            if not chunk_list:
+                return pd.DataFrame()
+            return pd.concat(chunk_list, ignore_index=True)
+
+        except Exception as e:
+            raise Exception(f"Error loading XML file in chunks {self.filepath}: {str(e)}")
+
+    def iter_chunks(self, chunk_size: int = 1000, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+                    record_tag: str | None = None,
+                    progress_callback: Callable[[int, int], None] | None = None,
+                    columns: list[str] | None = None,
+                    filters: list[tuple[str, str, Any]] | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream XML records as DataFrame chunks with lxml iterparse
+
+        Each record is cleared, and its processed siblings removed, as soon as it
+        is read, so memory stays bounded by chunk_size instead of the document.
+        Record fields follow pandas.read_xml: attributes, the record's own text
+        and the text of its child elements, with dtypes inferred the same way.
+
+        Args:
+            chunk_size: Number of records per chunk
+            skip_rows: Number of records to skip at the beginning
+            column_names: Dictionary for renaming columns
+            record_tag: Tag of the record elements (overrides the loader's record_tag;
+                default: children of the root). Without a namespace it matches any namespace.
+            progress_callback: Called with (records_parsed, estimated_total_records) before each chunk,
+                extrapolated from the (compressed) bytes consumed
+            columns: Columns to keep (projection); other fields of each record are
+                dropped before the chunk is built
+            filters: Row filters as (column, operator, value) tuples, combined with AND
+
+        Yields:
+            DataFrame chunks in document order; chunks left empty by the filters are skipped
+        """
+        if not LXML_AVAILABLE:
+            raise ImportError("lxml is required to stream XML files")
+
+        tag = record_tag or self.record_tag or self._detect_record_tag()
+        if tag is None:
+            return
+        if not tag.startswith('{'):
+            tag = '{*}' + tag
+
+        for chunk in select_chunks(self._iter_records(tag, chunk_size, skip_rows, required_columns(columns, filters),
+                                                       progress_callback),
+                                   columns, filters):
+            yield chunk.rename(columns=column_names) if column_names else chunk
+
+    def _iter_records(self, tag: str, chunk_size: int, skip_rows: int, usecols: list[str] | None,
+                      progress_callback: Callable[[int, int], None] | None) -> Iterator[pd.DataFrame]:
+        """
+        Parse record elements into DataFrame chunks, keeping only the usecols fields when given
+        """
+        records: list[dict[str, str | None]] = []
+        rows_parsed = 0
+        with open_source(self.filepath) as source:
+            for _, element in etree.iterparse(source.stream, events=('end',), tag=tag, huge_tree=True):
+                rows_parsed += 1
+                if skip_rows > 0:
+                    skip_rows -= 1
+                else:
+                    fields = self._record_fields(element)
+                    if usecols is not None:
+                        fields = {column: fields[column] for column in usecols if column in fields}
+                    records.append(fields)
+                # Drop the record and everything before it that is already processed
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+                if len(records) >= chunk_size:
+                    if progress_callback is not None:
+                        progress_callback(rows_parsed, source.estimate_total(rows_parsed))
+                    yield self._records_to_frame(records, usecols)
+                    records = []
+
+        if records:
+            if progress_callback is not None:
+                progress_callback(rows_parsed, rows_parsed)
+            yield self._records_to_frame(records, usecols)
+
+    def _detect_record_tag(self) -> str | None:
+        """
+        Tag of the first child of the root element, read without parsing the rest
+        """
+        with open_source(self.filepath) as source:
+            depth = 0
+            for event, element in etree.iterparse(source.stream, events=('start', 'end'), huge_tree=True):
+                if event == 'end':
+                    depth -= 1
+                    continue
+                depth += 1
+                if depth == 2:
+                    return element.tag
+        return None
+
+    @staticmethod
+    def _record_fields(element: Any) -> dict[str, str | None]:
+        """
+        Fields of one record element, named like pandas.read_xml (namespaces removed)
+        """
+        fields: dict[str, str | None] = dict(element.attrib)
+        if element.text and not element.text.isspace():
+            fields[element.tag] = element.text
+        for child in element.findall('*'):
+            fields[child.tag] = child.text if child.text else None
+        return {key.split('}')[1] if '}' in key else key: value for key, value in fields.items()}
+
+    @staticmethod
+    def _records_to_frame(records: list[dict[str, str | None]], usecols: list[str] | None = None) -> pd.DataFrame:
+        """
+        Build a chunk from record fields, inferring dtypes like pandas.read_xml
+
+        The fields are written as CSV text and parsed with read_csv, which
+        applies the same type inference and missing-value rules read_xml uses.
+        With usecols every chunk has exactly those columns, empty where the
+        records lack the field, so filters see the same schema in every chunk
+        """
+        columns = list(usecols) if usecols is not None else list(dict.fromkeys(key for record in records for key in record))
+        if not columns:
+            return pd.DataFrame(index=pd.RangeIndex(len(records)))
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([record.get(column) for column in columns] for record in records)
+        buffer.seek(0)
+        # Blank lines are records whose only field is empty: keep them as missing values
+        return pd.read_csv(buffer, header=None, names=columns, skip_blank_lines=False)
+
+    def _count_tags(self) -> int:
+        """
+        Count '<' characters with buffered binary reads of the decompressed content
         """
-        return False
+        count = 0
+        with open_source(self.filepath) as source:
+            while True:
+                block = source.stream.read(SCAN_BLOCK_SIZE)
+                if not block:
+                    break
+                count += block.count(b'<')
+        return count
 
     def _estimate_rows(self) -> int:
         """
         Estimate number of rows in XML file
         """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                # Count root children (rough estimate)
-                return content.count('<') // 2
+            # Count root children (rough estimate)
+            return self._count_tags() // 2
         except Exception:
             return super()._estimate_rows()
\ No newline at end of file
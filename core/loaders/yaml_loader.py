@@ -7,6 +7,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Any
 from .base_loader import FileLoader
+from .selection import select_frame
 
 class YamlLoader(FileLoader):
     """
@@ -16,13 +17,16 @@ class YamlLoader(FileLoader):
     def get_supported_extensions(self) -> list[str]:
         return ['.yaml', '.yml']
 
-    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None) -> pd.DataFrame:
+    def load(self, skip_rows: int = 0, column_names: dict[str, str] | None = None,
+             columns: list[str] | None = None, filters: list[tuple[str, str, Any]] | None = None) -> pd.DataFrame:
         """
         Load YAML file into DataFrame
         
         Args:
             skip_rows: Number of rows to skip at the beginning (not applicable for YAML, kept for interface compatibility)
             column_names: Dictionary for renaming columns
+            columns: Columns to keep (projection)
+            filters: Row filters as (column, operator, value) tuples, combined with AND
             
         Returns:
             DataFrame with loaded data
@@ -59,6 +63,7 @@ class YamlLoader(FileLoader):
             # Apply skip_rows if specified
             if 0 < skip_rows < len(df):
                 df = df.iloc[skip_rows:].reset_index(drop=True)
+            df = select_frame(df, columns, filters)
             
             # Apply column renaming if specified
             if column_names:
@@ -73,7 +73,7 @@ class PerformanceOptimizer:
         unique_groups = df[separator_column].nunique()
         
         # Análisis de distribución de grupos
-        group_sizes = df.groupby(separator_column).size()
+        group_sizes = df.groupby(separator_column, observed=True).size()
         largest_group_size = group_sizes.max()
         group_size_variance = group_sizes.var()
         
@@ -145,7 +145,7 @@ class PerformanceOptimizer:
             return
             
         # Agrupar datos normales
-        grouped = normal_data.groupby(separator_column)
+        grouped = normal_data.groupby(separator_column, observed=True)
         
         for group_name, group_df in grouped:
             # Aplicar chunking si es necesario
@@ -16,6 +16,7 @@ from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QDialog
 from app.resources import get_asset_path
 
 from core.join.join_history import JoinHistory
+from core.loaders.compression import get_data_extension
 
 # Importar servicios y gestores
 from app.services import DataService, ExportService, FilterService, PivotService, CleaningService, JoinService
@@ -157,6 +158,7 @@ class MainWindow(QMainWindow):
         if data_view:
             data_view.filter_applied.connect(self.coordinator.on_filter_applied)
             data_view.filter_cleared.connect(self.coordinator.on_filter_cleared)
+            data_view.load_full_requested.connect(self.coordinator.cargar_archivo_completo)
         
         if joined_view:
             joined_view.new_join_requested.connect(self.coordinator.abrir_cruzar_datos)
@@ -191,11 +193,11 @@ class MainWindow(QMainWindow):
     
     # ==================== SEÑALES ====================
     
-    def _on_reload_with_options(self, filepath: str, skip_rows: int, column_names: dict[str, str], enable_column_visibility: bool = True) -> None:
+    def _on_reload_with_options(self, filepath: str, skip_rows: int, column_names: dict[str, str], enable_column_visibility: bool = True, columns: list[str] | None = None, filters: list[tuple[str, str, str]] | None = None, key: str = "") -> None:
         """Manejar recarga con opciones"""
         separator = None
         sheet_name = None
-        suffix = Path(filepath).suffix.lower()
+        suffix = get_data_extension(filepath)
         if suffix in ('.csv', '.tsv'):
             from app.widgets.csv_separator_dialog import CSVSeparatorDialog
             csv_dialog = CSVSeparatorDialog(self)
@@ -210,7 +212,7 @@ class MainWindow(QMainWindow):
                 sheet_name = excel_dialog.get_sheet_name()
             else:
                 return
-        self.coordinator.iniciar_carga_archivo(filepath, skip_rows, column_names, enable_column_visibility=enable_column_visibility, separator=separator, sheet_name=sheet_name)
+        self.coordinator.iniciar_carga_archivo(filepath, skip_rows, column_names, enable_column_visibility=enable_column_visibility, separator=separator, sheet_name=sheet_name, columns=columns or None, filters=filters or None, key=key or None)
     
     # ==================== EVENTOS ====================
     
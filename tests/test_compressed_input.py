@@ -0,0 +1,95 @@
+"""
+Tests for reading compressed files (data.csv.gz) through decompressing streams
+"""
+
+import bz2
+import gzip
+import json
+import lzma
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pathlib import Path
+from core.loaders import get_file_loader, is_file_supported
+from core.loaders.compression import get_data_extension, get_extension, open_source
+from core.loaders.csv_loader import CsvLoader
+from core.data_handler import cargar_datos_con_opciones
+
+
+def _write_zstd(filepath: str, data: bytes) -> None:
+    with pa.CompressedOutputStream(filepath, 'zstd') as out:
+        out.write(data)
+
+
+class TestCompressedInput:
+    """Test compound extensions and streaming decompression in the loaders"""
+
+    def setup_method(self) -> None:
+        """Create the same CSV with every supported codec"""
+        self.df = pd.DataFrame({'id': range(3000), 'city': ['Lima', 'Quito', 'Cusco'] * 1000})
+        data = self.df.to_csv(index=False).encode()
+        self.files = {
+            'gzip': "test_compressed.csv.gz",
+            'bz2': "test_compressed.csv.bz2",
+            'xz': "test_compressed.csv.xz",
+            'zstd': "test_compressed.csv.zst",
+        }
+        Path(self.files['gzip']).write_bytes(gzip.compress(data))
+        Path(self.files['bz2']).write_bytes(bz2.compress(data))
+        Path(self.files['xz']).write_bytes(lzma.compress(data))
+        _write_zstd(self.files['zstd'], data)
+
+    def teardown_method(self) -> None:
+        """Clean up test files"""
+        for filepath in list(self.files.values()) + ["test_events.jsonl.bz2", "test_feed.xml.xz"]:
+            if Path(filepath).exists():
+                Path(filepath).unlink()
+
+    def test_compound_extensions(self) -> None:
+        """Test the inner format decides the loader"""
+        assert get_extension("data.CSV.GZ") == '.csv.gz'
+        assert get_data_extension("data.csv.gz") == '.csv'
+        assert get_data_extension("archive.2024.tsv") == '.tsv'
+        assert is_file_supported("events.json.bz2")
+        assert not is_file_supported("data.parquet.gz")
+        assert isinstance(get_file_loader(self.files['gzip']), CsvLoader)
+
+    def test_csv_codecs_load_and_stream(self) -> None:
+        """Test full and chunked loads decompress on the fly with progress"""
+        for compression, filepath in self.files.items():
+            loader = CsvLoader(filepath)
+            assert loader.compression == compression
+            pd.testing.assert_frame_equal(loader.load(), self.df)
+
+            progress: list[tuple[int, int]] = []
+            chunks = list(loader.iter_chunks(1000, progress_callback=lambda done, total: progress.append((done, total))))
+            pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), self.df)
+            assert [done for done, _ in progress] == [1000, 2000, 3000]
+            assert all(total >= done for done, total in progress)
+            assert abs(loader.count_rows() - 3000) <= 1
+
+    def test_compressed_csv_has_no_row_index(self) -> None:
+        """Test random access is refused for compressed files"""
+        with pytest.raises(ValueError, match="Compressed"):
+            CsvLoader(self.files['gzip']).create_row_index()
+
+    def test_json_lines_and_xml(self) -> None:
+        """Test JSON Lines and XML loaders read through the same streams"""
+        records = "".join(json.dumps({'id': i}) + "\n" for i in range(50))
+        Path("test_events.jsonl.bz2").write_bytes(bz2.compress(records.encode()))
+        df = cargar_datos_con_opciones("test_events.jsonl.bz2", chunk_size=20)
+        assert df['id'].tolist() == list(range(50))
+
+        rows = "".join(f'<row id="{i}"><name>n{i}</name></row>' for i in range(30))
+        Path("test_feed.xml.xz").write_bytes(lzma.compress(f'<data>{rows}</data>'.encode()))
+        loader = get_file_loader("test_feed.xml.xz")
+        assert [len(chunk) for chunk in loader.iter_chunks(20)] == [20, 10]
+        assert loader.load()['name'].tolist()[-1] == 'n29'
+
+    def test_source_reports_compressed_offsets(self) -> None:
+        """Test position and size are measured on the compressed file"""
+        with open_source(self.files['gzip']) as source:
+            assert source.position == 0
+            source.stream.read(1024)
+            assert 0 < source.position <= source.size
+            assert source.size == Path(self.files['gzip']).stat().st_size
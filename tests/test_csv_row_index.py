@@ -0,0 +1,85 @@
+"""
+Tests for the CSV byte-offset row index and the disk-backed table model
+"""
+
+import pandas as pd
+from pathlib import Path
+from PySide6.QtCore import Qt
+from core.loaders.csv_loader import CsvLoader
+from app.models.pandas_model import LazyCsvModel
+from app.services.data_service import DataService
+
+
+class TestCsvRowIndex:
+    """Test random access to CSV rows through the offset index"""
+
+    def setup_method(self) -> None:
+        """Create a CSV larger than a few index steps"""
+        self.csv_file = "test_row_index.csv"
+        self.df = pd.DataFrame({
+            'id': range(2500),
+            'name': [f'name_{i}' for i in range(2500)],
+        })
+        with open(self.csv_file, 'w') as f:
+            f.write("exported report\n")
+        self.df.to_csv(self.csv_file, mode='a', index=False)
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.csv_file).exists():
+            Path(self.csv_file).unlink()
+
+    def _build_index(self, step: int = 100) -> object:
+        row_index = CsvLoader(self.csv_file).create_row_index(
+            step=step, skip_rows=1, column_names={'name': 'nombre'}
+        )
+        row_index.build()
+        return row_index
+
+    def test_index_row_count_and_columns(self) -> None:
+        """Test the index counts data rows and applies header options"""
+        row_index = self._build_index()
+        assert row_index.is_complete
+        assert row_index.row_count == 2500
+        assert row_index.columns == ['id', 'nombre']
+        assert row_index.get_memory_usage() == 25 * 8
+
+    def test_read_rows_matches_file(self) -> None:
+        """Test arbitrary row ranges parse straight from disk"""
+        row_index = self._build_index()
+        for start, stop in [(0, 5), (99, 101), (1234, 1300), (2490, 2600)]:
+            chunk = row_index.read_rows(start, stop)
+            expected = self.df.iloc[start:stop].rename(columns={'name': 'nombre'})
+            assert list(chunk.index) == list(expected.index)
+            assert chunk['id'].tolist() == expected['id'].tolist()
+            assert chunk['nombre'].tolist() == expected['nombre'].tolist()
+
+    def test_lazy_model_reads_visible_chunk(self) -> None:
+        """Test the lazy model serves cells from disk chunk by chunk"""
+        model = LazyCsvModel(self._build_index(step=1000), chunk_size=1000)
+        assert model.rowCount() == 2500
+        assert model.columnCount() == 2
+        assert model.headerData(1, Qt.Horizontal) == 'nombre'
+        assert model.data(model.index(2499, 1)) == 'name_2499'
+        assert list(model.data_cache) == [2]
+
+    def test_lazy_model_grows_with_index(self) -> None:
+        """Test rows indexed after the model is created are appended"""
+        row_index = CsvLoader(self.csv_file).create_row_index(step=1000, skip_rows=1)
+        model = LazyCsvModel(row_index, chunk_size=1000)
+        assert model.rowCount() == 0
+        
+        row_index.build()
+        model.refresh_row_count()
+        assert model.rowCount() == 2500
+        assert model.data(model.index(1500, 0)) == '1500'
+
+    def test_index_thread_names_the_indexed_file(self) -> None:
+        """Test the file being indexed replaces the previously loaded one in status messages"""
+        service = DataService()
+        service.create_loader_thread("previous.csv")
+        service.create_index_thread(self.csv_file)
+        assert service.get_filepath() == self.csv_file
+        assert service.get_filename() == self.csv_file
+        service.create_disk_source_thread("table.parquet")
+        assert service.get_filepath() == "table.parquet"
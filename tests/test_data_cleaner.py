@@ -0,0 +1,44 @@
+"""
+Pruebas para core/data_cleaner.py sobre columnas de texto compactadas.
+"""
+
+import pandas as pd
+
+from core.data_cleaner import limpiar_espacios_texto, resumen_limpieza
+from core.data_handler import compactar_tipos
+from app.services.profiler_service import ProfilerService
+
+
+def _df_con_espacios():
+    return pd.DataFrame({
+        'ciudad': pd.Series([' Madrid', 'Madrid ', 'Lima', 'Lima'] * 50, dtype=object),
+        'codigo': pd.Series([f' c{i} ' for i in range(200)], dtype=object),
+        'valor': range(200),
+    })
+
+
+def test_limpia_columnas_compactadas():
+    compactado = compactar_tipos(_df_con_espacios(), category_max_ratio=0.5, arrow_strings=True)
+    assert isinstance(compactado['ciudad'].dtype, pd.CategoricalDtype)
+    assert isinstance(compactado['codigo'].dtype, pd.StringDtype)
+
+    limpio = limpiar_espacios_texto(compactado)
+    # ' Madrid' y 'Madrid ' se fusionan en una sola categoría
+    assert sorted(limpio['ciudad'].cat.categories) == ['Lima', 'Madrid']
+    assert limpio['ciudad'].tolist() == ['Madrid', 'Madrid', 'Lima', 'Lima'] * 50
+    assert limpio['codigo'].tolist() == [f'c{i}' for i in range(200)]
+    assert limpio['valor'].tolist() == list(range(200))
+
+
+def test_resumen_detecta_espacios_en_columnas_compactadas():
+    compactado = compactar_tipos(_df_con_espacios(), category_max_ratio=0.5, arrow_strings=True)
+    resumen = resumen_limpieza(compactado, limpiar_espacios_texto(compactado))
+    assert sorted(resumen['columns_affected']) == ['ciudad', 'codigo']
+
+    sin_espacios = compactado.iloc[2:4]
+    assert resumen_limpieza(sin_espacios, sin_espacios)['columns_affected'] == ['codigo']
+
+
+def test_perfil_de_columna_category():
+    compactado = compactar_tipos(_df_con_espacios(), category_max_ratio=0.5, arrow_strings=True)
+    assert ProfilerService._get_detailed_type(compactado['ciudad']) == 'string'
@@ -13,8 +13,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 from core.data_handler import (
     cargar_datos, obtener_metadata, obtener_estadisticas,
-    obtener_estadisticas_basicas, aplicar_filtro
+    obtener_estadisticas_basicas, aplicar_filtro, compactar_tipos,
+    cargar_vista_previa, cargar_muestra, cargar_datos_con_opciones
 )
+from config import optimization_config
 
 
 class TestDataHandler(unittest.TestCase):
@@ -192,6 +194,123 @@ class TestDataHandler(unittest.TestCase):
         self.assertNotIn('Nombre', stats.columns)
         self.assertNotIn('Ciudad', stats.columns)
 
+    def test_compactar_tipos_sin_perdida(self) -> None:
+        """Prueba que la compactación reduce memoria sin cambiar los valores"""
+        df = pd.DataFrame({
+            'id': range(1000),
+            'ciudad': pd.Series(['Madrid', 'Bilbao'] * 500, dtype=object),
+            'codigo': pd.Series([f"c{i}" for i in range(1000)], dtype=object),
+            'mitad': [0.5] * 1000,
+            'precio': [0.1] * 1000,
+        })
+        original = df.copy()
+        compactado = compactar_tipos(df, category_max_ratio=0.5, arrow_strings=True)
+
+        self.assertEqual(compactado['id'].dtype, 'int16')
+        self.assertEqual(compactado['ciudad'].dtype, 'category')
+        self.assertEqual(compactado['codigo'].dtype, 'string')
+        self.assertEqual(compactado['mitad'].dtype, 'float32')
+        # 0.1 no es representable exactamente en float32
+        self.assertEqual(compactado['precio'].dtype, 'float64')
+        for columna in original.columns:
+            self.assertEqual(compactado[columna].tolist(), original[columna].tolist())
+
+        resumen = compactado.attrs['compactacion']
+        self.assertLess(resumen['memoria_despues_mb'], resumen['memoria_antes_mb'])
+        self.assertIn('ciudad', resumen['columnas_convertidas'])
+
+    def test_compactar_por_lotes_al_cargar_chunks(self) -> None:
+        """Prueba que la carga por chunks compacta por lotes y une las categorías de cada lote"""
+        csv_path = str(Path(self.temp_dir) / 'lotes.csv')
+        df = pd.DataFrame({
+            'id': range(3000),
+            'ciudad': ['Madrid', 'Bilbao'] * 500 + ['Lima', 'Quito'] * 1000,
+            'codigo': [f"c{i}" for i in range(3000)],
+        })
+        df.to_csv(csv_path, index=False)
+
+        batch_rows = optimization_config.COMPACT_BATCH_ROWS
+        optimization_config.COMPACT_BATCH_ROWS = 1000
+        try:
+            cargado = cargar_datos_con_opciones(csv_path, chunk_size=500, compact_dtypes=True)
+        finally:
+            optimization_config.COMPACT_BATCH_ROWS = batch_rows
+
+        self.assertEqual(cargado['ciudad'].dtype, 'category')
+        self.assertEqual(sorted(cargado['ciudad'].cat.categories), ['Bilbao', 'Lima', 'Madrid', 'Quito'])
+        self.assertEqual(cargado['codigo'].dtype, 'string')
+        self.assertEqual(cargado['id'].dtype, 'int16')
+        for columna in df.columns:
+            self.assertEqual(cargado[columna].tolist(), df[columna].tolist())
+
+        resumen = cargado.attrs['compactacion']
+        self.assertLess(resumen['memoria_despues_mb'], resumen['memoria_antes_mb'])
+        self.assertIn('id', resumen['columnas_convertidas'])
+        self.assertIn('ciudad', resumen['columnas_convertidas'])
+
+    def test_lotes_no_fuerzan_category_con_muchos_valores(self) -> None:
+        """Prueba que una columna category en un lote y texto en otro no queda category si la unión no compensa"""
+        csv_path = str(Path(self.temp_dir) / 'lotes_mixtos.csv')
+        df = pd.DataFrame({
+            'id': range(3000),
+            'ref': ['A', 'B'] * 500 + [f"ref-{i:05d}" for i in range(2000)],
+        })
+        df.to_csv(csv_path, index=False)
+
+        batch_rows = optimization_config.COMPACT_BATCH_ROWS
+        optimization_config.COMPACT_BATCH_ROWS = 1000
+        try:
+            cargado = cargar_datos_con_opciones(csv_path, chunk_size=500, compact_dtypes=True)
+        finally:
+            optimization_config.COMPACT_BATCH_ROWS = batch_rows
+
+        self.assertNotEqual(cargado['ref'].dtype, 'category')
+        self.assertEqual(cargado['ref'].tolist(), df['ref'].tolist())
+        resumen = cargado.attrs['compactacion']
+        memoria_final = int(cargado.memory_usage(deep=True, index=True).sum()) / 1024 / 1024
+        self.assertAlmostEqual(resumen['memoria_despues_mb'], memoria_final)
+        self.assertLess(resumen['memoria_despues_mb'], resumen['memoria_antes_mb'])
+
+    def test_cargar_vista_previa(self) -> None:
+        """Prueba que la vista previa lee solo las primeras filas de cada formato"""
+        df = pd.DataFrame({'id': range(5000), 'valor': [1.5] * 5000})
+
+        csv_path = Path(self.temp_dir) / "grande.csv"
+        csv_path.write_text("titulo\n" + df.to_csv(index=False))
+        preview = cargar_vista_previa(str(csv_path), 100, skip_rows=1, column_names={'valor': 'monto'})
+        self.assertEqual(len(preview), 100)
+        self.assertEqual(list(preview.columns), ['id', 'monto'])
+        self.assertEqual(preview['id'].tolist(), list(range(100)))
+
+        parquet_path = Path(self.temp_dir) / "grande.parquet"
+        df.to_parquet(parquet_path, row_group_size=1000)
+        preview = cargar_vista_previa(str(parquet_path), 100, columns=['id'])
+        self.assertEqual(list(preview.columns), ['id'])
+        self.assertEqual(len(preview), 100)
+
+        json_path = Path(self.temp_dir) / "datos.json"
+        df.head(10).to_json(json_path, orient='records')
+        self.assertIsNone(cargar_vista_previa(str(json_path), 5))
+
+
+    def test_cargar_muestra(self) -> None:
+        """Prueba que la muestra aleatoria aplica las opciones y anota las filas estimadas"""
+        df = pd.DataFrame({'id': range(3000), 'grupo': [i % 2 for i in range(3000)]})
+        csv_path = Path(self.temp_dir) / "grande.csv"
+        df.to_csv(csv_path, index=False)
+
+        muestra = cargar_muestra(str(csv_path), 200, columns=['id'], filters=[('grupo', '==', '0')],
+                                 column_names={'id': 'codigo'}, seed=3)
+        self.assertEqual(list(muestra.columns), ['codigo'])
+        self.assertTrue((muestra['codigo'] % 2 == 0).all())
+        self.assertEqual(muestra.attrs['muestra']['filas'], len(muestra))
+        self.assertEqual(muestra.attrs['muestra']['filas_estimadas'], 3000)
+
+        parquet_path = Path(self.temp_dir) / "datos.parquet"
+        df.to_parquet(parquet_path)
+        with self.assertRaises(ValueError):
+            cargar_muestra(str(parquet_path), 10)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+Tests for the persistent cache of parsed datasets
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pathlib import Path
+from config import optimization_config
+from core import data_handler
+from core.dataset_cache import DatasetCache, build_cache_key
+from core.loaders.csv_loader import CsvLoader
+
+
+@pytest.fixture
+def cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> DatasetCache:
+    """Route the global cache to a temporary directory and cache every file"""
+    cache = DatasetCache(tmp_path / "cache", max_bytes=64 * 1024 * 1024)
+    monkeypatch.setattr("core.dataset_cache.dataset_cache", cache)
+    monkeypatch.setattr(optimization_config, "DATASET_CACHE_MIN_FILE_SIZE", 0)
+    return cache
+
+
+class TestDatasetCache:
+    """Test fingerprint keys, LRU eviction and the load integration"""
+
+    def test_key_tracks_file_and_options(self, tmp_path: Path) -> None:
+        """Test editing the file or changing options gives a new key"""
+        filepath = tmp_path / "data.csv"
+        filepath.write_text("a,b\n1,2\n")
+        key = build_cache_key(str(filepath), skip_rows=0, separator=None)
+        assert key == build_cache_key(str(filepath), separator=None, skip_rows=0)
+        assert key != build_cache_key(str(filepath), skip_rows=1, separator=None)
+
+        filepath.write_text("a,b\n1,2\n3,4\n")
+        assert key != build_cache_key(str(filepath), skip_rows=0, separator=None)
+
+    def test_round_trip_preserves_dtypes(self, cache: DatasetCache) -> None:
+        """Test a stored frame comes back equal"""
+        df = pd.DataFrame({
+            'id': range(100),
+            'city': pd.Categorical(['Lima', 'Quito'] * 50),
+            'when': pd.date_range('2024-01-01', periods=100, freq='h'),
+        })
+        assert cache.put('k', df)
+        pd.testing.assert_frame_equal(cache.get('k'), df)
+        assert cache.get('missing') is None
+
+    def test_evicts_least_recently_used(self, cache: DatasetCache) -> None:
+        """Test the oldest entry is dropped once the size cap is exceeded"""
+        df = pd.DataFrame({'x': range(10000)})
+        cache.put('first', df)
+        cache.max_bytes = cache.total_bytes() * 2 + 1
+        cache.put('second', df)
+        cache.get('first')
+        cache.put('third', df)
+
+        assert cache.get('second') is None
+        assert cache.get('first') is not None
+        assert cache.get('third') is not None
+        assert cache.total_bytes() <= cache.max_bytes
+
+    def test_clear(self, cache: DatasetCache) -> None:
+        """Test clearing removes every copy and reports the freed bytes"""
+        cache.put('k', pd.DataFrame({'x': range(1000)}))
+        size = cache.total_bytes()
+        assert cache.clear() == size
+        assert cache.total_bytes() == 0
+        assert not list(cache.cache_dir.glob("*.feather"))
+
+    def test_hit_maps_columns_without_rewriting_index(self, cache: DatasetCache) -> None:
+        """Test a hit reads columns from the map without copying and leaves index.json alone"""
+        df = pd.DataFrame({
+            'id': np.arange(100000),
+            'amount': np.linspace(0, 1, 100000),
+            'city': pd.Categorical(['Lima', 'Quito'] * 50000),
+            'when': pd.date_range('2024-01-01', periods=100000, freq='min'),
+        })
+        assert cache.put('k', df)
+        index_path = cache.cache_dir / "index.json"
+        index_stat = index_path.stat().st_mtime_ns
+
+        allocated = pa.total_allocated_bytes()
+        cached = cache.get('k')
+        assert pa.total_allocated_bytes() - allocated < df.memory_usage().sum() // 10
+        pd.testing.assert_frame_equal(cached, df)
+        assert index_path.stat().st_mtime_ns == index_stat
+
+        # The map is copy-on-write: the loaded frame is editable and the cached copy stays intact
+        cached.loc[0, ['id', 'amount', 'city', 'when']] = [-1, 2.0, 'Quito', pd.Timestamp('2000-01-01')]
+        assert cached.loc[0, 'id'] == -1
+        pd.testing.assert_frame_equal(cache.get('k'), df)
+
+    def test_clear_removes_interrupted_writes(self, cache: DatasetCache) -> None:
+        """Test leftover .tmp files from interrupted writes are cleared too"""
+        (cache.cache_dir / "partial.tmp").write_bytes(b"x" * 100)
+        assert cache.clear() == 100
+        assert [path.name for path in cache.cache_dir.iterdir()] == ["index.json"]
+
+    def test_reopen_reads_cached_copy(self, cache: DatasetCache, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the second load skips parsing until the file changes"""
+        calls: list[str] = []
+        original_load = CsvLoader.load
+
+        def counting_load(loader: CsvLoader, *args, **kwargs) -> pd.DataFrame:
+            calls.append(loader.filepath)
+            return original_load(loader, *args, **kwargs)
+
+        monkeypatch.setattr(CsvLoader, "load", counting_load)
+        filepath = tmp_path / "sales.csv"
+        pd.DataFrame({'id': range(500), 'amount': [1.5] * 500}).to_csv(filepath, index=False)
+
+        first = data_handler.cargar_datos_con_opciones(str(filepath))
+        pd.testing.assert_frame_equal(data_handler.cargar_datos_con_opciones(str(filepath)), first)
+        assert len(calls) == 1
+
+        data_handler.cargar_datos_con_opciones(str(filepath), skip_rows=1)
+        assert len(calls) == 2
+
+        pd.DataFrame({'id': [1], 'amount': [2.0]}).to_csv(filepath, index=False)
+        assert len(data_handler.cargar_datos_con_opciones(str(filepath))) == 1
+        assert len(calls) == 3
@@ -159,6 +159,9 @@ class TestExcelTemplateSplitter(unittest.TestCase):
         resolved_path = splitter._resolve_filename_conflicts(test_path)
         self.assertNotEqual(resolved_path, test_path)
         self.assertTrue(resolved_path.endswith('.xlsx'))
+        # El archivo renumerado queda en la misma carpeta de salida
+        self.assertEqual(Path(resolved_path).parent, Path(self.config.output_folder))
+        Path(test_path).unlink()
     
     def test_separate_and_export_success(self) -> None:
         """Test exportación exitosa"""
@@ -3,6 +3,9 @@ Test suite for file loaders
 Tests the new modular file loader system
 """
 
+import json
+import re
+import zipfile
 import pytest
 import pandas as pd
 import tempfile
@@ -13,7 +16,13 @@ from core.loaders import (
     get_supported_formats
 )
 from core.loaders.csv_loader import CsvLoader
+from core.loaders.excel_loader import ExcelLoader
+from core.loaders.feather_loader import FeatherLoader
+from core.loaders.hdf5_loader import Hdf5Loader
 from core.loaders.json_loader import JsonLoader
+from core.loaders.parquet_loader import ParquetLoader
+from core.loaders.sqlite_loader import SqliteLoader
+from core.loaders.xml_loader import XmlLoader
 
 
 class TestFileLoaderFactory:
@@ -148,6 +157,251 @@ class TestCsvLoader:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 3
 
+    def test_csv_iter_chunks(self) -> None:
+        """Test streaming CSV chunks with load options"""
+        loader = CsvLoader(self.csv_file)
+        chunks = list(loader.iter_chunks(chunk_size=2, column_names={'name': 'first_name'}))
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert list(chunks[0].columns) == ['first_name', 'age', 'city']
+        
+        chunks = list(loader.iter_chunks(chunk_size=2, skip_rows=1))
+        assert sum(len(chunk) for chunk in chunks) == 2
+        assert list(chunks[0].columns) == ['Alice', '25', 'NYC']
+
+
+    def test_csv_row_estimation(self) -> None:
+        """Test sampled row estimate is close and exact mode is exact"""
+        with open(self.csv_file, 'w') as f:
+            f.write("id,name,value\n")
+            for i in range(50000):
+                f.write(f"{i},name_{i % 97},{i * 1.5}\n")
+        
+        loader = CsvLoader(self.csv_file)
+        assert loader.count_rows(exact=True) == 50000
+        assert abs(loader.count_rows() - 50000) < 2500
+        assert loader.get_memory_usage_info()['estimated_data_rows'] == loader.count_rows()
+
+    def test_csv_arrow_engine_matches_pandas(self) -> None:
+        """Test pyarrow and pandas engines honour the same options"""
+        with open(self.csv_file, 'w') as f:
+            f.write("report\nname;age;born;note\nAlice;25;2020-01-02;\nBob;;2021-03-04;x\n")
+        options = {'skip_rows': 1, 'column_names': {'name': 'nombre'}, 'separator': ';'}
+        
+        loader = CsvLoader(self.csv_file)
+        arrow_df = loader.load(**options)
+        loader.use_arrow_engine = False
+        pandas_df = loader.load(**options)
+        
+        pd.testing.assert_frame_equal(arrow_df, pandas_df)
+        assert list(arrow_df.columns) == ['nombre', 'age', 'born', 'note']
+
+    def test_csv_chunks_match_load_with_dates(self) -> None:
+        """Test streamed chunks keep date columns as the same text and dtype as load()"""
+        with open(self.csv_file, 'w') as f:
+            f.write("id,born,stamp\n")
+            for i in range(50):
+                f.write(f"{i},2024-01-{i % 28 + 1:02d},2024-01-01T10:{i:02d}\n")
+        
+        loader = CsvLoader(self.csv_file)
+        loaded = loader.load()
+        streamed = pd.concat(loader.iter_chunks(chunk_size=7), ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, loaded)
+        assert streamed['born'].iloc[0] == '2024-01-01'
+        assert streamed['stamp'].iloc[0] == '2024-01-01T10:00'
+
+    def test_csv_skip_rows_counts_blank_lines(self) -> None:
+        """Test both engines skip physical lines, blank ones included, before the header"""
+        with open(self.csv_file, 'w') as f:
+            f.write("report\n\nname,age\nAlice,25\nBob,30\n")
+        
+        loader = CsvLoader(self.csv_file)
+        for use_arrow in (True, False):
+            loader.use_arrow_engine = use_arrow
+            for skip_rows in (1, 2):
+                df = loader.load(skip_rows=skip_rows)
+                assert list(df.columns) == ['name', 'age'], (use_arrow, skip_rows)
+                chunks = list(loader.iter_chunks(chunk_size=1, skip_rows=skip_rows))
+                pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+    def test_csv_projection_and_filters(self) -> None:
+        """Test both engines and the chunked reader select columns and rows while parsing"""
+        options = {'columns': ['city', 'name'], 'filters': [('age', '>=', '30')]}
+        loader = CsvLoader(self.csv_file)
+        expected = pd.DataFrame({'city': ['LA', 'Chicago'], 'name': ['Bob', 'Charlie']})
+        pd.testing.assert_frame_equal(loader.load(**options), expected, check_dtype=False)
+        chunks = list(loader.iter_chunks(chunk_size=1, **options))
+        assert [len(chunk) for chunk in chunks] == [1, 1]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected, check_dtype=False)
+        loader.use_arrow_engine = False
+        pd.testing.assert_frame_equal(loader.load(**options), expected, check_dtype=False)
+
+        empty = list(loader.iter_chunks(chunk_size=1, columns=['name'], filters=[('age', '>', '99')]))
+        assert len(empty) == 1 and empty[0].empty and list(empty[0].columns) == ['name']
+
+    def test_csv_load_sample(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test streaming and seeking samplers return distinct rows in file order"""
+        import core.loaders.sampling as sampling
+
+        filepath = tmp_path / "big.csv"
+        filepath.write_text("report\n" + pd.DataFrame({'id': range(2000), 'value': [0.5] * 2000}).to_csv(index=False))
+        loader = CsvLoader(str(filepath))
+
+        streamed = loader.load_sample(100, skip_rows=1, seed=7)
+        assert list(streamed.columns) == ['id', 'value']
+        assert len(streamed) == 100 and streamed['id'].is_unique
+        assert streamed['id'].is_monotonic_increasing
+        assert streamed['id'].dtype.kind == 'i'
+        pd.testing.assert_frame_equal(loader.load_sample(100, skip_rows=1, seed=7), streamed)
+
+        monkeypatch.setattr(sampling, "SEEK_SAMPLE_MIN_SIZE", 0)
+        seeked = loader.load_sample(100, skip_rows=1, seed=7)
+        assert len(seeked) == 100 and seeked['id'].is_unique
+        assert seeked['id'].is_monotonic_increasing
+
+        assert len(loader.load_sample(5000, skip_rows=1)) == 2000
+
+
+def _write_minimal_xls(filepath: str, rows: int, columns: int) -> None:
+    """Write a compound file whose Workbook stream holds one sheet with a DIMENSIONS record"""
+    import struct
+
+    def record(record_type: int, data: bytes) -> bytes:
+        return struct.pack('<HH', record_type, len(data)) + data
+
+    bof = record(0x0809, struct.pack('<HHHHII', 0x0600, 0x0005, 0, 0, 0, 0))
+    sheet_name = b'Hoja1'
+    globals_size = len(bof) + len(record(0x0085, bytes(8) + sheet_name)) + len(record(0x000A, b''))
+    boundsheet = record(0x0085, struct.pack('<IBBBB', globals_size, 0, 0, len(sheet_name), 0) + sheet_name)
+    stream = bof + boundsheet + record(0x000A, b'')
+    stream += bof + record(0x0200, struct.pack('<IIHHH', 0, rows, 0, columns, 0)) + record(0x000A, b'')
+    stream = stream.ljust(4096, b'\0')
+
+    header = struct.pack('<8s16sHHHHH6sIIIIIIIII109I', b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', b'\0' * 16,
+                         0x3E, 3, 0xFFFE, 9, 6, b'\0' * 6, 0, 1, 1, 0, 4096, 0xFFFFFFFE, 0,
+                         0xFFFFFFFE, 0, 0, *([0xFFFFFFFF] * 108))
+    fat = [0xFFFFFFFD, 0xFFFFFFFE] + list(range(3, 10)) + [0xFFFFFFFE]
+    fat_sector = struct.pack('<128I', *(fat + [0xFFFFFFFF] * (128 - len(fat))))
+
+    def entry(name: str, entry_type: int, start: int, size: int) -> bytes:
+        encoded = (name + '\0').encode('utf-16-le')
+        return (encoded.ljust(64, b'\0') + struct.pack('<HBB', len(encoded), entry_type, 1)
+                + struct.pack('<III', 0xFFFFFFFF, 0xFFFFFFFF, 0xFFFFFFFF if entry_type == 2 else 1)
+                + b'\0' * 36 + struct.pack('<IQ', start, size))
+
+    directory = entry('Root Entry', 5, 0xFFFFFFFE, 0) + entry('Workbook', 2, 2, len(stream))
+    with open(filepath, 'wb') as f:
+        f.write(header + fat_sector + directory.ljust(512, b'\0') + stream)
+
+
+class TestExcelLoader:
+    """Test streaming Excel rows in chunks"""
+
+    def setup_method(self) -> None:
+        """Set up a sheet with a title row, gaps and mixed types"""
+        self.excel_file = "test_stream.xlsx"
+        self.df = pd.DataFrame({
+            'id': range(250),
+            'name': [f'name_{i}' if i % 9 else None for i in range(250)],
+            'amount': [i * 0.25 for i in range(250)],
+            'day': pd.date_range('2024-01-01', periods=250),
+        })
+        with pd.ExcelWriter(self.excel_file) as writer:
+            self.df.to_excel(writer, sheet_name='Datos', index=False, startrow=1)
+            writer.sheets['Datos'].cell(row=1, column=1, value='Reporte')
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.excel_file).exists():
+            Path(self.excel_file).unlink()
+
+    def test_excel_iter_chunks_matches_read_excel(self) -> None:
+        """Test streamed chunks rebuild the same frame read_excel returns"""
+        loader = ExcelLoader(self.excel_file)
+        progress = []
+        chunks = list(loader.iter_chunks(chunk_size=100, skip_rows=1, column_names={'name': 'nombre'},
+                                         sheet_name='Datos', progress_callback=lambda done, total: progress.append((done, total))))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        expected = loader.load(skip_rows=1, column_names={'name': 'nombre'}, sheet_name='Datos')
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected, check_dtype=False)
+        assert progress == [(100, 250), (200, 250), (250, 250)]
+
+    def test_excel_progress_from_bytes_without_dimension(self, tmp_path: Path) -> None:
+        """Test sheets without <dimension> report a total extrapolated from the sheet XML read"""
+        source = tmp_path / "dimension.xlsx"
+        stripped = tmp_path / "sin_dimension.xlsx"
+        pd.DataFrame({'id': range(5000), 'name': [f'name_{i}' for i in range(5000)]}).to_excel(source, index=False)
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(stripped, 'w', zipfile.ZIP_DEFLATED) as dst:
+            for item in src.infolist():
+                data = src.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    data = re.sub(rb'<dimension[^>]*/>', b'', data)
+                dst.writestr(item, data)
+
+        progress = []
+        chunks = list(ExcelLoader(str(stripped)).iter_chunks(chunk_size=1000,
+                                                             progress_callback=lambda done, total: progress.append((done, total))))
+        assert sum(len(chunk) for chunk in chunks) == 5000
+        assert [done for done, _ in progress] == [1000, 2000, 3000, 4000, 5000]
+        # Without bytes the total would just follow the rows parsed
+        assert all(3500 <= total <= 6500 for _, total in progress)
+        assert progress[-1] == (5000, 5000)
+
+    def test_cargar_datos_con_opciones_streams_excel(self) -> None:
+        """Test large workbooks load through the streaming path with progress"""
+        from core.data_handler import cargar_datos_con_opciones
+        progress = []
+        df = cargar_datos_con_opciones(self.excel_file, skip_rows=1, chunk_size=80, sheet_name='Datos',
+                                       on_progress=lambda done, total: progress.append(done))
+        assert len(df) == 250
+        assert progress == [80, 160, 240, 250]
+
+    def test_excel_projection_and_filters(self) -> None:
+        """Test streamed and full reads keep only the selected cells and rows"""
+        loader = ExcelLoader(self.excel_file)
+        options = {'skip_rows': 1, 'sheet_name': 'Datos', 'columns': ['amount', 'id'],
+                   'filters': [('id', '<', '120'), ('id', '>=', '90')]}
+        expected = self.df[(self.df['id'] >= 90) & (self.df['id'] < 120)][['amount', 'id']].reset_index(drop=True)
+        chunks = list(loader.iter_chunks(chunk_size=100, column_names={'id': 'ID'}, **options))
+        assert [len(chunk) for chunk in chunks] == [10, 20]
+        assert list(chunks[0].columns) == ['amount', 'ID']
+        pd.testing.assert_frame_equal(loader.load(**options), expected, check_dtype=False)
+
+    def test_excel_row_count_from_dimension(self) -> None:
+        """Test rows and columns come from the sheet's <dimension> element"""
+        from core.loaders.excel_metadata import read_sheet_dimensions
+        assert read_sheet_dimensions(self.excel_file, 'Datos') == (252, 4)
+        assert ExcelLoader(self.excel_file).count_rows('Datos') == 251
+        assert ExcelLoader(self.excel_file).get_file_info()['column_count'] == 4
+
+    def test_excel_row_count_without_dimension(self) -> None:
+        """Test a sheet without dimension falls back to streaming its rows"""
+        import re
+        import zipfile
+        stripped_file = "test_no_dimension.xlsx"
+        try:
+            with zipfile.ZipFile(self.excel_file) as source, zipfile.ZipFile(stripped_file, 'w') as target:
+                for item in source.infolist():
+                    data = source.read(item.filename)
+                    if item.filename.startswith('xl/worksheets/'):
+                        data = re.sub(rb'<dimension[^>]*/>', b'', data)
+                    target.writestr(item, data)
+            assert ExcelLoader(stripped_file).count_rows() == 251
+        finally:
+            Path(stripped_file).unlink()
+
+    def test_xls_row_count_from_biff_dimensions(self) -> None:
+        """Test .xls sizes come from the BIFF DIMENSIONS record"""
+        from core.loaders.excel_metadata import read_sheet_dimensions
+        xls_file = "test_dimensions.xls"
+        try:
+            _write_minimal_xls(xls_file, rows=70001, columns=6)
+            assert read_sheet_dimensions(xls_file) == (70001, 6)
+            assert read_sheet_dimensions(xls_file, 'Hoja1') == (70001, 6)
+            assert read_sheet_dimensions(xls_file, 'Otra') is None
+            assert ExcelLoader(xls_file).count_rows() == 70000
+        finally:
+            Path(xls_file).unlink()
+
 
 class TestJsonLoader:
     """Test JSON loader"""
@@ -167,7 +421,7 @@ class TestJsonLoader:
     def test_json_loader_creation(self) -> None:
         """Test JSON loader creation"""
         loader = JsonLoader(self.json_file)
-        assert loader.get_supported_extensions() == ['.json']
+        assert loader.get_supported_extensions() == ['.json', '.jsonl', '.ndjson']
 
     def test_json_load(self) -> None:
         """Test loading JSON file"""
@@ -189,6 +443,305 @@ class TestJsonLoader:
         loader = JsonLoader(self.json_file)
         assert loader.can_load_chunks() is False
 
+    def test_json_lines_streams_chunks(self) -> None:
+        """Test line-delimited JSON is parsed in chunks with progress"""
+        jsonl_file = "test_events.jsonl"
+        records = [{"id": i, "event": f"click_{i % 3}"} for i in range(25)]
+        try:
+            with open(jsonl_file, 'w') as f:
+                f.write("\n".join(json.dumps(record) for record in records) + "\n")
+            loader = JsonLoader(jsonl_file)
+            assert loader.can_load_chunks() is True
+            progress: list[tuple[int, int]] = []
+            chunks = list(loader.iter_chunks(10, skip_rows=3, column_names={'event': 'evento'},
+                                             progress_callback=lambda done, total: progress.append((done, total))))
+            assert [len(chunk) for chunk in chunks] == [7, 10, 5]
+            assert [done for done, _ in progress] == [10, 20, 25]
+            assert all(total >= done for done, total in progress)
+            df = pd.concat(chunks, ignore_index=True)
+            assert df['id'].tolist() == list(range(3, 25))
+            assert list(df.columns) == ['id', 'evento']
+            assert loader.load_in_chunks(10).equals(loader.load())
+        finally:
+            Path(jsonl_file).unlink()
+
+    def test_json_projection_and_filters(self) -> None:
+        """Test JSON Lines chunks and JSON arrays are reduced to the selection"""
+        options = {'columns': ['name'], 'filters': [('city', '!=', 'NYC')]}
+        assert JsonLoader(self.json_file).load(**options).to_dict('list') == {'name': ['Bob']}
+
+        lines_file = "test_select.jsonl"
+        try:
+            with open(lines_file, 'w') as f:
+                f.writelines(json.dumps({'id': i, 'group': i % 3}) + "\n" for i in range(30))
+            chunks = list(JsonLoader(lines_file).iter_chunks(chunk_size=10, columns=['id'], filters=[('group', '==', 0)]))
+            assert pd.concat(chunks)['id'].tolist() == list(range(0, 30, 3))
+            assert all(list(chunk.columns) == ['id'] for chunk in chunks)
+        finally:
+            Path(lines_file).unlink()
+
+    def test_json_lines_load_sample(self, tmp_path: Path) -> None:
+        """Test JSON Lines files are sampled and JSON arrays are rejected"""
+        filepath = tmp_path / "events.jsonl"
+        filepath.write_text("".join(json.dumps({'id': i, 'kind': 'a'}) + "\n" for i in range(500)))
+        sample = JsonLoader(str(filepath)).load_sample(50, seed=1)
+        assert len(sample) == 50 and sample['id'].is_unique
+        assert set(sample.columns) == {'id', 'kind'}
+
+        with pytest.raises(Exception):
+            JsonLoader(self.json_file).load_sample(5)
+
+    def test_json_lines_detected_in_json_extension(self) -> None:
+        """Test .json files holding one object per line are read as JSON Lines"""
+        with open(self.json_file, 'w') as f:
+            f.write('{"name": "Alice", "age": 25}\n{"name": "Bob", "age": 30}\n')
+        loader = JsonLoader(self.json_file)
+        assert loader.is_json_lines()
+        assert loader.load()['name'].tolist() == ['Alice', 'Bob']
+        assert loader.get_file_info()['format'] == 'JSON Lines'
+
+class TestXmlLoader:
+    """Test streaming XML records with iterparse"""
+
+    def setup_method(self) -> None:
+        """Create a namespaced feed with uneven records"""
+        self.xml_file = "test_feed.xml"
+        rows = "".join(
+            f'<item id="{i}"><name>item_{i}</name><price>{i * 1.5 if i % 4 else ""}</price></item>'
+            for i in range(25)
+        )
+        with open(self.xml_file, 'w') as f:
+            f.write(f'<?xml version="1.0"?><feed xmlns="http://example.com/feed"><!-- export -->{rows}</feed>')
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.xml_file).exists():
+            Path(self.xml_file).unlink()
+
+    def test_xml_chunks_match_read_xml(self) -> None:
+        """Test streamed records have the columns and dtypes of pandas.read_xml"""
+        loader = XmlLoader(self.xml_file)
+        assert loader.can_load_chunks() is True
+        chunks = list(loader.iter_chunks(10))
+        assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), loader.load())
+
+    def test_xml_chunk_options_and_progress(self) -> None:
+        """Test skip_rows, renaming, explicit record tag and progress reporting"""
+        progress: list[tuple[int, int]] = []
+        loader = XmlLoader(self.xml_file, record_tag='item')
+        chunks = list(loader.iter_chunks(10, skip_rows=5, column_names={'name': 'nombre'},
+                                         progress_callback=lambda done, total: progress.append((done, total))))
+        df = pd.concat(chunks, ignore_index=True)
+        assert df['id'].tolist() == list(range(5, 25))
+        assert list(df.columns) == ['id', 'nombre', 'price']
+        assert [done for done, _ in progress] == [15, 25]
+        assert progress[-1] == (25, 25)
+        assert list(loader.iter_chunks(10, record_tag='missing')) == []
+        assert XmlLoader(self.xml_file).get_file_info()['record_tag'] == 'item'
+
+    def test_xml_chunk_dtypes_and_missing_fields(self, tmp_path: Path) -> None:
+        """Test quoted text, empty single-field records and numbers parse like pandas.read_xml"""
+        xml_file = tmp_path / "notes.xml"
+        xml_file.write_text(
+            '<notes><note><text>a, "quoted"\nline</text></note><note><text/></note>'
+            '<note><text>007</text></note><note><text>NA</text></note></notes>'
+        )
+        chunks = list(XmlLoader(str(xml_file)).iter_chunks(10))
+        pd.testing.assert_frame_equal(chunks[0], pd.read_xml(xml_file))
+        assert len(chunks[0]) == 4
+
+
+    def test_xml_projection_and_filters(self) -> None:
+        """Test only the selected fields are kept, including fields missing from some records"""
+        chunks = list(XmlLoader(self.xml_file).iter_chunks(chunk_size=10, columns=['name', 'price'],
+                                                          filters=[('id', '>', '20')]))
+        df = pd.concat(chunks, ignore_index=True)
+        assert list(df.columns) == ['name', 'price']
+        assert df['name'].tolist() == ['item_21', 'item_22', 'item_23', 'item_24']
+        assert pd.isna(df['price'].iloc[3])
+
+
+class TestHdf5Loader:
+    """Test HDF5 key selection, projection and where pushdown"""
+
+    def setup_method(self) -> None:
+        """Create a store with a queryable time series table and a fixed frame"""
+        self.h5_file = "test_store.h5"
+        self.df = pd.DataFrame({
+            'sensor': [f's{i % 3}' for i in range(48)],
+            'value': [i * 0.5 for i in range(48)],
+            'raw': range(48),
+        }, index=pd.date_range('2024-01-01', periods=48, freq='h', name='time'))
+        self.df.to_hdf(self.h5_file, key='instrument/readings', format='table', data_columns=['sensor'])
+        self.df.reset_index(drop=True).to_hdf(self.h5_file, key='snapshot', format='fixed')
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.h5_file).exists():
+            Path(self.h5_file).unlink()
+
+    def test_hdf5_keys_and_columns(self) -> None:
+        """Test keys and columns are listed without reading rows"""
+        loader = Hdf5Loader(self.h5_file)
+        assert sorted(loader.list_keys()) == ['/instrument/readings', '/snapshot']
+        assert loader.get_columns('instrument/readings') == ['time', 'sensor', 'value', 'raw']
+        assert loader.get_columns('snapshot') == ['sensor', 'value', 'raw']
+        assert loader.is_table('instrument/readings') and not loader.is_table('snapshot')
+        assert loader.get_file_info()['table_keys'] == ['/instrument/readings']
+
+    def test_hdf5_time_window_query(self) -> None:
+        """Test index and data column filters run as where queries with projection"""
+        loader = Hdf5Loader(self.h5_file)
+        filters = [('time', '>=', '2024-01-01 10:00'), ('time', '<', '2024-01-02'),
+                   ('sensor', '==', 's1'), ('raw', '!=', '13')]
+        df = loader.load(key='instrument/readings', columns=['time', 'value'], filters=filters)
+        window = self.df.loc['2024-01-01 10:00':'2024-01-01 23:00']
+        expected = window[(window['sensor'] == 's1') & (window['raw'] != 13)]
+        assert list(df.columns) == ['time', 'value']
+        assert df['time'].tolist() == expected.index.tolist()
+        assert df['value'].tolist() == expected['value'].tolist()
+
+    def test_hdf5_iter_chunks(self) -> None:
+        """Test table stores stream in chunks with progress and fixed stores are split"""
+        loader = Hdf5Loader(self.h5_file)
+        progress: list[tuple[int, int]] = []
+        chunks = list(loader.iter_chunks(10, skip_rows=2, column_names={'value': 'valor'}, key='instrument/readings',
+                                         filters=[('sensor', '==', 's0')],
+                                         progress_callback=lambda done, total: progress.append((done, total))))
+        assert [len(chunk) for chunk in chunks] == [8, 6]
+        assert progress == [(10, 16), (16, 16)]
+        assert chunks[0]['raw'].tolist()[0] == 6
+        assert 'valor' in chunks[0].columns
+
+        chunks = list(loader.iter_chunks(20, key='snapshot'))
+        assert [len(chunk) for chunk in chunks] == [20, 20, 8]
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), loader.load(key='snapshot'))
+
+
+class TestParquetLoader:
+    """Test Parquet column projection and filter pushdown"""
+
+    def setup_method(self) -> None:
+        """Set up test data split into several row groups"""
+        self.parquet_file = "test_data.parquet"
+        self.df = pd.DataFrame({
+            'id': range(1000),
+            'value': [i * 0.5 for i in range(1000)],
+            'group': ['a', 'b'] * 500,
+        })
+        self.df.to_parquet(self.parquet_file, row_group_size=100)
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.parquet_file).exists():
+            Path(self.parquet_file).unlink()
+
+    def test_parquet_column_projection(self) -> None:
+        """Test only requested columns are read"""
+        df = ParquetLoader(self.parquet_file).load(columns=['id', 'group'])
+        assert list(df.columns) == ['id', 'group']
+        assert len(df) == 1000
+
+    def test_parquet_filters(self) -> None:
+        """Test equality and range filters, with text values coerced to the column type"""
+        loader = ParquetLoader(self.parquet_file)
+        df = loader.load(filters=[('id', '>=', '250'), ('id', '<', '300'), ('group', '=', 'a')])
+        assert df['id'].tolist() == list(range(250, 300, 2))
+
+    def test_parquet_iter_chunks_with_filters(self) -> None:
+        """Test streaming chunks honour projection and filters"""
+        loader = ParquetLoader(self.parquet_file)
+        chunks = list(loader.iter_chunks(chunk_size=40, columns=['value'], filters=[('id', '<', 150)]))
+        assert all(len(chunk) <= 40 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == 150
+        assert list(chunks[0].columns) == ['value']
+
+    def test_parquet_invalid_filter_column(self) -> None:
+        """Test unknown filter columns are reported"""
+        with pytest.raises(Exception, match="not found"):
+            ParquetLoader(self.parquet_file).load(filters=[('missing', '==', 1)])
+
+
+class TestSqliteLoader:
+    """Test streaming SQLite tables through one cursor"""
+
+    def setup_method(self) -> None:
+        """Set up a database with a table and a view"""
+        import sqlite3
+        self.db_file = "test_data.db"
+        self.df = pd.DataFrame({
+            'id': range(250),
+            'name': [f'name_{i}' for i in range(250)],
+        })
+        with sqlite3.connect(self.db_file) as conn:
+            self.df.to_sql('items', conn, index=False)
+            conn.execute('CREATE VIEW "odd items" AS SELECT * FROM items WHERE id % 2 = 1')
+        conn.close()
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        if Path(self.db_file).exists():
+            Path(self.db_file).unlink()
+
+    def test_sqlite_iter_chunks(self) -> None:
+        """Test chunks cover the table once, in order"""
+        loader = SqliteLoader(self.db_file)
+        chunks = list(loader.iter_chunks(chunk_size=100))
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        assert pd.concat(chunks, ignore_index=True).equals(self.df)
+        
+        chunks = list(loader.iter_chunks(chunk_size=100, skip_rows=240))
+        assert chunks[0]['id'].tolist() == list(range(240, 250))
+
+    def test_sqlite_load_in_chunks_quoted_name(self) -> None:
+        """Test names needing quotes (views, spaces) stream too"""
+        df = SqliteLoader(self.db_file).load_in_chunks(chunk_size=30, table_name='odd items')
+        assert df['id'].tolist() == list(range(1, 250, 2))
+
+
+    def test_sqlite_projection_and_filters(self) -> None:
+        """Test the selection runs in SQLite, after the skipped rows"""
+        loader = SqliteLoader(self.db_file)
+        options = {'skip_rows': 100, 'columns': ['name'], 'filters': [('id', '<', '110'), ('id', '!=', '105')]}
+        expected = [f'name_{i}' for i in range(100, 110) if i != 105]
+        assert loader.load(**options)['name'].tolist() == expected
+        chunks = list(loader.iter_chunks(chunk_size=4, column_names={'name': 'nombre'}, **options))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 1]
+        assert pd.concat(chunks)['nombre'].tolist() == expected
+        with pytest.raises(ValueError, match="not found"):
+            list(loader.iter_chunks(columns=['missing']))
+
+class TestFilterSemanticsAcrossFormats:
+    """Test the same filter selects the same rows whatever the file format"""
+
+    def test_not_equal_keeps_null_rows(self, tmp_path: Path) -> None:
+        """Test != keeps rows whose column is null, as pandas does, in every format"""
+        import sqlite3
+        df = pd.DataFrame({
+            'id': range(12),
+            'city': ['Lima', None, 'Quito', 'Madrid'] * 3,
+            'score': [1.0, 2.0, None] * 4,
+        })
+        paths = {name: str(tmp_path / f'filtered.{name}') for name in ('csv', 'parquet', 'feather', 'db')}
+        df.to_csv(paths['csv'], index=False)
+        df.to_parquet(paths['parquet'], row_group_size=5)
+        df.to_feather(paths['feather'])
+        with sqlite3.connect(paths['db']) as conn:
+            df.to_sql('cities', conn, index=False)
+        conn.close()
+
+        loaders = [CsvLoader(paths['csv']), ParquetLoader(paths['parquet']),
+                   FeatherLoader(paths['feather']), SqliteLoader(paths['db'])]
+        for filters in ([('city', '!=', 'Lima')], [('score', '!=', '2')]):
+            column, _, value = filters[0]
+            expected = df[df[column] != (float(value) if column == 'score' else value)]['id'].tolist()
+            for loader in loaders:
+                assert loader.load(filters=filters)['id'].tolist() == expected, (type(loader).__name__, filters)
+            for loader in (loaders[0], loaders[1], loaders[3]):
+                chunks = loader.iter_chunks(chunk_size=4, filters=filters)
+                assert pd.concat(chunks)['id'].tolist() == expected, (type(loader).__name__, filters)
+
 
 class TestDataHandlerIntegration:
     """Test integration with data_handler.py"""
@@ -219,6 +772,19 @@ class TestDataHandlerIntegration:
         assert 'nombre' in df.columns
         assert 'name' not in df.columns
 
+    def test_cargar_datos_con_opciones_on_chunk(self) -> None:
+        """Test partial chunks are reported while loading"""
+        from core.data_handler import cargar_datos_con_opciones
+        received: list[tuple[int, int]] = []
+        df = cargar_datos_con_opciones(
+            self.csv_file, column_names={'name': 'nombre'}, chunk_size=1,
+            on_chunk=lambda chunk, rows: received.append((len(chunk), rows))
+        )
+        assert received == [(1, 1), (1, 2)]
+        assert len(df) == 2
+        assert 'nombre' in df.columns
+        assert list(df.index) == [0, 1]
+
     @staticmethod
     def test_supported_formats_function() -> None:
         """Test get_supported_file_formats function"""
@@ -0,0 +1,57 @@
+"""
+Tests for the copy-free PaginationManager: filter and sort as row positions
+over the base frame, materializing only the requested rows
+"""
+
+import numpy as np
+import pandas as pd
+from app.services.pagination_manager import PaginationManager
+
+
+class TestPaginationPositions:
+    """Test filters and sorts never duplicate the base frame"""
+
+    def setup_method(self) -> None:
+        """Create a manager over a frame with a repeated text column"""
+        self.df = pd.DataFrame({'id': np.arange(30), 'name': [f'n{i % 4}' for i in range(30)]})
+        self.manager = PaginationManager(self.df, page_size=5)
+
+    def test_base_frame_is_not_copied(self) -> None:
+        """Test the manager and the unfiltered view share the caller's buffers"""
+        ids = self.df['id'].to_numpy()
+        assert np.shares_memory(self.manager.original_df['id'].to_numpy(), ids)
+        assert np.shares_memory(self.manager.filtered_df['id'].to_numpy(), ids)
+        assert np.shares_memory(self.manager.get_page_data()['id'].to_numpy(), ids)
+
+        self.manager.set_data(self.df)
+        assert np.shares_memory(self.manager.original_df['id'].to_numpy(), ids)
+
+    def test_filter_pages_take_rows(self) -> None:
+        """Test a filtered page holds the matching rows with their original labels"""
+        self.manager.apply_filter('name', 'n1')
+        assert self.manager.get_total_rows() == 8
+        assert self.manager.get_total_pages() == 2
+        assert self.manager.get_filter_info()['filtered_out'] == 22
+
+        self.manager.next_page()
+        page = self.manager.get_page_data()
+        assert page['id'].tolist() == [21, 25, 29]
+        assert page.index.tolist() == [21, 25, 29]
+
+        self.manager.apply_filter('name', 'zzz')
+        assert self.manager.get_total_pages() == 0
+        assert self.manager.get_page_data().empty
+
+    def test_sort_survives_filter_changes(self) -> None:
+        """Test the sort order applies to later filters and is stable across sorts"""
+        self.manager.sort('id', ascending=False)
+        self.manager.apply_filter('name', 'n2')
+        assert self.manager.get_page_data()['id'].tolist() == [26, 22, 18, 14, 10]
+
+        self.manager.clear_filter()
+        self.manager.sort('name')
+        page = self.manager.get_page_data()
+        assert page['name'].tolist() == ['n0'] * 5
+        assert page['id'].tolist() == [28, 24, 20, 16, 12]
+        assert self.manager.base_position(0) == 28
+        assert self.df['id'].tolist() == list(range(30))
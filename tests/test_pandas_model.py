@@ -0,0 +1,229 @@
+"""
+Tests for the pre-formatted chunk cells, the LRU chunk cache and the background
+prefetch of the virtualized table model, and the paged model kept by DataView
+"""
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt, QCoreApplication, QThreadPool
+from PySide6.QtWidgets import QTableView
+from app.models.chunk_cache import ChunkCache
+from app.models.chunk_prefetcher import ChunkPrefetcher
+from app.models.pandas_model import PagedTableModel, VirtualizedPandasModel, _format_column, _format_value
+from app.services.pagination_manager import PaginationManager
+from app.widgets.data_view import DataView
+
+
+class TestFormattedChunks:
+    """Test vectorized formatting matches per-cell formatting and cells come from chunks"""
+
+    def setup_method(self) -> None:
+        """Create a frame with one column per kind of dtype"""
+        self.df = pd.DataFrame({
+            'int': np.arange(6),
+            'float': [1.0, 2.5, np.nan, np.inf, -3.25, 1e22],
+            'bool': [True, False] * 3,
+            'text': ['a', None, 'c', 'd', 'e', 'f'],
+            'mixed': ['x', 1.5, None, 2, np.nan, 'y'],
+            'when': pd.date_range('2024-01-01', periods=6, freq='37h'),
+            'city': pd.Categorical(['Lima', 'Quito'] * 3),
+            'nullable': pd.array([1, None, 3, 4, 5, 6], dtype='Int64'),
+        })
+
+    def test_format_column_matches_format_value(self) -> None:
+        """Test every dtype gives the same text as formatting cell by cell"""
+        for column in self.df.columns:
+            expected = [_format_value(value) for value in self.df[column].tolist()]
+            assert list(_format_column(self.df[column])) == expected, column
+
+    def test_float32_formats_like_float64(self) -> None:
+        """Test compacted float32 columns keep the decimal comma"""
+        values = pd.Series([1.0, 0.1, np.nan], dtype=np.float32)
+        assert list(_format_column(values)) == ['1', '0,1', '']
+
+    def test_cells_served_from_chunk_text(self) -> None:
+        """Test cells are read from the chunk cache and refreshed after setData"""
+        df = pd.DataFrame({'id': range(2500), 'value': np.arange(2500) / 4})
+        model = VirtualizedPandasModel(df, chunk_size=1000)
+        assert model.data(model.index(1001, 1)) == '250,25'
+        assert model.data(model.index(2499, 0)) == '2499'
+        assert model.data(model.index(0, 0), Qt.ItemDataRole.ToolTipRole) is None
+        assert sorted(model.data_cache) == [1, 2]
+        assert len(model.data_cache[2]) == 500
+
+        model.setData(model.index(1001, 1), 7.5)
+        assert model.data(model.index(1001, 1)) == '7,5'
+
+
+class _Entry:
+    def __init__(self, nbytes: int) -> None:
+        self.nbytes = nbytes
+
+
+class TestChunkCache:
+    """Test LRU eviction by entries and bytes and the cache counters"""
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test reading an entry protects it from the next eviction"""
+        cache = ChunkCache(max_entries=3, max_bytes=1000)
+        for key in range(3):
+            cache.put(key, _Entry(10))
+        assert cache.get(0) is not None
+        cache.put(3, _Entry(10))
+        assert sorted(cache) == [0, 2, 3]
+        assert cache.get(1) is None
+        assert cache.stats()['aciertos'] == 1
+        assert cache.stats()['fallos'] == 1
+        assert cache.stats()['expulsiones'] == 1
+
+    def test_byte_budget(self) -> None:
+        """Test entries are evicted once the byte budget is exceeded, keeping the newest"""
+        cache = ChunkCache(max_entries=10, max_bytes=100)
+        cache.put(0, _Entry(60))
+        cache.put(1, _Entry(60))
+        assert list(cache) == [1]
+        cache.put(2, _Entry(500))
+        assert list(cache) == [2]
+        assert cache.total_bytes() == 500
+
+    def test_model_cache_stays_bounded_on_random_jumps(self) -> None:
+        """Test jumping between distant chunks never grows the cache past its limit"""
+        df = pd.DataFrame({'id': range(100_000), 'value': np.arange(100_000) / 3})
+        model = VirtualizedPandasModel(df, chunk_size=1000)
+        model.data_cache.max_entries = 4
+        rows = np.random.default_rng(0).integers(0, len(df), 300)
+        for row in rows:
+            assert model.data(model.index(int(row), 1)) == _format_value(df['value'].iloc[row])
+            assert len(model.data_cache) <= 4
+
+        for _ in range(3):
+            model.data(model.index(0, 0))
+            model.data(model.index(99_999, 0))
+        stats = model.get_cache_stats()
+        assert stats['expulsiones'] > 0
+        assert stats['aciertos'] >= 4
+        assert model.data_cache[0].frame['id'].iloc[0] == 0
+
+
+def _deliver_prefetched() -> None:
+    """Wait for the pool tasks and run the queued hand-offs to the model"""
+    QThreadPool.globalInstance().waitForDone()
+    QCoreApplication.processEvents()
+
+
+class TestChunkPrefetch:
+    """Test chunks ahead of the scroll are prepared off the GUI thread"""
+
+    def setup_method(self) -> None:
+        """Create a model of ten chunks"""
+        self.df = pd.DataFrame({'id': range(10_000), 'value': np.arange(10_000) / 8})
+        self.model = VirtualizedPandasModel(self.df, chunk_size=1000)
+
+    def test_prefetch_in_scroll_direction(self) -> None:
+        """Test the chunks after the edge row are cached with their columns formatted"""
+        self.model.prefetch(4500, 1, 2, range(2))
+        _deliver_prefetched()
+        assert sorted(self.model.data_cache) == [5, 6]
+        assert self.model.get_cache_stats()['precargados'] == 2
+        assert self.model.data(self.model.index(6001, 1)) == '750,125'
+        assert self.model.get_cache_stats()['fallos'] == 0
+
+        self.model.prefetch(4500, -1, 1)
+        _deliver_prefetched()
+        assert 3 in self.model.data_cache
+
+    def test_stale_prefetch_is_dropped(self) -> None:
+        """Test a chunk prepared before the data changed never reaches the cache"""
+        self.model.prefetch(0, 1, 1)
+        self.model.data_cache.clear()
+        _deliver_prefetched()
+        assert len(self.model.data_cache) == 0
+
+    def test_prefetcher_follows_scrollbar(self) -> None:
+        """Test scrolling the view prefetches the chunk below the viewport"""
+        view = QTableView()
+        view.resize(400, 300)
+        view.setModel(self.model)
+        ChunkPrefetcher(view)
+        view.show()
+        scrollbar = view.verticalScrollBar()
+        for value in (900, 920, 940):
+            scrollbar.setValue(value)
+        _deliver_prefetched()
+        assert 1 in self.model.data_cache
+        view.close()
+
+
+class TestPagedTableModel:
+    """Test pages are windows over one model instead of new models"""
+
+    def setup_method(self) -> None:
+        """Create a manager with three pages and a model over it"""
+        df = pd.DataFrame({'id': range(25), 'name': [f'n{i % 7}' for i in range(25)]})
+        self.manager = PaginationManager(df, page_size=10)
+        self.model = PagedTableModel(self.manager, chunk_size=10)
+
+    def test_page_flip_moves_window(self) -> None:
+        """Test flipping pages shows absolute rows and reuses cached chunks"""
+        assert self.model.rowCount() == 10
+        assert self.model.data(self.model.index(0, 0)) == '0'
+        changed = []
+        self.model.dataChanged.connect(lambda *args: changed.append(args))
+        resets = []
+        self.model.modelReset.connect(lambda: resets.append(True))
+
+        self.manager.set_current_page(2)
+        self.model.refresh()
+        assert len(changed) == 1
+        assert self.model.data(self.model.index(0, 0)) == '10'
+        assert self.model.headerData(0, Qt.Orientation.Vertical) == '11'
+
+        self.manager.set_current_page(3)
+        self.model.refresh()
+        assert self.model.rowCount() == 5
+        assert self.model.data(self.model.index(4, 0)) == '24'
+
+        self.manager.set_current_page(1)
+        self.model.refresh()
+        self.model.data(self.model.index(0, 0))
+        assert self.model.get_cache_stats()['fallos'] == 3
+        assert not resets
+
+    def test_sort_orders_all_filtered_rows(self) -> None:
+        """Test sorting from the view orders the whole dataset and keeps the page"""
+        self.manager.set_current_page(2)
+        self.model.refresh()
+        self.model.sort(0, Qt.SortOrder.DescendingOrder)
+        assert self.manager.current_page == 2
+        assert self.model.data(self.model.index(0, 0)) == '14'
+
+        self.manager.apply_filter('name', 'n3')
+        self.model.refresh()
+        self.model.sort(0, Qt.SortOrder.AscendingOrder)
+        assert [self.model.data(self.model.index(row, 0)) for row in range(self.model.rowCount())] == ['3', '10', '17', '24']
+
+    def test_data_view_keeps_one_model(self) -> None:
+        """Test the data view binds one model across page changes and new data"""
+        view = DataView()
+        updates = []
+        view.data_updated.connect(lambda: updates.append(True))
+        view.set_data(pd.DataFrame({'id': range(25)}))
+        view.pagination_manager.set_page_size(10)
+        model = view.table_view.model()
+        view.pagination_manager.next_page()
+        assert view.table_view.model() is model
+        assert model.data(model.index(0, 0)) == '10'
+        # Page flips do not announce new data; filters do
+        assert len(updates) == 1
+        view.pagination_manager.apply_filter('id', '1')
+        assert len(updates) == 2
+        view.pagination_manager.clear_filter()
+        view.pagination_manager.set_current_page(2)
+
+        # New data keeps the current page (2), so next_page shows page 3
+        view.set_data(pd.DataFrame({'id': range(100, 130)}))
+        model = view.table_view.model()
+        view.pagination_manager.next_page()
+        assert view.table_view.model() is model
+        assert model.data(model.index(0, 0)) == '120'
+        view.close()
@@ -0,0 +1,94 @@
+"""
+Tests for row-group random access to Parquet/Feather files and the row group model
+"""
+
+import pandas as pd
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+from core.loaders.parquet_loader import ParquetLoader
+from core.loaders.feather_loader import FeatherLoader
+from app.models.pandas_model import RowGroupModel
+from app.services.data_service import DataService
+from config import OptimizationConfig
+
+
+class TestRowGroupSource:
+    """Test decoding Parquet row groups and Feather batches on demand"""
+
+    def setup_method(self) -> None:
+        """Create files split in uneven row groups"""
+        self.parquet_file = "test_row_groups.parquet"
+        self.feather_file = "test_row_groups.feather"
+        self.df = pd.DataFrame({
+            'id': range(2500),
+            'name': [f'name_{i}' for i in range(2500)],
+        })
+        table = pa.Table.from_pandas(self.df, preserve_index=False)
+        pq.write_table(table, self.parquet_file, row_group_size=1000)
+        with pa.ipc.new_file(self.feather_file, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=700):
+                writer.write_batch(batch)
+
+    def teardown_method(self) -> None:
+        """Clean up test files"""
+        for filepath in (self.parquet_file, self.feather_file):
+            if Path(filepath).exists():
+                Path(filepath).unlink()
+
+    def test_parquet_source_reads_metadata_only(self) -> None:
+        """Test row group boundaries come from the footer"""
+        source = ParquetLoader(self.parquet_file).create_row_group_source(columns=['name'])
+        assert source.row_count == 2500
+        assert source.num_groups == 3
+        assert source.columns == ['name']
+        assert source.group_for_row(999) == 0
+        assert source.group_for_row(1000) == 1
+        assert source.group_bounds(2) == (2000, 2500)
+
+    def test_read_rows_across_groups(self) -> None:
+        """Test ranges spanning several groups keep absolute row positions"""
+        for source in (ParquetLoader(self.parquet_file).create_row_group_source(),
+                       FeatherLoader(self.feather_file).create_row_group_source()):
+            chunk = source.read_rows(650, 1450)
+            assert list(chunk.index) == list(range(650, 1450))
+            assert chunk['name'].tolist() == self.df['name'].iloc[650:1450].tolist()
+
+    def test_model_decodes_only_visible_group(self) -> None:
+        """Test the model caches one chunk per decoded row group"""
+        model = RowGroupModel(FeatherLoader(self.feather_file).create_row_group_source())
+        assert model.rowCount() == 2500
+        assert model.data(model.index(1500, 1)) == 'name_1500'
+        assert model.data(model.index(2499, 0)) == '2499'
+        assert sorted(model.data_cache) == [2, 3]
+        assert len(model.data_cache[3]) == 400
+
+    def test_uncompressed_feather_is_zero_copy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test only uncompressed Feather files are browsed from disk"""
+        monkeypatch.setattr(OptimizationConfig, 'LAZY_COLUMNAR_THRESHOLD', 0)
+        assert DataService.should_browse_row_groups(self.feather_file)
+        loader = FeatherLoader(self.feather_file)
+        assert loader.is_memory_mappable()
+        assert loader.create_row_group_source().row_count == len(self.df)
+        assert loader.load()['name'].tolist() == self.df['name'].tolist()
+
+        compressed_file = "test_row_groups_lz4.feather"
+        try:
+            self.df.to_feather(compressed_file, compression='lz4')
+            loader = FeatherLoader(compressed_file)
+            assert not loader.is_memory_mappable()
+            assert not DataService.should_browse_row_groups(compressed_file)
+            with pytest.raises(ValueError):
+                loader.create_row_group_source()
+        finally:
+            Path(compressed_file).unlink()
+
+    def test_zero_copy_check_ignores_other_allocations(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the compression check does not depend on the process-wide Arrow pool"""
+        allocated = iter(range(0, 10**9, 4096))
+        # Other threads (prefetcher, CSV/Parquet readers) allocating between calls
+        monkeypatch.setattr(pa, 'total_allocated_bytes', lambda: next(allocated))
+        loader = FeatherLoader(self.feather_file)
+        assert loader.is_memory_mappable()
+        assert loader.create_row_group_source().row_count == len(self.df)
@@ -0,0 +1,133 @@
+"""
+Tests for the query-on-demand SQLite source and table model
+"""
+
+import sqlite3
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from PySide6.QtCore import Qt
+from core.loaders.sqlite_loader import SqliteLoader
+from app.models.pandas_model import SqliteQueryModel
+from app.services.filter_service import FilterService
+
+
+class TestSqliteQuerySource:
+    """Test SQL pushdown gives the same rows as FilterService on pandas"""
+
+    def setup_method(self) -> None:
+        """Create a table with nulls, text and dates"""
+        self.db_file = "test_query_source.db"
+        self.df = pd.DataFrame({
+            'id': range(3000),
+            'city': ['Madrid', 'Lima', 'BOGOTÁ 100%', None] * 750,
+            'amount': [np.nan if i % 7 == 0 else i * 1.5 for i in range(3000)],
+            'day': [f'2024-01-{i % 28 + 1:02d}' for i in range(3000)],
+        })
+        with sqlite3.connect(self.db_file) as conn:
+            self.df.to_sql('sales', conn, index=False)
+        conn.close()
+        self.source = SqliteLoader(self.db_file).create_query_source()
+
+    def teardown_method(self) -> None:
+        """Clean up test file"""
+        self.source.close()
+        if Path(self.db_file).exists():
+            Path(self.db_file).unlink()
+
+    def _check(self, filters: list[dict], expected: pd.DataFrame) -> None:
+        self.source.set_filters(filters)
+        assert self.source.row_count == len(expected)
+        result = self.source.read_rows(0, self.source.row_count)
+        assert result['id'].tolist() == expected['id'].tolist()
+
+    def test_source_opens_first_table(self) -> None:
+        """Test columns and row count come from the database"""
+        assert self.source.table_name == 'sales'
+        assert self.source.columns == ['id', 'city', 'amount', 'day']
+        assert self.source.row_count == 3000
+
+    def test_filters_match_filter_service(self) -> None:
+        """Test text searches keep pandas semantics, including non-ASCII case folding"""
+        service = FilterService()
+        self._check([{'column': 'city', 'term': 'MADR'}], service.apply_filter(self.df, 'city', 'MADR'))
+        self._check([{'column': 'city', 'term': '100%'}], service.apply_filter(self.df, 'city', '100%'))
+        expected = service.apply_filter(self.df, 'city', 'bogotá')
+        assert len(expected) == 750
+        self._check([{'column': 'city', 'term': 'bogotá'}], expected)
+        self._check([{'column': 'city', 'term': 'bogotá', 'case_sensitive': True}],
+                    service.apply_filter(self.df, 'city', 'bogotá', case_sensitive=True))
+        self._check([{'column': 'amount', 'term': '.5'}], service.apply_filter(self.df, 'amount', '.5'))
+        self._check([{'column': 'city', 'term': '^Li', 'regex': True}],
+                    service.apply_regex_filter(self.df, 'city', '^Li'))
+
+    def test_numeric_filters_match_filter_service(self) -> None:
+        """Test every numeric operator keeps pandas semantics, NaN included"""
+        service = FilterService()
+        for operator in ('>', '<', '>=', '<=', '==', '!='):
+            self._check([{'column': 'amount', 'operator': operator, 'value': 3}],
+                        service.apply_numeric_filter(self.df, 'amount', operator, 3))
+
+    def test_date_filters_match_filter_service(self) -> None:
+        """Test date ranges, open on either end, keep pandas semantics"""
+        service = FilterService()
+        self._check([{'column': 'day', 'start_date': '2024-01-10', 'end_date': '2024-01-12'}],
+                    service.apply_date_filter(self.df, 'day', '2024-01-10', '2024-01-12'))
+        self._check([{'column': 'day', 'start_date': '2024-01-25', 'end_date': None}],
+                    service.apply_date_filter(self.df, 'day', '2024-01-25'))
+        self._check([{'column': 'day', 'start_date': None, 'end_date': '2024-01-03'}],
+                    service.apply_date_filter(self.df, 'day', end_date='2024-01-03'))
+
+    def test_value_filters_match_filter_service(self) -> None:
+        """Test value lists keep pandas isin semantics for missing values"""
+        service = FilterService()
+        for values in (['Lima'], ['Lima', None], []):
+            for exclude in (False, True):
+                self._check([{'column': 'city', 'values': values, 'exclude': exclude}],
+                            service.apply_value_filter(self.df, 'city', values, exclude=exclude))
+
+    def test_filter_service_pushes_filters_to_sqlite(self) -> None:
+        """Test FilterService adds numeric and date filters to the model query"""
+        model = SqliteQueryModel(self.source, chunk_size=500)
+        service = FilterService()
+        expected = self.df[self.df['amount'] < 300]
+        assert service.apply_numeric_query_filter(model, 'amount', '<', 300) == len(expected)
+        expected = service.apply_date_filter(expected, 'day', '2024-01-05', '2024-01-06')
+        assert service.apply_date_query_filter(model, 'day', '2024-01-05', '2024-01-06') == len(expected)
+        assert model.rowCount() == len(expected)
+        assert model.data(model.index(0, 0)) == str(expected['id'].iloc[0])
+        assert service.get_filter_info()['filtered_rows'] == len(expected)
+
+        service.clear_query_filters(model)
+        assert model.rowCount() == 3000
+        assert service.get_filter_info() is None
+
+    def test_sort_puts_nulls_last(self) -> None:
+        """Test ORDER BY matches pandas sort_values"""
+        self.source.set_sort('amount', ascending=False)
+        expected = self.df.sort_values('amount', ascending=False, kind='stable')
+        result = self.source.read_rows(0, 3000)['amount']
+        assert result.isna().tolist() == expected['amount'].isna().tolist()
+        assert result.dropna().tolist() == expected['amount'].dropna().tolist()
+        assert self.source.read_rows(0, 5)['id'].tolist() == expected['id'].tolist()[:5]
+
+    def test_sequential_pages_use_keyset(self) -> None:
+        """Test consecutive pages continue from the last rowid and stay consistent"""
+        self.source.set_filters([{'column': 'city', 'term': 'Lima'}])
+        first = self.source.read_rows(0, 100)
+        assert 100 in self.source._keyset
+        second = self.source.read_rows(100, 200)
+        expected = self.df[self.df['city'] == 'Lima']['id'].tolist()
+        assert first['id'].tolist() + second['id'].tolist() == expected[:200]
+        assert list(second.index) == list(range(100, 200))
+
+    def test_model_sorts_and_filters_in_sqlite(self) -> None:
+        """Test the model pushes header sorting and filters to the source"""
+        model = SqliteQueryModel(self.source, chunk_size=500)
+        assert model.rowCount() == 3000
+        model.sort(0, Qt.DescendingOrder)
+        assert model.data(model.index(0, 0)) == '2999'
+
+        model.apply_filters([{'column': 'city', 'term': 'lima'}])
+        assert model.rowCount() == 750
+        assert model.data(model.index(0, 0)) == '2997'